@@ -0,0 +1,168 @@
+-- Query plans of the hot incident, monitor and group queries at 1M
+-- incidents, with and without the hot query indexes (d9b2f4a6c8e0).
+--
+-- Needs a database migrated to head. Everything runs in one transaction
+-- that is rolled back, so nothing is left behind:
+--
+--   make db-benchmark
+
+\set ON_ERROR_STOP on
+\pset pager off
+
+BEGIN;
+
+SET LOCAL plan_cache_mode = force_custom_plan;
+
+INSERT INTO groups (id, name, is_deleted, created_at, updated_at)
+SELECT
+    gen_random_uuid(),
+    'benchmark group ' || g,
+    g % 10 = 0,
+    now() - g * interval '1 day',
+    now()
+FROM generate_series(1, 50) AS g;
+
+WITH g AS (
+    SELECT array_agg(id) AS ids
+    FROM groups
+    WHERE name LIKE 'benchmark group %'
+)
+INSERT INTO monitors (
+    id, name, group_id, type, endpoint, is_deleted, created_at, updated_at
+)
+SELECT
+    gen_random_uuid(),
+    'benchmark monitor ' || m,
+    CASE WHEN m % 4 = 0 THEN NULL ELSE g.ids[1 + m % 50] END,
+    'HTTP',
+    'https://example.com',
+    m % 10 = 0,
+    now() - m * interval '1 hour',
+    now()
+FROM generate_series(1, 500) AS m, g;
+
+-- Resolved incidents are partitioned by month, see e5c1a7d3f9b2
+DO $$
+DECLARE
+    month_start date;
+BEGIN
+    FOR month_start IN
+        SELECT generate_series(
+            date_trunc('month', now() AT TIME ZONE 'UTC')
+            - interval '12 months',
+            date_trunc('month', now() AT TIME ZONE 'UTC'),
+            interval '1 month'
+        )::date
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF incidents_resolved '
+            '(PRIMARY KEY (id)) FOR VALUES FROM (%L) TO (%L)',
+            'incidents_resolved_' || to_char(month_start, 'YYYY_MM'),
+            month_start::text || ' 00:00:00+00',
+            (month_start + interval '1 month')::date::text || ' 00:00:00+00'
+        );
+    END LOOP;
+END
+$$;
+
+-- One incident every 30 seconds over the last ~347 days
+WITH m AS (
+    SELECT array_agg(id) AS ids
+    FROM monitors
+    WHERE name LIKE 'benchmark monitor %'
+)
+INSERT INTO incidents (
+    id, monitor_id, type, status, message, created_at, ended_at
+)
+SELECT
+    gen_random_uuid(),
+    m.ids[1 + i % 500],
+    (
+        ARRAY['DEGRADED', 'PARTIAL_OUTAGE', 'MAJOR_OUTAGE']::incidenttype[]
+    )[1 + i % 3],
+    'RESOLVED',
+    'benchmark',
+    now() - (1000000 - i) * interval '30 seconds' - interval '1 minute',
+    now() - (1000000 - i) * interval '30 seconds' - interval '30 seconds'
+FROM generate_series(1, 1000000) AS i, m;
+
+INSERT INTO incidents (id, monitor_id, type, status, message, created_at)
+SELECT gen_random_uuid(), id, 'DEGRADED', 'OPEN', 'benchmark', now()
+FROM monitors
+WHERE name LIKE 'benchmark monitor %' AND is_deleted = false
+ORDER BY created_at DESC
+LIMIT 100;
+
+ANALYZE groups, monitors, incidents;
+
+SELECT monitor_id
+FROM incidents
+WHERE status = 'OPEN' AND message = 'benchmark'
+LIMIT 1 \gset
+
+-- IncidentRepository.find_open
+PREPARE find_open(uuid) AS
+SELECT * FROM incidents
+WHERE monitor_id = $1 AND status = 'OPEN'
+FOR UPDATE;
+
+-- IncidentRepository.find_all(last_days=30)
+PREPARE find_last_days AS
+SELECT * FROM incidents
+WHERE created_at > now() - interval '30 days'
+ORDER BY created_at DESC;
+
+-- IncidentRepository.find_by_day
+PREPARE find_by_day(uuid) AS
+SELECT * FROM incidents
+WHERE monitor_id = $1
+  AND created_at < date_trunc('day', now())
+  AND (
+      ended_at IS NULL
+      OR ended_at >= date_trunc('day', now()) - interval '1 day'
+  )
+ORDER BY created_at DESC;
+
+-- Open incidents of StatusReadRepository.find_components
+PREPARE find_open_all AS
+SELECT monitor_id, count(*) FROM incidents
+WHERE status = 'OPEN'
+GROUP BY monitor_id;
+
+-- MonitorRepository.find_all
+PREPARE find_monitors AS
+SELECT * FROM monitors
+WHERE is_deleted = false
+ORDER BY created_at DESC;
+
+-- MonitorGroupRepository.find_all
+PREPARE find_groups AS
+SELECT * FROM groups
+WHERE is_deleted = false
+ORDER BY created_at DESC;
+
+\echo '==================== with indexes ===================='
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_open(:'monitor_id');
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_last_days;
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_by_day(:'monitor_id');
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_open_all;
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_monitors;
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_groups;
+
+DROP INDEX
+    ux_incidents_monitor_id_open,
+    ix_incidents_monitor_id_created_at,
+    ix_incidents_created_at,
+    ix_monitors_created_at_active,
+    ix_monitors_group_id_active,
+    ix_groups_created_at_active;
+
+\echo '=================== without indexes =================='
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_open(:'monitor_id');
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_last_days;
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_by_day(:'monitor_id');
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_open_all;
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_monitors;
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF) EXECUTE find_groups;
+
+ROLLBACK;
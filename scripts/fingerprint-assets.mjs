@@ -0,0 +1,86 @@
+import { createHash } from "node:crypto";
+import { mkdir, readdir, readFile, rm, writeFile } from "node:fs/promises";
+import path from "node:path";
+import { brotliCompressSync, constants, gzipSync } from "node:zlib";
+
+const STATIC_DIR = "src/app/frontend/static";
+const DIST = "dist";
+const COMPRESSIBLE = new Set([
+  ".css",
+  ".ico",
+  ".js",
+  ".json",
+  ".svg",
+  ".ttf",
+  ".webmanifest",
+]);
+
+// Stylesheets refer to other assets, so they are hashed after them
+const byStylesheetsLast = (a, b) =>
+  (a.endsWith(".css") ? 1 : 0) - (b.endsWith(".css") ? 1 : 0);
+
+const distDir = path.join(STATIC_DIR, DIST);
+await rm(distDir, { recursive: true, force: true });
+await mkdir(distDir);
+
+const entries = await readdir(STATIC_DIR, {
+  recursive: true,
+  withFileTypes: true,
+});
+const files = entries
+  .filter((entry) => entry.isFile())
+  .map((entry) =>
+    path.relative(STATIC_DIR, path.join(entry.parentPath, entry.name)),
+  )
+  .filter((file) => !file.startsWith(DIST + path.sep))
+  .sort(byStylesheetsLast);
+
+const manifest = {};
+
+for (const file of files) {
+  let content = await readFile(path.join(STATIC_DIR, file));
+
+  if (file.endsWith(".css")) {
+    content = Buffer.from(
+      content
+        .toString()
+        .replace(
+          /\/static\/([^"')]+)/g,
+          (url, asset) => `/static/${manifest[asset] ?? asset}`,
+        ),
+    );
+  }
+
+  const hash = createHash("sha256").update(content).digest("hex").slice(0, 8);
+  const { dir, name, ext } = path.parse(file);
+  const hashed = path.posix.join(DIST, dir, `${name}.${hash}${ext}`);
+  const output = path.join(STATIC_DIR, hashed);
+
+  await mkdir(path.dirname(output), { recursive: true });
+  await writeFile(output, content);
+
+  if (COMPRESSIBLE.has(ext)) {
+    const variants = {
+      ".br": brotliCompressSync(content, {
+        params: { [constants.BROTLI_PARAM_QUALITY]: 11 },
+      }),
+      ".gz": gzipSync(content, { level: 9 }),
+    };
+
+    for (const [suffix, compressed] of Object.entries(variants)) {
+      if (compressed.length < content.length) {
+        await writeFile(output + suffix, compressed);
+      }
+    }
+  }
+
+  manifest[file.split(path.sep).join("/")] = hashed;
+}
+
+await writeFile(
+  path.join(distDir, "manifest.json"),
+  JSON.stringify(manifest, null, 2),
+);
+
+console.log(`Fingerprinted ${files.length} assets`);
+process.exit(0);
@@ -0,0 +1,34 @@
+import { spawnSync } from "node:child_process";
+import { mkdtemp, readdir, rm } from "node:fs/promises";
+import { tmpdir } from "node:os";
+import path from "node:path";
+
+import esbuild from "esbuild";
+
+const TESTS_DIR = "src/app/frontend/assets/tests";
+
+const tests = (await readdir(TESTS_DIR)).filter((file) =>
+  file.endsWith(".test.mjs"),
+);
+const outdir = await mkdtemp(path.join(tmpdir(), "tests-"));
+
+try {
+  await esbuild.build({
+    entryPoints: tests.map((file) => path.join(TESTS_DIR, file)),
+    bundle: true,
+    format: "esm",
+    platform: "node",
+    outdir,
+    outExtension: { ".js": ".mjs" },
+    logLevel: "error",
+  });
+
+  const { status } = spawnSync(
+    process.execPath,
+    ["--test", ...tests.map((file) => path.join(outdir, file))],
+    { stdio: "inherit" },
+  );
+  process.exitCode = status ?? 1;
+} finally {
+  await rm(outdir, { recursive: true, force: true });
+}
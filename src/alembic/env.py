@@ -19,8 +19,10 @@ target_metadata = Base.metadata
 
 alembic_config.set_main_option(
     "sqlalchemy.url",
-    config.db.url.replace("asyncpg", "psycopg2"),
+    config.db.url.replace("+asyncpg", "+psycopg2").replace("+aiosqlite", ""),
 )
+# SQLite cannot alter columns in place, batch operations recreate the table
+render_as_batch = config.db.is_sqlite
 
 
 def run_migrations_offline() -> None:
@@ -41,6 +43,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        render_as_batch=render_as_batch,
     )
 
     with context.begin_transaction():
@@ -64,6 +67,7 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
+            render_as_batch=render_as_batch,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,43 @@
+"""rate limits.
+
+Revision ID: a6d2e8c4f1b7
+Revises: f3a8b6d2c4e1
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6d2e8c4f1b7"
+down_revision: str | Sequence[str] | None = "f3a8b6d2c4e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Buckets of the shared rate limiter, see DatabaseRateLimitBackend. They
+# are refilled by time alone, so nothing is lost skipping the WAL.
+CREATE_RATE_LIMITS = """
+CREATE UNLOGGED TABLE rate_limits (
+    key VARCHAR PRIMARY KEY,
+    full_at DOUBLE PRECISION NOT NULL
+)
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite keeps rate limits in memory, see Container.rate_limit_backend
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    op.execute(CREATE_RATE_LIMITS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    op.execute("DROP TABLE rate_limits")
@@ -0,0 +1,92 @@
+"""monitor daily status.
+
+Revision ID: b4e1c2d9a7f3
+Revises: 73f399408d97
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4e1c2d9a7f3"
+down_revision: str | Sequence[str] | None = "73f399408d97"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Resolved incidents contribute downtime to every UTC day they span.
+# Open incidents only count towards the day they started on, their live
+# downtime is added when the status is read.
+BACKFILL = """
+INSERT INTO monitor_daily_status (
+    monitor_id, day, worst_type, downtime_seconds, incident_count
+)
+SELECT
+    s.monitor_id,
+    d.day::date,
+    max(s.type),
+    coalesce(
+        sum(
+            extract(
+                epoch FROM least(s.ended, d.day + interval '1 day')
+                - greatest(s.started, d.day)
+            )
+        ) FILTER (WHERE s.ended IS NOT NULL),
+        0
+    )::integer,
+    count(*)
+FROM (
+    SELECT
+        monitor_id,
+        type,
+        created_at AT TIME ZONE 'UTC' AS started,
+        ended_at AT TIME ZONE 'UTC' AS ended
+    FROM incidents
+) AS s
+CROSS JOIN LATERAL generate_series(
+    date_trunc('day', s.started),
+    date_trunc('day', coalesce(s.ended, s.started)),
+    interval '1 day'
+) AS d(day)
+GROUP BY s.monitor_id, d.day
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "monitor_daily_status",
+        sa.Column("monitor_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column(
+            "worst_type",
+            postgresql.ENUM(
+                "DEGRADED",
+                "PARTIAL_OUTAGE",
+                "MAJOR_OUTAGE",
+                name="incidenttype",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("downtime_seconds", sa.Integer(), nullable=False),
+        sa.Column("incident_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["monitor_id"],
+            ["monitors.id"],
+        ),
+        sa.PrimaryKeyConstraint("monitor_id", "day"),
+    )
+    # A new SQLite database has no incidents to backfill
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("monitor_daily_status")
@@ -0,0 +1,59 @@
+"""status notify.
+
+Revision ID: b8f4d2a6e0c3
+Revises: a6d2e8c4f1b7
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8f4d2a6e0c3"
+down_revision: str | Sequence[str] | None = "a6d2e8c4f1b7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Writes to the public status also tell every instance about it once
+# committed, see StatusChangeListener. The payload is the instance that
+# wrote, which already knows. Notifications with the same payload are
+# folded into one per transaction.
+STAMP_REVISION = """
+CREATE OR REPLACE FUNCTION stamp_status_revision() RETURNS trigger AS $$
+BEGIN
+    NEW.revision := pg_current_xact_id()::text::bigint;
+    PERFORM pg_notify(
+        'status_changed',
+        coalesce(current_setting('status_page.instance', true), '')
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+STAMP_REVISION_WITHOUT_NOTIFY = """
+CREATE OR REPLACE FUNCTION stamp_status_revision() RETURNS trigger AS $$
+BEGIN
+    NEW.revision := pg_current_xact_id()::text::bigint;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite runs a single instance, it has nobody to notify
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    op.execute(STAMP_REVISION)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    op.execute(STAMP_REVISION_WITHOUT_NOTIFY)
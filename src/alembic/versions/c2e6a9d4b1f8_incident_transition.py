@@ -0,0 +1,154 @@
+"""incident transition.
+
+Revision ID: c2e6a9d4b1f8
+Revises: b8f4d2a6e0c3
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c2e6a9d4b1f8"
+down_revision: str | Sequence[str] | None = "b8f4d2a6e0c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Opens an incident of a monitor, resolving a different open one, and adds
+# both to the daily status, see IncidentRepository.transition. Statements
+# of a function run in order and each one sees the previous ones, unlike
+# the sub-statements of a WITH. The incidenttype enum is declared least to
+# most severe, so it orders by severity.
+CREATE_TRANSITION = """
+CREATE FUNCTION transition_incident(
+    incident_id uuid,
+    target_monitor_id uuid,
+    incident_type incidenttype,
+    incident_message varchar,
+    changed_at timestamptz
+) RETURNS SETOF incidents AS $$
+DECLARE
+    open_incident incidents;
+    resolved_incident incidents;
+    opened_incident incidents;
+BEGIN
+    SELECT * INTO open_incident
+    FROM incidents_open
+    WHERE monitor_id = target_monitor_id;
+
+    IF open_incident.id IS NOT NULL THEN
+        IF (open_incident.type, open_incident.message)
+            IS NOT DISTINCT FROM (incident_type, incident_message) THEN
+            RETURN;
+        END IF;
+
+        UPDATE incidents
+        SET status = 'RESOLVED', ended_at = changed_at
+        WHERE id = open_incident.id
+        AND status = 'OPEN'
+        RETURNING * INTO resolved_incident;
+
+        -- A concurrent writer resolved it first
+        IF resolved_incident.id IS NULL THEN
+            RETURN;
+        END IF;
+
+        RETURN NEXT resolved_incident;
+    END IF;
+
+    -- Nothing is opened when a concurrent writer opened one first
+    INSERT INTO incidents_open (
+        id, monitor_id, type, status, message, created_at
+    )
+    VALUES (
+        incident_id, target_monitor_id, incident_type, 'OPEN',
+        incident_message, changed_at
+    )
+    ON CONFLICT (monitor_id) DO NOTHING
+    RETURNING * INTO opened_incident;
+
+    IF opened_incident.id IS NOT NULL THEN
+        RETURN NEXT opened_incident;
+    END IF;
+
+    -- The same rollups as rollup.resolved and rollup.opened, in UTC days
+    INSERT INTO monitor_daily_status AS stored (
+        monitor_id, day, worst_type, downtime_seconds, incident_count
+    )
+    SELECT
+        target_monitor_id, day, max(worst_type),
+        sum(downtime_seconds), sum(incident_count)
+    FROM (
+        SELECT
+            spanned.day::date AS day,
+            resolved_incident.type AS worst_type,
+            greatest(
+                floor(
+                    extract(
+                        epoch FROM least(
+                            resolved_incident.ended_at AT TIME ZONE 'UTC',
+                            spanned.day + interval '1 day'
+                        ) - greatest(
+                            resolved_incident.created_at AT TIME ZONE 'UTC',
+                            spanned.day
+                        )
+                    )
+                ),
+                0
+            )::integer AS downtime_seconds,
+            CASE
+                WHEN spanned.day = date_trunc(
+                    'day',
+                    resolved_incident.created_at AT TIME ZONE 'UTC'
+                ) THEN 0
+                ELSE 1
+            END AS incident_count
+        FROM generate_series(
+            date_trunc(
+                'day',
+                resolved_incident.created_at AT TIME ZONE 'UTC'
+            ),
+            date_trunc('day', resolved_incident.ended_at AT TIME ZONE 'UTC'),
+            interval '1 day'
+        ) AS spanned(day)
+        WHERE resolved_incident.id IS NOT NULL
+        UNION ALL
+        SELECT
+            (opened_incident.created_at AT TIME ZONE 'UTC')::date,
+            opened_incident.type,
+            0,
+            1
+        WHERE opened_incident.id IS NOT NULL
+    ) AS rollups
+    GROUP BY day
+    ON CONFLICT (monitor_id, day) DO UPDATE
+    SET
+        worst_type = greatest(stored.worst_type, excluded.worst_type),
+        downtime_seconds =
+            stored.downtime_seconds + excluded.downtime_seconds,
+        incident_count = stored.incident_count + excluded.incident_count;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite has no functions, the repository runs the steps itself
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    op.execute(CREATE_TRANSITION)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    op.execute(
+        "DROP FUNCTION transition_incident"
+        "(uuid, uuid, incidenttype, varchar, timestamptz)",
+    )
@@ -0,0 +1,129 @@
+"""status revisions.
+
+Revision ID: c7a3e5f1b2d4
+Revises: b4e1c2d9a7f3
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7a3e5f1b2d4"
+down_revision: str | Sequence[str] | None = "b4e1c2d9a7f3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("groups", "monitors", "incidents", "monitor_daily_status")
+
+# Every write is stamped with the ID of its transaction, which takes no
+# lock. IDs are not assigned in commit order, so readers use the xmin of
+# their snapshot as the cursor: every transaction below it has finished,
+# and a delta from the cursor reads revisions at or above it again.
+STAMP_REVISION = """
+CREATE FUNCTION stamp_status_revision() RETURNS trigger AS $$
+BEGIN
+    NEW.revision := pg_current_xact_id()::text::bigint;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# SQLite has neither sequences nor BEFORE triggers that can assign NEW,
+# a single row counter is bumped after each write instead. Writers are
+# serialized by the database lock, so revisions are ordered as well.
+SQLITE_STAMP_REVISION = """
+CREATE TRIGGER {table}_revision_{name} AFTER {event} ON {table}
+BEGIN
+    UPDATE status_revision SET value = value + 1;
+    UPDATE {table} SET revision = (SELECT value FROM status_revision)
+    WHERE rowid = NEW.rowid;
+END
+"""
+SQLITE_EVENTS = ("INSERT", "UPDATE")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        _upgrade_sqlite()
+        return
+
+    op.execute(STAMP_REVISION)
+
+    for table in TABLES:
+        # A constant default is only stored in the catalog, so existing
+        # rows are neither rewritten nor backfilled. They predate every
+        # cursor and only ever reach clients through a full snapshot.
+        op.add_column(
+            table,
+            sa.Column(
+                "revision",
+                sa.BigInteger(),
+                server_default=sa.text("0"),
+                nullable=False,
+            ),
+        )
+        op.create_index(f"ix_{table}_revision", table, ["revision"])
+        op.execute(
+            f"CREATE TRIGGER {table}_revision "
+            f"BEFORE INSERT OR UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION stamp_status_revision()",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        _downgrade_sqlite()
+        return
+
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER {table}_revision ON {table}")
+        op.drop_index(f"ix_{table}_revision", table_name=table)
+        op.drop_column(table, "revision")
+
+    op.execute("DROP FUNCTION stamp_status_revision()")
+
+
+def _upgrade_sqlite() -> None:
+    """Upgrade schema on SQLite."""
+    op.execute("CREATE TABLE status_revision (value BIGINT NOT NULL)")
+    op.execute("INSERT INTO status_revision (value) VALUES (0)")
+
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "revision",
+                sa.BigInteger(),
+                server_default=sa.text("0"),
+                nullable=False,
+            ),
+        )
+        op.create_index(f"ix_{table}_revision", table, ["revision"])
+
+        for event in SQLITE_EVENTS:
+            op.execute(
+                SQLITE_STAMP_REVISION.format(
+                    table=table,
+                    event=event,
+                    name=event.lower(),
+                ),
+            )
+
+
+def _downgrade_sqlite() -> None:
+    """Downgrade schema on SQLite."""
+    for table in TABLES:
+        for event in SQLITE_EVENTS:
+            op.execute(f"DROP TRIGGER {table}_revision_{event.lower()}")
+
+        op.drop_index(f"ix_{table}_revision", table_name=table)
+        op.drop_column(table, "revision")
+
+    op.execute("DROP TABLE status_revision")
@@ -0,0 +1,92 @@
+"""hot query indexes.
+
+Revision ID: d9b2f4a6c8e0
+Revises: c7a3e5f1b2d4
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d9b2f4a6c8e0"
+down_revision: str | Sequence[str] | None = "c7a3e5f1b2d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# A monitor can only have one open incident. Older duplicates left by
+# racing workers are closed when the newest one opened, so the unique
+# index below can be built.
+RESOLVE_DUPLICATE_OPEN = """
+UPDATE incidents AS i
+SET status = 'RESOLVED', ended_at = newest.created_at
+FROM (
+    SELECT DISTINCT ON (monitor_id) id, monitor_id, created_at
+    FROM incidents
+    WHERE status = 'OPEN'
+    ORDER BY monitor_id, created_at DESC, id DESC
+) AS newest
+WHERE i.monitor_id = newest.monitor_id
+  AND i.status = 'OPEN'
+  AND i.id <> newest.id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # DISTINCT ON is Postgres only, a new SQLite database has no duplicates
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(RESOLVE_DUPLICATE_OPEN)
+
+    op.create_index(
+        "ux_incidents_monitor_id_open",
+        "incidents",
+        ["monitor_id"],
+        unique=True,
+        postgresql_where=sa.text("status = 'OPEN'"),
+        sqlite_where=sa.text("status = 'OPEN'"),
+    )
+    op.create_index(
+        "ix_incidents_monitor_id_created_at",
+        "incidents",
+        ["monitor_id", "created_at"],
+    )
+    op.create_index("ix_incidents_created_at", "incidents", ["created_at"])
+    op.create_index(
+        "ix_monitors_created_at_active",
+        "monitors",
+        ["created_at"],
+        postgresql_where=sa.text("is_deleted = false"),
+        sqlite_where=sa.text("is_deleted = false"),
+    )
+    op.create_index(
+        "ix_monitors_group_id_active",
+        "monitors",
+        ["group_id"],
+        postgresql_where=sa.text("is_deleted = false"),
+        sqlite_where=sa.text("is_deleted = false"),
+    )
+    op.create_index(
+        "ix_groups_created_at_active",
+        "groups",
+        ["created_at"],
+        postgresql_where=sa.text("is_deleted = false"),
+        sqlite_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_groups_created_at_active", table_name="groups")
+    op.drop_index("ix_monitors_group_id_active", table_name="monitors")
+    op.drop_index("ix_monitors_created_at_active", table_name="monitors")
+    op.drop_index("ix_incidents_created_at", table_name="incidents")
+    op.drop_index(
+        "ix_incidents_monitor_id_created_at",
+        table_name="incidents",
+    )
+    op.drop_index("ux_incidents_monitor_id_open", table_name="incidents")
@@ -0,0 +1,182 @@
+"""partition incidents.
+
+Revision ID: e5c1a7d3f9b2
+Revises: d9b2f4a6c8e0
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5c1a7d3f9b2"
+down_revision: str | Sequence[str] | None = "d9b2f4a6c8e0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COLUMNS = (
+    "id, monitor_id, type, status, message, created_at, ended_at, revision"
+)
+
+# Open incidents live in their own small partition, so the status read
+# and the one-open-incident-per-monitor index never touch history.
+# Resolved incidents are partitioned by the month they ended in, which
+# lets retention drop whole months without losing anything still open.
+# Months without a partition yet land in the default one, maintenance
+# moves them out, see IncidentPartitionRepository.
+CREATE_PARTITIONED = """
+CREATE TABLE incidents (
+    id UUID NOT NULL,
+    monitor_id UUID NOT NULL REFERENCES monitors (id),
+    type incidenttype NOT NULL,
+    status incidentstatus NOT NULL,
+    message VARCHAR NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    ended_at TIMESTAMP WITH TIME ZONE,
+    revision BIGINT NOT NULL DEFAULT 0
+) PARTITION BY LIST (status);
+
+CREATE TABLE incidents_open PARTITION OF incidents (PRIMARY KEY (id))
+FOR VALUES IN ('OPEN');
+
+CREATE TABLE incidents_resolved PARTITION OF incidents
+FOR VALUES IN ('RESOLVED')
+PARTITION BY RANGE (ended_at);
+
+CREATE TABLE incidents_resolved_default PARTITION OF incidents_resolved
+(PRIMARY KEY (id)) DEFAULT;
+"""
+
+# Monthly partitions from the oldest resolved incident up to next month
+CREATE_MONTHS = """
+DO $$
+DECLARE
+    month_start date;
+BEGIN
+    FOR month_start IN
+        SELECT generate_series(
+            date_trunc(
+                'month',
+                coalesce(min(coalesce(ended_at, created_at)), now())
+                AT TIME ZONE 'UTC'
+            ),
+            date_trunc('month', now() AT TIME ZONE 'UTC')
+            + interval '1 month',
+            interval '1 month'
+        )::date
+        FROM incidents_unpartitioned
+        WHERE status = 'RESOLVED'
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF incidents_resolved '
+            '(PRIMARY KEY (id)) FOR VALUES FROM (%L) TO (%L)',
+            'incidents_resolved_' || to_char(month_start, 'YYYY_MM'),
+            month_start::text || ' 00:00:00+00',
+            (month_start + interval '1 month')::date::text || ' 00:00:00+00'
+        );
+    END LOOP;
+END
+$$
+"""
+
+INDEXES = (
+    ("ix_incidents_revision", "incidents", "revision"),
+    ("ix_incidents_created_at", "incidents", "created_at"),
+    (
+        "ix_incidents_monitor_id_created_at",
+        "incidents",
+        "monitor_id, created_at",
+    ),
+)
+
+
+def _move_indexes_away() -> None:
+    """Drop indexes of the old table, their names are reused."""
+    op.execute("DROP TRIGGER incidents_revision ON incidents_unpartitioned")
+
+    for name, _, _ in INDEXES:
+        op.execute(f"DROP INDEX {name}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite keeps incidents in one table, see IncidentModel
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    op.execute("ALTER TABLE incidents RENAME TO incidents_unpartitioned")
+    op.execute(
+        "ALTER TABLE incidents_unpartitioned "
+        "RENAME CONSTRAINT incidents_pkey TO incidents_unpartitioned_pkey",
+    )
+    op.execute("DROP INDEX ux_incidents_monitor_id_open")
+    _move_indexes_away()
+
+    op.execute(CREATE_PARTITIONED)
+    op.execute(CREATE_MONTHS)
+    # COLUMNS is a constant of this migration
+    op.execute(
+        f"INSERT INTO incidents ({COLUMNS}) "  # noqa: S608 # nosec B608
+        "SELECT id, monitor_id, type, status, message, created_at, "
+        "CASE WHEN status = 'RESOLVED' "
+        "THEN coalesce(ended_at, created_at) ELSE ended_at END, "
+        "revision FROM incidents_unpartitioned",
+    )
+    op.execute("DROP TABLE incidents_unpartitioned")
+
+    op.execute(
+        "CREATE UNIQUE INDEX ux_incidents_monitor_id_open "
+        "ON incidents_open (monitor_id)",
+    )
+    for name, table, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+
+    op.execute(
+        "CREATE TRIGGER incidents_revision "
+        "BEFORE INSERT OR UPDATE ON incidents "
+        "FOR EACH ROW EXECUTE FUNCTION stamp_status_revision()",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # SQLite keeps incidents in one table, see IncidentModel
+    if op.get_bind().dialect.name == "sqlite":
+        return
+
+    op.execute("ALTER TABLE incidents RENAME TO incidents_unpartitioned")
+    op.execute("DROP INDEX ux_incidents_monitor_id_open")
+    _move_indexes_away()
+
+    op.execute(
+        "CREATE TABLE incidents ("
+        "id UUID PRIMARY KEY, "
+        "monitor_id UUID NOT NULL REFERENCES monitors (id), "
+        "type incidenttype NOT NULL, "
+        "status incidentstatus NOT NULL, "
+        "message VARCHAR NOT NULL, "
+        "created_at TIMESTAMP WITH TIME ZONE NOT NULL, "
+        "ended_at TIMESTAMP WITH TIME ZONE, "
+        "revision BIGINT NOT NULL DEFAULT 0)",
+    )
+    # COLUMNS is a constant of this migration
+    op.execute(
+        f"INSERT INTO incidents ({COLUMNS}) "  # noqa: S608 # nosec B608
+        f"SELECT {COLUMNS} FROM incidents_unpartitioned",
+    )
+    op.execute("DROP TABLE incidents_unpartitioned CASCADE")
+
+    op.execute(
+        "CREATE UNIQUE INDEX ux_incidents_monitor_id_open "
+        "ON incidents (monitor_id) WHERE status = 'OPEN'",
+    )
+    for name, table, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+
+    op.execute(
+        "CREATE TRIGGER incidents_revision "
+        "BEFORE INSERT OR UPDATE ON incidents "
+        "FOR EACH ROW EXECUTE FUNCTION stamp_status_revision()",
+    )
@@ -1,5 +1,7 @@
 """Main entry point for the application."""
 
+import argparse
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -8,18 +10,20 @@ from typing import Any
 
 import uvicorn
 from fastapi import FastAPI, status
-from fastapi.staticfiles import StaticFiles
-from slowapi.errors import RateLimitExceeded
 
 from app import api, frontend, shared
 from app.api import docs
 from app.container import Container
+from app.services.ratelimit.limiter import RateLimitExceeded
 from app.shared import config
 from app.shared.exc_handlers import (
     not_found_handler,
     rate_limit_exception_handler,
 )
 from app.shared.log_filters import HealthCheckFilter
+from app.shared.middlewares import CompressionMiddleware
+from app.shared.staticfiles import PrecompressedStaticFiles
+from app.shared.templating import preload_templates
 
 logging.getLogger("uvicorn.access").addFilter(HealthCheckFilter())
 logging.getLogger("httpx").setLevel(logging.ERROR)
@@ -39,15 +43,31 @@ container.wire(packages=[api, frontend, shared])
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[Any, Any]:
     """Lifespan."""
+    logger.info("Loaded templates=%d", preload_templates(container.jinja()))
+    read_session_factory = container.read_session_factory()
+    incident_partitions = container.incident_partitions()
     worker_scheduler = container.worker_scheduler()
+    status_broadcaster = container.status_broadcaster()
+    status_listener = container.status_listener()
+    status_exporter = container.status_exporter()
+    await read_session_factory.start()
+    await incident_partitions.start()
     await worker_scheduler.initialize()
+    await status_broadcaster.start()
+    await status_listener.start()
+    await status_exporter.start()
 
     try:
         yield
 
     finally:
         logger.info("Shutting down the application")
+        await status_exporter.stop()
+        await status_listener.stop()
+        await status_broadcaster.stop()
         await worker_scheduler.graceful_shutdown()
+        await incident_partitions.stop()
+        await read_session_factory.stop()
 
 
 app = FastAPI(
@@ -60,7 +80,9 @@ app = FastAPI(
 
 app.mount(
     "/static",
-    StaticFiles(directory=Path(__file__).parent / "frontend" / "static"),
+    PrecompressedStaticFiles(
+        directory=Path(__file__).parent / "frontend" / "static",
+    ),
     name="static",
 )
 
@@ -69,15 +91,40 @@ app.add_exception_handler(RateLimitExceeded, rate_limit_exception_handler)
 
 api.middlewares.setup_middlewares(app)
 frontend.middlewares.setup_middlewares(app)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.compression.minimum_size,
+)
 
 app.include_router(api.router)
 app.include_router(api.health.router)
+
+if config.app.metrics:
+    app.include_router(api.metrics.router)
+
 app.include_router(frontend.router)
 
 if config.app.is_development:
     docs.setup_scalar(app)
 
-if __name__ == "__main__":
+
+async def export(output_dir: Path) -> None:
+    """Export the status site once."""
+    read_session_factory = container.read_session_factory()
+    await read_session_factory.start()
+
+    try:
+        await container.status_exporter(output_dir=output_dir).export()
+
+    finally:
+        await read_session_factory.stop()
+
+        for engine in container.db.engines().values():
+            await engine.dispose()
+
+
+def serve() -> None:
+    """Run the application server."""
     logger.debug(
         "Admin path: http://%s:%s/%s",
         config.app.host,
@@ -89,9 +136,49 @@ if __name__ == "__main__":
         app,
         host=config.app.host,
         port=config.app.port,
-        limit_concurrency=1000,
+        # Stream subscribers hold a connection each
+        limit_concurrency=1000 + config.stream.max_subscribers,
         timeout_keep_alive=5,
         timeout_graceful_shutdown=10,
         server_header=not config.app.is_production,
         h11_max_incomplete_event_size=16 * 1024,  # 16KB
     )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m app")
+    commands = parser.add_subparsers(dest="command")
+    export_parser = commands.add_parser(
+        "export",
+        help="export the status site to static files once",
+    )
+    export_parser.add_argument(
+        "output_dir",
+        nargs="?",
+        type=Path,
+        default=config.export.dir,
+        help="output directory, EXPORT_DIR by default",
+    )
+    commands.add_parser(
+        "compile-templates",
+        help="compile the templates into CACHE_TEMPLATES_DIR",
+    )
+    args = parser.parse_args()
+
+    if args.command == "export":
+        if args.output_dir is None:
+            parser.error("an output directory or EXPORT_DIR is required")
+
+        asyncio.run(export(args.output_dir))
+
+    elif args.command == "compile-templates":
+        if config.cache.templates_dir is None:
+            parser.error("CACHE_TEMPLATES_DIR is required")
+
+        logger.info(
+            "Compiled templates=%d",
+            preload_templates(container.jinja()),
+        )
+
+    else:
+        serve()
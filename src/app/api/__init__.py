@@ -2,11 +2,11 @@
 
 from fastapi import APIRouter
 
-from . import health, middlewares
+from . import health, metrics, middlewares
 from .v1 import router as v1_router
 
 router = APIRouter(prefix="/api")
 
 router.include_router(v1_router)
 
-__all__ = ["health", "middlewares", "router"]
+__all__ = ["health", "metrics", "middlewares", "router"]
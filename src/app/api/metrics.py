@@ -0,0 +1,69 @@
+"""Metrics endpoint."""
+
+from collections.abc import Mapping
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.container import Container
+from app.database.pool import PoolStats, pool_stats
+
+router = APIRouter(tags=["Metrics"])
+
+POOL_METRICS = (
+    ("size", "gauge", "Configured pool size"),
+    ("checked_out", "gauge", "Connections in use"),
+    ("overflow", "gauge", "Connections open beyond the pool size"),
+    ("checkouts", "counter", "Connection checkouts"),
+    ("wait_seconds", "counter", "Time spent checking out connections"),
+    ("timeouts", "counter", "Checkouts that timed out"),
+)
+
+
+def _render_pools(stats: Mapping[str, PoolStats]) -> str:
+    """Render pool statistics in the Prometheus text format."""
+    lines = []
+
+    for field, kind, description in POOL_METRICS:
+        name = f"status_page_db_pool_{field}"
+        if kind == "counter":
+            name += "_total"
+
+        lines += [f"# HELP {name} {description}.", f"# TYPE {name} {kind}"]
+        lines += [
+            f'{name}{{pool="{pool}"}} {getattr(pool_stat, field)}'
+            for pool, pool_stat in stats.items()
+        ]
+
+    return "\n".join(lines) + "\n"
+
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False,
+    summary="Metrics endpoint",
+    description="Connection pool metrics in the Prometheus text format",
+    response_class=PlainTextResponse,
+)
+@inject
+async def metrics(
+    request: Request,
+    engines: Annotated[
+        dict[str, AsyncEngine],
+        Depends(Provide[Container.db.engines]),
+    ],
+) -> PlainTextResponse:
+    """Metrics endpoint."""
+    return PlainTextResponse(
+        _render_pools(
+            {
+                workload: pool_stats(engine)
+                for workload, engine in engines.items()
+            },
+        ),
+        media_type="text/plain; version=0.0.4",
+    )
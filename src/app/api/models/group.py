@@ -14,11 +14,17 @@ class MonitorsGroupResponse(BaseModel):
     id: UUID
     name: str
     created_at: datetime
+    version: int
 
     @classmethod
     def from_orm(cls, group: MonitorGroupModel) -> "MonitorsGroupResponse":
         """Create a MonitorsGroupResponse from a MonitorGroupModel."""
-        return cls(id=group.id, name=group.name, created_at=group.created_at)
+        return cls.model_construct(
+            id=group.id,
+            name=group.name,
+            created_at=group.created_at,
+            version=group.version,
+        )
 
 
 class MonitorsGroupRequest(BaseModel):
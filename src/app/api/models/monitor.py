@@ -24,11 +24,12 @@ class MonitorResponse(BaseModel):
     expected_content_pattern: str | None
     latency_threshold_ms: int | None
     error_mapping: dict | None
+    version: int
 
     @classmethod
     def from_orm(cls, monitor: MonitorModel) -> "MonitorResponse":
         """Create a MonitorResponse from a MonitorModel."""
-        return cls(
+        return cls.model_construct(
             id=monitor.id,
             name=monitor.name,
             group_id=monitor.group_id,
@@ -41,6 +42,7 @@ class MonitorResponse(BaseModel):
             expected_content_pattern=monitor.expected_content_pattern,
             latency_threshold_ms=monitor.latency_threshold_ms,
             error_mapping=monitor.error_mapping,
+            version=monitor.version,
         )
 
 
@@ -1,6 +1,7 @@
 """Status API models."""
 
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import date, datetime
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -8,6 +9,14 @@ from pydantic import BaseModel, Field
 from app.database.models.incident import IncidentModel
 from app.database.models.monitor import MonitorModel
 from app.enums import ComponentType, IncidentStatus, IncidentType
+from app.repositories.status import (
+    ChangedGroupRow,
+    ChangedMonitorRow,
+    StatusGroupRow,
+    StatusIncidentRow,
+    StatusMonitorRow,
+)
+from app.services.status.rollup import DailyStatus
 
 
 class IncidentResponse(BaseModel):
@@ -21,9 +30,12 @@ class IncidentResponse(BaseModel):
     ended_at: datetime | None
 
     @classmethod
-    def from_orm(cls, incident: IncidentModel) -> "IncidentResponse":
+    def from_orm(
+        cls,
+        incident: IncidentModel | StatusIncidentRow,
+    ) -> "IncidentResponse":
         """Create a IncidentResponse from a IncidentModel."""
-        return cls(
+        return cls.model_construct(
             id=incident.id,
             message=incident.message,
             type=incident.type,
@@ -33,6 +45,25 @@ class IncidentResponse(BaseModel):
         )
 
 
+class DailyStatusResponse(BaseModel):
+    """Incident totals of a monitor for one UTC day."""
+
+    day: date
+    type: IncidentType
+    downtime_seconds: int
+    incident_count: int
+
+    @classmethod
+    def from_rollup(cls, rollup: DailyStatus) -> "DailyStatusResponse":
+        """Create a DailyStatusResponse from a DailyStatus."""
+        return cls.model_construct(
+            day=rollup.day,
+            type=rollup.worst_type,
+            downtime_seconds=rollup.downtime_seconds,
+            incident_count=rollup.incident_count,
+        )
+
+
 class StatusMonitorResponse(BaseModel):
     """Monitor status response."""
 
@@ -40,22 +71,51 @@ class StatusMonitorResponse(BaseModel):
     id: UUID
     name: str
     incidents: list[IncidentResponse]
+    history: list[DailyStatusResponse]
     created_at: datetime
 
     @classmethod
     def from_orm(
         cls,
         monitor: MonitorModel,
-        incidents: list[IncidentModel],
+        incidents: Sequence[IncidentModel],
+        history: Sequence[DailyStatus] = (),
     ) -> "StatusMonitorResponse":
-        """Create a StatusMonitorResponse from a MonitorModel."""
-        return cls(
+        """Create a StatusMonitorResponse from a MonitorModel.
+
+        Only open incidents are expected, past days come from the history.
+        """
+        return cls.model_construct(
             type=ComponentType.MONITOR,
             id=monitor.id,
             name=monitor.name,
             incidents=[
                 IncidentResponse.from_orm(incident) for incident in incidents
             ],
+            history=[
+                DailyStatusResponse.from_rollup(rollup) for rollup in history
+            ],
+            created_at=monitor.created_at,
+        )
+
+    @classmethod
+    def from_row(
+        cls,
+        monitor: StatusMonitorRow,
+        history: Sequence[DailyStatus],
+    ) -> "StatusMonitorResponse":
+        """Create a StatusMonitorResponse from a StatusMonitorRow."""
+        return cls.model_construct(
+            type=ComponentType.MONITOR,
+            id=monitor.id,
+            name=monitor.name,
+            incidents=[
+                IncidentResponse.from_orm(incident)
+                for incident in monitor.incidents
+            ],
+            history=[
+                DailyStatusResponse.from_rollup(rollup) for rollup in history
+            ],
             created_at=monitor.created_at,
         )
 
@@ -68,9 +128,144 @@ class StatusMonitorGroupResponse(BaseModel):
     name: str
     monitors: list[StatusMonitorResponse]
 
+    @classmethod
+    def from_row(
+        cls,
+        group: StatusGroupRow,
+        monitors: list[StatusMonitorResponse],
+    ) -> "StatusMonitorGroupResponse":
+        """Create a StatusMonitorGroupResponse from a StatusGroupRow."""
+        return cls.model_construct(
+            type=ComponentType.GROUP,
+            id=group.id,
+            name=group.name,
+            monitors=monitors,
+        )
+
 
 class StatusResponse(BaseModel):
     """Overall status response."""
 
     components: list[StatusMonitorResponse | StatusMonitorGroupResponse]
+    cursor: str | None = None
     last_update_at: datetime = Field(default_factory=datetime.now)
+
+
+class GroupChangeResponse(BaseModel):
+    """Changed monitor group."""
+
+    id: UUID
+    name: str
+    created_at: datetime
+    is_deleted: bool
+
+    @classmethod
+    def from_row(cls, group: ChangedGroupRow) -> "GroupChangeResponse":
+        """Create a GroupChangeResponse from a ChangedGroupRow."""
+        return cls.model_construct(
+            id=group.id,
+            name=group.name,
+            created_at=group.created_at,
+            is_deleted=group.is_deleted,
+        )
+
+
+class MonitorChangeResponse(BaseModel):
+    """Changed monitor."""
+
+    id: UUID
+    name: str
+    group_id: UUID | None
+    created_at: datetime
+    is_deleted: bool
+
+    @classmethod
+    def from_row(cls, monitor: ChangedMonitorRow) -> "MonitorChangeResponse":
+        """Create a MonitorChangeResponse from a ChangedMonitorRow."""
+        return cls.model_construct(
+            id=monitor.id,
+            name=monitor.name,
+            group_id=monitor.group_id,
+            created_at=monitor.created_at,
+            is_deleted=monitor.is_deleted,
+        )
+
+
+class IncidentChangeResponse(IncidentResponse):
+    """Changed incident of a monitor."""
+
+    monitor_id: UUID
+
+    @classmethod
+    def from_row(
+        cls,
+        incident: StatusIncidentRow,
+    ) -> "IncidentChangeResponse":
+        """Create a IncidentChangeResponse from a StatusIncidentRow."""
+        return cls.model_construct(
+            id=incident.id,
+            monitor_id=incident.monitor_id,
+            message=incident.message,
+            type=incident.type,
+            status=incident.status,
+            created_at=incident.created_at,
+            ended_at=incident.ended_at,
+        )
+
+
+class DailyStatusChangeResponse(DailyStatusResponse):
+    """Changed daily totals of a monitor."""
+
+    monitor_id: UUID
+
+    @classmethod
+    def from_rollup(cls, rollup: DailyStatus) -> "DailyStatusChangeResponse":
+        """Create a DailyStatusChangeResponse from a DailyStatus."""
+        return cls.model_construct(
+            monitor_id=rollup.monitor_id,
+            day=rollup.day,
+            type=rollup.worst_type,
+            downtime_seconds=rollup.downtime_seconds,
+            incident_count=rollup.incident_count,
+        )
+
+
+class StatusDeltaResponse(BaseModel):
+    """Status changes since a cursor."""
+
+    cursor: str
+    groups: list[GroupChangeResponse]
+    monitors: list[MonitorChangeResponse]
+    incidents: list[IncidentChangeResponse]
+    history: list[DailyStatusChangeResponse]
+    last_update_at: datetime
+
+
+class DayIncidentsResponse(BaseModel):
+    """Incidents of a monitor on one UTC day."""
+
+    day: date
+    incidents: list[IncidentResponse]
+
+
+class IncidentEventResponse(BaseModel):
+    """Incident opened or resolved event."""
+
+    monitor_id: UUID
+    incident: IncidentResponse
+    last_update_at: datetime
+
+
+class MonitorAddedEventResponse(BaseModel):
+    """Monitor added event."""
+
+    group_id: UUID | None
+    monitor: StatusMonitorResponse
+    last_update_at: datetime
+
+
+class MonitorRemovedEventResponse(BaseModel):
+    """Monitor removed event."""
+
+    monitor_id: UUID
+    last_update_at: datetime
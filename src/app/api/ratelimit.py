@@ -1,11 +1,14 @@
-"""Slowapi utilities."""
+"""Rate limit client keys."""
 
 from __future__ import annotations
 
 import ipaddress
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+from app.shared import config
+
 if TYPE_CHECKING:
     from fastapi import Request
 
@@ -26,30 +29,51 @@ def normalize_ip(ip_str: str) -> str | None:
     return addr.compressed
 
 
-def rate_limit_func(request: Request) -> str:
-    """Extract client marker for rate limiting."""
-    headers = request.headers
-    if cf_ip := headers.get("CF-Connecting-IP"):  # noqa: SIM102
+@lru_cache(maxsize=config.rate_limit.client_cache_size)
+def client_key(
+    cf_ip: str | None,
+    xff: str | None,
+    x_real_ip: str | None,
+    client_ip: str | None,
+) -> str | None:
+    """Extract the client IP of the proxy headers, parsed once per value."""
+    if cf_ip:  # noqa: SIM102
         if ip := normalize_ip(cf_ip):
             logger.debug("Using Cloudflare IP: %s", ip)
             return ip
 
-    if xff := headers.get("X-Forwarded-For"):
+    if xff:
         ips = [normalize_ip(ip.strip()) for ip in xff.split(",")]
         valid_ips = [ip for ip in ips if ip]
         if valid_ips:
             logger.debug("Using X-Forwarded-For IP: %s", valid_ips[-1])
             return valid_ips[-1]
 
-    if x_real_ip := headers.get("X-Real-IP"):  # noqa: SIM102
+    if x_real_ip:  # noqa: SIM102
         if ip := normalize_ip(x_real_ip):
             logger.debug("Using X-Real-IP IP: %s", ip)
             return ip
 
-    if client_ip := getattr(request.client, "host", None):  # noqa: SIM102
+    if client_ip:  # noqa: SIM102
         if ip := normalize_ip(client_ip):
             logger.debug("Using client IP: %s", ip)
             return ip
 
-    logger.warning("Could not extract valid IP")
-    return f"unknown_{hash(frozenset(headers.items())) % 1000000}"
+    return None
+
+
+def rate_limit_func(request: Request) -> str:
+    """Extract client marker for rate limiting."""
+    headers = request.headers
+    key = client_key(
+        headers.get("CF-Connecting-IP"),
+        headers.get("X-Forwarded-For"),
+        headers.get("X-Real-IP"),
+        getattr(request.client, "host", None),
+    )
+
+    if key is None:
+        logger.warning("Could not extract valid IP")
+        return f"unknown_{hash(frozenset(headers.items())) % 1000000}"
+
+    return key
@@ -0,0 +1,25 @@
+"""API response classes."""
+
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic_core import to_json
+
+
+class FastJSONResponse(Response):
+    """JSON response encoded by pydantic-core in a single pass.
+
+    Returned directly from an endpoint, it bypasses FastAPI's response
+    validation, so models are expected to be built with ``model_construct``
+    from trusted data. Pre-encoded bytes are sent as is. The endpoint keeps
+    its ``response_model`` for the OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """Encode content to JSON bytes."""
+        if isinstance(content, bytes):
+            return content
+
+        return to_json(content)
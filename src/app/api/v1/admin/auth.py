@@ -2,9 +2,12 @@
 
 import hmac
 import logging
+from typing import Annotated
 
+from dependency_injector.wiring import Provide, inject
 from fastapi import (
     APIRouter,
+    Depends,
     HTTPException,
     Request,
     Response,
@@ -18,7 +21,7 @@ from app.api.models.authentication import (
 )
 from app.container import Container
 from app.shared import config
-from app.shared.jwt_utils import create_auth_token
+from app.shared.jwt_utils import VerifiedTokenCache, create_auth_token
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Authentication"])
@@ -114,11 +117,17 @@ async def login(
     },
 )
 @limiter.limit("1/second")
+@inject
 async def logout(
     request: Request,
     response: Response,
+    verified_tokens: Annotated[
+        VerifiedTokenCache,
+        Depends(Provide[Container.verified_tokens]),
+    ],
 ) -> LogoutResponse:
     """Admin logout."""
+    verified_tokens.discard(request.cookies.get("token", ""))
     response.delete_cookie(
         key="token",
         httponly=True,
@@ -11,6 +11,7 @@ from fastapi import (
     Depends,
     HTTPException,
     Request,
+    Response,
     status,
 )
 
@@ -19,18 +20,31 @@ from app.api.models.group import (
     MonitorsGroupRequest,
     MonitorsGroupResponse,
 )
+from app.api.responses import FastJSONResponse
 from app.container import Container
 from app.database.models.group import MonitorGroupModel
+from app.repositories.base import StaleVersionError
 from app.repositories.uow import SqlAlchemyUnitOfWork
+from app.services.status.broadcaster import StatusBroadcaster
+from app.shared.http_cache import if_match_version, version_etag
 
 logger = logging.getLogger(__name__)
 limiter = Container.limiter()
 router = APIRouter(tags=["Monitor Groups"])
 
 
+def _group_changed() -> HTTPException:
+    """Build the error for an update based on a stale group."""
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="Group was changed meanwhile, reload it and try again",
+    )
+
+
 @router.get(
     "/groups",
     status_code=status.HTTP_200_OK,
+    response_model=MonitorsGroupListResponse,
     summary="List monitors groups",
     description="Retrieve all available monitors groups",
     response_description="List of monitors groups",
@@ -48,18 +62,20 @@ async def list_groups(
     request: Request,
     uow_factory: Annotated[
         Callable[[], SqlAlchemyUnitOfWork],
-        Depends(Provide[Container.uow_factory.provider]),
+        Depends(Provide[Container.read_uow_factory.provider]),
     ],
-) -> MonitorsGroupListResponse:
+) -> Response:
     """List all groups."""
     async with uow_factory() as uow:
         groups = await uow.groups.find_all()
 
     logger.debug("Found %d groups", len(groups))
 
-    return MonitorsGroupListResponse(
-        groups=[MonitorsGroupResponse.from_orm(group) for group in groups],
-        total=len(groups),
+    return FastJSONResponse(
+        MonitorsGroupListResponse.model_construct(
+            groups=[MonitorsGroupResponse.from_orm(group) for group in groups],
+            total=len(groups),
+        ),
     )
 
 
@@ -82,6 +98,7 @@ async def list_groups(
 @inject
 async def get_group(
     request: Request,
+    response: Response,
     group_id: UUID,
     uow_factory: Annotated[
         Callable[[], SqlAlchemyUnitOfWork],
@@ -98,6 +115,7 @@ async def get_group(
             detail="Group not found",
         )
 
+    response.headers["ETag"] = version_etag(group.version)
     return MonitorsGroupResponse.from_orm(group)
 
 
@@ -122,11 +140,16 @@ async def get_group(
 @inject
 async def create_group(
     request: Request,
+    response: Response,
     create_request: MonitorsGroupRequest,
     uow_factory: Annotated[
         Callable[[], SqlAlchemyUnitOfWork],
         Depends(Provide[Container.uow_factory.provider]),
     ],
+    broadcaster: Annotated[
+        StatusBroadcaster,
+        Depends(Provide[Container.status_broadcaster]),
+    ],
 ) -> MonitorsGroupResponse:
     """Create a specific group."""
     async with uow_factory() as uow:
@@ -134,8 +157,10 @@ async def create_group(
             MonitorGroupModel(name=create_request.name),
         )
 
+    broadcaster.resync()
     logger.debug("Group id=%s, name='%s' created", group.id, group.name)
 
+    response.headers["ETag"] = version_etag(group.version)
     return MonitorsGroupResponse.from_orm(group)
 
 
@@ -153,24 +178,40 @@ async def create_group(
         400: {"description": "Bad request"},
         401: {"description": "Unauthorized"},
         404: {"description": "Group not found"},
+        412: {"description": "Group changed since If-Match"},
         422: {"description": "Validation error"},
         500: {"description": "Internal server error"},
     },
 )
 @limiter.limit("1/second")
 @inject
-async def update_group(
+async def update_group(  # noqa: PLR0913
     request: Request,
+    response: Response,
     group_id: UUID,
     update_request: MonitorsGroupRequest,
     uow_factory: Annotated[
         Callable[[], SqlAlchemyUnitOfWork],
         Depends(Provide[Container.uow_factory.provider]),
     ],
+    broadcaster: Annotated[
+        StatusBroadcaster,
+        Depends(Provide[Container.status_broadcaster]),
+    ],
 ) -> MonitorsGroupResponse:
     """Update a specific group."""
+    version = if_match_version(request)
+
     async with uow_factory() as uow:
-        group = await uow.groups.find_by_id(group_id, with_for_update=True)
+        try:
+            group = await uow.groups.update(
+                group_id,
+                {"name": update_request.name},
+                version=version,
+            )
+
+        except StaleVersionError:
+            raise _group_changed() from None
 
         if not group:
             raise HTTPException(
@@ -178,15 +219,14 @@ async def update_group(
                 detail="Group not found",
             )
 
-        group.name = update_request.name
-        group = await uow.groups.save(group)
-
+    broadcaster.resync()
     logger.debug(
         "Group id=%s, name='%s' updated",
         group.id,
         group.name,
     )
 
+    response.headers["ETag"] = version_etag(group.version)
     return MonitorsGroupResponse.from_orm(group)
 
 
@@ -199,6 +239,7 @@ async def update_group(
         204: {"description": "Successful response"},
         401: {"description": "Unauthorized"},
         404: {"description": "Group not found"},
+        412: {"description": "Group changed since If-Match"},
         500: {"description": "Internal server error"},
     },
 )
@@ -211,10 +252,24 @@ async def delete_group(
         Callable[[], SqlAlchemyUnitOfWork],
         Depends(Provide[Container.uow_factory.provider]),
     ],
+    broadcaster: Annotated[
+        StatusBroadcaster,
+        Depends(Provide[Container.status_broadcaster]),
+    ],
 ) -> None:
     """Delete a specific group."""
+    version = if_match_version(request)
+
     async with uow_factory() as uow:
-        group = await uow.groups.find_by_id(group_id, with_for_update=True)
+        try:
+            group = await uow.groups.update(
+                group_id,
+                {"is_deleted": True},
+                version=version,
+            )
+
+        except StaleVersionError:
+            raise _group_changed() from None
 
         if not group:
             raise HTTPException(
@@ -222,7 +277,5 @@ async def delete_group(
                 detail="Group not found",
             )
 
-        group.is_deleted = True
-        await uow.groups.save(group)
-
+    broadcaster.resync()
     logger.debug("Group id=%s, name='%s' deleted", group.id, group.name)
@@ -11,6 +11,7 @@ from fastapi import (
     Depends,
     HTTPException,
     Request,
+    Response,
     status,
 )
 
@@ -20,20 +21,33 @@ from app.api.models.monitor import (
     MonitorsListResponse,
     MonitorsTypesResponse,
 )
+from app.api.responses import FastJSONResponse
 from app.container import Container
 from app.database.models.monitor import MonitorModel
 from app.enums import MonitorType
 from app.monitoring.scheduler import WorkerScheduler
+from app.repositories.base import StaleVersionError
 from app.repositories.uow import SqlAlchemyUnitOfWork
+from app.services.status.broadcaster import StatusBroadcaster
+from app.shared.http_cache import if_match_version, version_etag
 
 logger = logging.getLogger(__name__)
 limiter = Container.limiter()
 router = APIRouter(tags=["Monitors"])
 
 
+def _monitor_changed() -> HTTPException:
+    """Build the error for an update based on a stale monitor."""
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="Monitor was changed meanwhile, reload it and try again",
+    )
+
+
 @router.get(
     "/monitors",
     status_code=status.HTTP_200_OK,
+    response_model=MonitorsListResponse,
     summary="List monitors",
     description="Retrieve all available monitors",
     response_description="List of monitors",
@@ -51,18 +65,22 @@ async def list_monitors(
     request: Request,
     uow_factory: Annotated[
         Callable[[], SqlAlchemyUnitOfWork],
-        Depends(Provide[Container.uow_factory.provider]),
+        Depends(Provide[Container.read_uow_factory.provider]),
     ],
-) -> MonitorsListResponse:
+) -> Response:
     """List all monitors."""
     async with uow_factory() as uow:
         monitors = await uow.monitors.find_all()
 
     logger.debug("Found %d monitors", len(monitors))
 
-    return MonitorsListResponse(
-        monitors=[MonitorResponse.from_orm(monitor) for monitor in monitors],
-        total=len(monitors),
+    return FastJSONResponse(
+        MonitorsListResponse.model_construct(
+            monitors=[
+                MonitorResponse.from_orm(monitor) for monitor in monitors
+            ],
+            total=len(monitors),
+        ),
     )
 
 
@@ -108,6 +126,7 @@ async def monitor_types(request: Request) -> MonitorsTypesResponse:
 @inject
 async def get_monitor(
     request: Request,
+    response: Response,
     monitor_id: UUID,
     uow_factory: Annotated[
         Callable[[], SqlAlchemyUnitOfWork],
@@ -124,6 +143,7 @@ async def get_monitor(
             detail="Monitor not found",
         )
 
+    response.headers["ETag"] = version_etag(monitor.version)
     return MonitorResponse.from_orm(monitor)
 
 
@@ -147,8 +167,9 @@ async def get_monitor(
 )
 @limiter.limit("1/second")
 @inject
-async def create_monitor(
+async def create_monitor(  # noqa: PLR0913
     request: Request,
+    response: Response,
     create_request: MonitorRequest,
     uow_factory: Annotated[
         Callable[[], SqlAlchemyUnitOfWork],
@@ -158,6 +179,10 @@ async def create_monitor(
         WorkerScheduler,
         Depends(Provide[Container.worker_scheduler]),
     ],
+    broadcaster: Annotated[
+        StatusBroadcaster,
+        Depends(Provide[Container.status_broadcaster]),
+    ],
 ) -> MonitorResponse:
     """Create a new monitor."""
     async with uow_factory() as uow:
@@ -173,9 +198,11 @@ async def create_monitor(
             MonitorModel(**create_request.model_dump()),
         )
 
+    broadcaster.monitor_added(monitor)
     await scheduler.start_worker(monitor)
     logger.debug("Monitor id=%s, name='%s' created", monitor.id, monitor.name)
 
+    response.headers["ETag"] = version_etag(monitor.version)
     return MonitorResponse.from_orm(monitor)
 
 
@@ -193,14 +220,16 @@ async def create_monitor(
         400: {"description": "Bad request"},
         401: {"description": "Unauthorized"},
         404: {"description": "Monitor or group not found"},
+        412: {"description": "Monitor changed since If-Match"},
         422: {"description": "Validation error"},
         500: {"description": "Internal server error"},
     },
 )
 @limiter.limit("1/second")
 @inject
-async def update_monitor(
+async def update_monitor(  # noqa: PLR0913
     request: Request,
+    response: Response,
     monitor_id: UUID,
     update_request: MonitorRequest,
     uow_factory: Annotated[
@@ -211,24 +240,16 @@ async def update_monitor(
         WorkerScheduler,
         Depends(Provide[Container.worker_scheduler]),
     ],
+    broadcaster: Annotated[
+        StatusBroadcaster,
+        Depends(Provide[Container.status_broadcaster]),
+    ],
 ) -> MonitorResponse:
     """Update a specific monitor."""
-    async with uow_factory() as uow:
-        monitor = await uow.monitors.find_by_id(
-            monitor_id,
-            with_for_update=True,
-        )
-
-        if not monitor:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Monitor not found",
-            )
+    version = if_match_version(request)
 
-        if (
-            update_request.group_id
-            and monitor.group_id != update_request.group_id
-        ):
+    async with uow_factory() as uow:
+        if update_request.group_id:
             group = await uow.groups.find_by_id(update_request.group_id)
             if not group:
                 raise HTTPException(
@@ -236,15 +257,27 @@ async def update_monitor(
                     detail="Group not found",
                 )
 
-        update_data = update_request.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(monitor, field, value)
+        try:
+            monitor = await uow.monitors.update(
+                monitor_id,
+                update_request.model_dump(exclude_unset=True),
+                version=version,
+            )
+
+        except StaleVersionError:
+            raise _monitor_changed() from None
 
-        monitor = await uow.monitors.save(monitor)
+        if not monitor:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Monitor not found",
+            )
 
+    broadcaster.resync()
     await scheduler.restart_worker(monitor)
     logger.debug("Monitor id=%s, name='%s' updated", monitor.id, monitor.name)
 
+    response.headers["ETag"] = version_etag(monitor.version)
     return MonitorResponse.from_orm(monitor)
 
 
@@ -257,6 +290,7 @@ async def update_monitor(
         204: {"description": "Successful response"},
         401: {"description": "Unauthorized"},
         404: {"description": "Monitor not found"},
+        412: {"description": "Monitor changed since If-Match"},
         500: {"description": "Internal server error"},
     },
 )
@@ -273,13 +307,24 @@ async def delete_monitor(
         WorkerScheduler,
         Depends(Provide[Container.worker_scheduler]),
     ],
+    broadcaster: Annotated[
+        StatusBroadcaster,
+        Depends(Provide[Container.status_broadcaster]),
+    ],
 ) -> None:
     """Delete a specific monitor."""
+    version = if_match_version(request)
+
     async with uow_factory() as uow:
-        monitor = await uow.monitors.find_by_id(
-            monitor_id,
-            with_for_update=True,
-        )
+        try:
+            monitor = await uow.monitors.update(
+                monitor_id,
+                {"is_deleted": True},
+                version=version,
+            )
+
+        except StaleVersionError:
+            raise _monitor_changed() from None
 
         if not monitor:
             raise HTTPException(
@@ -287,8 +332,6 @@ async def delete_monitor(
                 detail="Monitor not found",
             )
 
-        monitor.is_deleted = True
-        await uow.monitors.save(monitor)
-
+    broadcaster.monitor_removed(monitor)
     logger.debug("Monitor id=%s, name='%s' deleted", monitor.id, monitor.name)
     await scheduler.stop_worker(monitor)
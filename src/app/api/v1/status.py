@@ -1,116 +1,297 @@
 """Status API."""
 
 import logging
-from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
 from typing import Annotated
+from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
 from app.api.models.status import (
-    StatusMonitorGroupResponse,
-    StatusMonitorResponse,
+    DailyStatusChangeResponse,
+    DayIncidentsResponse,
+    GroupChangeResponse,
+    IncidentChangeResponse,
+    IncidentResponse,
+    MonitorChangeResponse,
+    StatusDeltaResponse,
     StatusResponse,
 )
+from app.api.responses import FastJSONResponse
 from app.container import Container
-from app.database.models.group import MonitorGroupModel
-from app.database.models.incident import IncidentModel
-from app.database.models.monitor import MonitorModel
-from app.enums import ComponentType
+from app.enums import StatusEventType
 from app.repositories.uow import SqlAlchemyUnitOfWork
+from app.services.status.broadcaster import (
+    StatusBroadcaster,
+    SubscriberLimitError,
+    Subscription,
+    encode_event,
+)
+from app.services.status.snapshot import (
+    INCIDENT_HISTORY_DAYS,
+    OPEN_INCIDENT_MAX_AGE,
+    StatusSnapshotCache,
+    delta_history,
+)
+from app.services.status.version import StatusVersion
+from app.shared.compression import negotiate
+from app.shared.http_cache import cache_headers, etag_matches, not_modified
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Status"])
-INCIDENT_HISTORY_DAYS = 30
-
-
-def _group_by_attribute(items: list, attr_name: str) -> dict:
-    """Group items by attribute."""
-    result = defaultdict(list)
-    for item in items:
-        result[getattr(item, attr_name)].append(item)
-    return dict(result)
-
-
-def _build_components(
-    monitors: list[MonitorModel],
-    groups: list[MonitorGroupModel],
-    incidents: list[IncidentModel],
-) -> list[StatusMonitorGroupResponse | StatusMonitorResponse]:
-    """Build list of components from monitors, groups and incidents."""
-    components = []
-
-    monitors_by_group = _group_by_attribute(monitors, "group_id")
-    incidents_by_monitor = _group_by_attribute(incidents, "monitor_id")
-
-    for group in groups:
-        group_monitors = monitors_by_group.get(group.id, [])
-        components.append(
-            StatusMonitorGroupResponse(
-                type=ComponentType.GROUP,
-                id=group.id,
-                name=group.name,
-                monitors=[
-                    StatusMonitorResponse.from_orm(
-                        monitor,
-                        incidents_by_monitor.get(monitor.id, []),
-                    )
-                    for monitor in group_monitors
-                ],
-            ),
-        )
+STATUS_DELTA_MAX_CHANGES = 500
+
 
-    orphan_monitors = monitors_by_group.get(None, [])
+async def _load_delta(
+    uow_factory: Callable[[], SqlAlchemyUnitOfWork],
+    status_version: StatusVersion,
+    since: int,
+) -> StatusDeltaResponse | None:
+    """Load status changes since a revision.
 
-    components += [
-        StatusMonitorResponse.from_orm(
-            monitor,
-            incidents_by_monitor.get(monitor.id, []),
+    Returns ``None`` when the client has to start over from a snapshot.
+    """
+    last_update_at = status_version.updated_at
+
+    async with uow_factory() as uow:
+        changes = await uow.status.find_changes(
+            since,
+            last_days=INCIDENT_HISTORY_DAYS,
+            limit=STATUS_DELTA_MAX_CHANGES,
         )
-        for monitor in orphan_monitors
-    ]
 
-    return components
+    # A cursor from the future means the database was replaced
+    if changes is None or changes.revision < since:
+        return None
+
+    logger.debug(
+        "Found status changes since=%d, revision=%d",
+        since,
+        changes.revision,
+    )
+
+    now = datetime.now(UTC)
+
+    if changes.open_incidents:
+        status_version.expire_in(OPEN_INCIDENT_MAX_AGE)
+
+    return StatusDeltaResponse.model_construct(
+        cursor=str(changes.revision),
+        groups=[GroupChangeResponse.from_row(g) for g in changes.groups],
+        monitors=[MonitorChangeResponse.from_row(m) for m in changes.monitors],
+        incidents=[
+            IncidentChangeResponse.from_row(i) for i in changes.incidents
+        ],
+        history=[
+            DailyStatusChangeResponse.from_rollup(h)
+            for h in delta_history(changes, now)
+        ],
+        last_update_at=last_update_at,
+    )
 
 
 @router.get(
     "/status",
     status_code=status.HTTP_200_OK,
+    response_model=StatusResponse | StatusDeltaResponse,
     summary="Get current monitors",
-    description="Retrieve the monitors",
+    description=(
+        "Retrieve the monitors. With `since` set to the `cursor` of a "
+        "previous response only the changes are returned, or a full "
+        "status when the cursor is too old."
+    ),
     response_description="Monitors status",
+    responses={
+        200: {"description": "Successful response"},
+        304: {"description": "Status not modified"},
+        500: {"description": "Internal server error"},
+    },
+)
+@inject
+async def get_status(
+    request: Request,
+    uow_factory: Annotated[
+        Callable[[], SqlAlchemyUnitOfWork],
+        Depends(Provide[Container.read_uow_factory.provider]),
+    ],
+    status_version: Annotated[
+        StatusVersion,
+        Depends(Provide[Container.status_version]),
+    ],
+    snapshot_cache: Annotated[
+        StatusSnapshotCache,
+        Depends(Provide[Container.status_snapshot]),
+    ],
+    since: str | None = None,
+) -> Response:
+    """Get current monitors status."""
+    if since is not None and since.isdigit():
+        etag = status_version.etag(f"delta-{since}")
+
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        delta = await _load_delta(uow_factory, status_version, int(since))
+        if delta is not None:
+            return FastJSONResponse(delta, headers=cache_headers(etag))
+
+    # Each encoding is a different representation with its own ETag
+    encoding = negotiate(request.headers.get("accept-encoding", ""))
+    etag = status_version.etag(
+        "status" if encoding is None else f"status-{encoding}",
+    )
+
+    if since is None and etag_matches(request, etag):
+        return not_modified(etag)
+
+    snapshot = await snapshot_cache.get(encoding)
+    headers = cache_headers(etag)
+
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+
+    return FastJSONResponse(snapshot, headers=headers)
+
+
+@router.get(
+    "/status/{monitor_id}/incidents",
+    status_code=status.HTTP_200_OK,
+    response_model=DayIncidentsResponse,
+    summary="Get monitor incidents of a day",
+    description="Retrieve the incidents of a monitor overlapping a UTC day",
+    response_description="Incidents of the day",
     responses={
         200: {
             "description": "Successful response",
-            "model": StatusResponse,
+            "model": DayIncidentsResponse,
         },
+        304: {"description": "Incidents not modified"},
+        404: {"description": "Day is out of the history range"},
         500: {"description": "Internal server error"},
     },
 )
 @inject
-async def get_status(
+async def get_day_incidents(
     request: Request,
+    monitor_id: UUID,
+    day: date,
     uow_factory: Annotated[
         Callable[[], SqlAlchemyUnitOfWork],
-        Depends(Provide[Container.uow_factory.provider]),
+        Depends(Provide[Container.read_uow_factory.provider]),
     ],
-) -> StatusResponse:
-    """Get current monitors status."""
-    async with uow_factory() as uow:
-        monitors = await uow.monitors.find_all()
-        groups = await uow.groups.find_all()
-        incidents = await uow.incidents.find_all(
-            last_days=INCIDENT_HISTORY_DAYS,
+    status_version: Annotated[
+        StatusVersion,
+        Depends(Provide[Container.status_version]),
+    ],
+) -> Response:
+    """Get incidents of a monitor on a given day."""
+    today = datetime.now(UTC).date()
+
+    if not (today - timedelta(days=INCIDENT_HISTORY_DAYS - 1) <= day <= today):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Day is out of the history range",
         )
 
-    logger.debug(
-        "Found monitors=%d, groups=%d, incidents=%d",
-        len(monitors),
-        len(groups),
-        len(incidents),
+    etag = status_version.etag(f"incidents-{monitor_id}-{day.isoformat()}")
+
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    async with uow_factory() as uow:
+        incidents = await uow.incidents.find_by_day(monitor_id, day)
+
+    return FastJSONResponse(
+        DayIncidentsResponse.model_construct(
+            day=day,
+            incidents=[IncidentResponse.from_orm(i) for i in incidents],
+        ),
+        headers=cache_headers(etag),
     )
 
-    components = _build_components(monitors, groups, incidents)
 
-    return StatusResponse(components=components)
+async def _stream_events(
+    subscription: Subscription,
+    broadcaster: StatusBroadcaster,
+    snapshot: Callable[[], Awaitable[bytes]],
+) -> AsyncGenerator[bytes]:
+    """Yield a snapshot, then deltas until the client disconnects."""
+    try:
+        yield await snapshot()
+
+        while True:
+            frames = await subscription.next()
+            yield await snapshot() if frames is None else b"".join(frames)
+
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+@router.get(
+    "/status/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream status changes",
+    description=(
+        "Server-sent events: a `snapshot` of the current status, then "
+        "incident and monitor deltas. A new `snapshot` is sent whenever "
+        "the client has to resync."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Event stream",
+            "content": {"text/event-stream": {}},
+        },
+        503: {"description": "Too many subscribers"},
+    },
+)
+@inject
+async def stream_status(
+    request: Request,
+    status_version: Annotated[
+        StatusVersion,
+        Depends(Provide[Container.status_version]),
+    ],
+    snapshot_cache: Annotated[
+        StatusSnapshotCache,
+        Depends(Provide[Container.status_snapshot]),
+    ],
+    broadcaster: Annotated[
+        StatusBroadcaster,
+        Depends(Provide[Container.status_broadcaster]),
+    ],
+) -> StreamingResponse:
+    """Stream status changes."""
+    try:
+        subscription = broadcaster.subscribe()
+
+    except SubscriberLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        ) from e
+
+    async def snapshot() -> bytes:
+        """Encode the current status as a snapshot event."""
+        version = status_version.value
+        data = await snapshot_cache.get()
+        return encode_event(StatusEventType.SNAPSHOT, data, version)
+
+    return StreamingResponse(
+        _stream_events(subscription, broadcaster, snapshot),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -3,33 +3,63 @@
 from pathlib import Path
 
 from dependency_injector import containers, providers
-from fastapi.templating import Jinja2Templates
-from slowapi import Limiter
-from sqlalchemy.ext.asyncio import (
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.api.slowapi import rate_limit_func
+from app.api.ratelimit import rate_limit_func
+from app.database.pool import create_engine, read_only
+from app.database.replica import ReplicaRouter
 from app.monitoring.manager import WorkerManager
 from app.monitoring.scheduler import WorkerScheduler
-from app.repositories.uow import SqlAlchemyUnitOfWork
+from app.repositories.uow import (
+    SqlAlchemyReadOnlyUnitOfWork,
+    SqlAlchemyUnitOfWork,
+)
 from app.services.health.db import DatabaseHealthCheckService
+from app.services.incidents.partitions import IncidentPartitionManager
+from app.services.ratelimit.database import DatabaseRateLimitBackend
+from app.services.ratelimit.limiter import Limiter
+from app.services.ratelimit.memory import MemoryRateLimitBackend
+from app.services.status.broadcaster import StatusBroadcaster
+from app.services.status.export import StatusExporter
+from app.services.status.listener import StatusChangeListener
+from app.services.status.snapshot import StatusSnapshotCache
+from app.services.status.version import StatusVersion
 from app.shared import config
+from app.shared.jwt_utils import VerifiedTokenCache
+from app.shared.staticfiles import load_asset_manifest
+from app.shared.templating import PageCache, create_templates
 
 
 class DatabaseContainer(containers.DeclarativeContainer):
-    """Database container."""
+    """Database container.
+
+    Each workload has its own pool, so that one of them running out of
+    connections cannot starve the others.
+    """
 
     engine = providers.Singleton(
-        create_async_engine,
+        create_engine,
         config.db.url,
-        future=True,
-        pool_size=20,
-        max_overflow=30,
-        pool_pre_ping=True,
-        pool_recycle=3600,
+        "api",
+        config.api_pool,
+    )
+    worker_engine = providers.Singleton(
+        create_engine,
+        config.db.url,
+        "worker",
+        config.worker_pool,
+    )
+    health_engine = providers.Singleton(
+        create_engine,
+        config.db.url,
+        "health",
+        config.health_pool,
+    )
+    replica_engine = providers.Singleton(
+        create_engine,
+        config.db.replica_url,
+        "replica",
+        config.replica_pool,
     )
 
     session_factory = providers.Singleton(
@@ -38,6 +68,50 @@ class DatabaseContainer(containers.DeclarativeContainer):
         class_=AsyncSession,
         expire_on_commit=False,
     )
+    # Sessions of the API pool that never write
+    read_only_session_factory = providers.Singleton(
+        async_sessionmaker,
+        bind=providers.Callable(read_only, engine),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    worker_session_factory = providers.Singleton(
+        async_sessionmaker,
+        bind=worker_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    health_session_factory = providers.Singleton(
+        async_sessionmaker,
+        bind=providers.Callable(read_only, health_engine),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    replica_session_factory = (
+        providers.Singleton(
+            async_sessionmaker,
+            bind=providers.Callable(read_only, replica_engine),
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        if config.db.replica_url
+        else providers.Object(None)
+    )
+
+    engines = (
+        providers.Dict(
+            api=engine,
+            worker=worker_engine,
+            health=health_engine,
+            replica=replica_engine,
+        )
+        if config.db.replica_url
+        else providers.Dict(
+            api=engine,
+            worker=worker_engine,
+            health=health_engine,
+        )
+    )
 
 
 class Container(containers.DeclarativeContainer):
@@ -47,28 +121,111 @@ class Container(containers.DeclarativeContainer):
 
     database_health = providers.Factory(
         DatabaseHealthCheckService,
-        session_factory=db.session_factory,
+        session_factory=db.health_session_factory,
     )
 
     uow_factory = providers.Factory(
         SqlAlchemyUnitOfWork,
         session_factory=db.session_factory,
     )
+    worker_uow_factory = providers.Factory(
+        SqlAlchemyUnitOfWork,
+        session_factory=db.worker_session_factory,
+    )
 
+    incident_partitions = providers.Singleton(
+        IncidentPartitionManager,
+        uow_factory=worker_uow_factory.provider,
+        retention_months=config.retention.months,
+        archive_dir=config.retention.archive_dir,
+        drop=config.retention.drop,
+        interval=config.retention.interval,
+    )
+
+    assets = providers.Singleton(
+        load_asset_manifest,
+        directory=Path(__file__).parent / "frontend" / "static",
+    )
     jinja = providers.Singleton(
-        Jinja2Templates,
+        create_templates,
         directory=Path(__file__).parent / "frontend" / "templates",
+        assets=assets,
+        bytecode_dir=config.cache.templates_dir,
+        auto_reload=config.app.is_development,
+    )
+    pages = providers.Singleton(
+        PageCache,
+        templates=jinja,
+        max_entries=config.cache.max_pages,
+    )
+
+    status_version = providers.Singleton(StatusVersion)
+
+    # Public and listing reads, served by the replica when there is one
+    read_session_factory = providers.Singleton(
+        ReplicaRouter,
+        primary=db.read_only_session_factory,
+        replica=db.replica_session_factory,
+        status_version=status_version,
+        max_lag=config.db.replica_max_lag,
+        check_interval=config.db.replica_check_interval,
+    )
+    read_uow_factory = providers.Factory(
+        SqlAlchemyReadOnlyUnitOfWork,
+        session_factory=read_session_factory,
+    )
+    status_snapshot = providers.Singleton(
+        StatusSnapshotCache,
+        status_version=status_version,
+        uow_factory=read_uow_factory.provider,
+    )
+    status_broadcaster = providers.Singleton(
+        StatusBroadcaster,
+        status_version=status_version,
+        max_subscribers=config.stream.max_subscribers,
+        queue_size=config.stream.queue_size,
+        heartbeat_interval=config.stream.heartbeat_interval,
+    )
+    status_listener = providers.Singleton(
+        StatusChangeListener,
+        engine=db.engine,
+        broadcaster=status_broadcaster,
+    )
+    status_exporter = providers.Singleton(
+        StatusExporter,
+        templates=jinja,
+        snapshot_cache=status_snapshot,
+        uow_factory=read_uow_factory.provider,
+        status_version=status_version,
+        static_dir=Path(__file__).parent / "frontend" / "static",
+        assets=assets,
+        output_dir=config.export.dir,
+        interval=config.export.interval,
+        retain=config.export.retain,
     )
 
+    # SQLite runs a single instance, it has nothing to share buckets with
+    rate_limit_backend = (
+        providers.Singleton(DatabaseRateLimitBackend, engine=db.engine)
+        if config.rate_limit.shared and not config.db.is_sqlite
+        else providers.Singleton(MemoryRateLimitBackend)
+    )
     limiter = providers.Singleton(
         Limiter,
+        backend=rate_limit_backend,
         key_func=rate_limit_func,
     )
 
+    verified_tokens = providers.Singleton(
+        VerifiedTokenCache,
+        max_entries=config.jwt.cache_size,
+    )
+
     # Monitoring
     worker_manager = providers.Singleton(WorkerManager)
     worker_scheduler = providers.Singleton(
         WorkerScheduler,
         manager=worker_manager,
-        uow_factory=uow_factory.provider,
+        uow_factory=worker_uow_factory.provider,
+        broadcaster=status_broadcaster,
     )
@@ -0,0 +1,75 @@
+"""SQL functions compiled for each supported dialect."""
+
+from typing import Any
+
+from sqlalchemy import JSON, BigInteger
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import GenericFunction
+
+
+class status_cursor(GenericFunction):  # noqa: N801
+    """Lowest status revision a later write can still become visible at.
+
+    Rows at or above it have to be read again by the next delta. On
+    Postgres this is the oldest transaction still running in the cluster
+    that has written anything, read-only transactions do not count. While
+    one such transaction stays open, every delta reads again all changes
+    since it began. Once they pass the delta limit, clients get full
+    snapshots until it ends.
+    """
+
+    type = BigInteger()
+    inherit_cache = True
+
+
+class json_array_agg(GenericFunction):  # noqa: N801
+    """Aggregate the arguments of each row into a JSON array of arrays.
+
+    The order of the rows is unspecified.
+    """
+
+    type = JSON()
+    inherit_cache = True
+
+
+@compiles(status_cursor, "postgresql")
+def _status_cursor_postgresql(
+    element: status_cursor,
+    compiler: SQLCompiler,
+    **kw: Any,  # noqa: ANN401
+) -> str:
+    """Compile to the xmin of the snapshot, no older write is pending."""
+    return "pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+
+
+@compiles(status_cursor, "sqlite")
+def _status_cursor_sqlite(
+    element: status_cursor,
+    compiler: SQLCompiler,
+    **kw: Any,  # noqa: ANN401
+) -> str:
+    """Compile to the revision the next write is stamped with."""
+    return "(SELECT value + 1 FROM status_revision)"
+
+
+@compiles(json_array_agg, "postgresql")
+def _json_array_agg_postgresql(
+    element: json_array_agg,
+    compiler: SQLCompiler,
+    **kw: Any,  # noqa: ANN401
+) -> str:
+    """Compile to ``json_agg`` of ``json_build_array``."""
+    items = compiler.process(element.clauses, **kw)
+    return f"json_agg(json_build_array({items}))"
+
+
+@compiles(json_array_agg, "sqlite")
+def _json_array_agg_sqlite(
+    element: json_array_agg,
+    compiler: SQLCompiler,
+    **kw: Any,  # noqa: ANN401
+) -> str:
+    """Compile to ``json_group_array`` of ``json_array``."""
+    items = compiler.process(element.clauses, **kw)
+    return f"json_group_array(json_array({items}))"
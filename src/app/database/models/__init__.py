@@ -1,7 +1,13 @@
 """Database models."""
 
+from .daily_status import MonitorDailyStatusModel
 from .group import MonitorGroupModel
 from .incident import IncidentModel
 from .monitor import MonitorModel
 
-__all__ = ["IncidentModel", "MonitorGroupModel", "MonitorModel"]
+__all__ = [
+    "IncidentModel",
+    "MonitorDailyStatusModel",
+    "MonitorGroupModel",
+    "MonitorModel",
+]
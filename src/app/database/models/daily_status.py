@@ -0,0 +1,54 @@
+"""Monitor daily status model."""
+
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import UUID as UUIDTYPE
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    Enum,
+    FetchedValue,
+    ForeignKey,
+    Integer,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.base import Base
+from app.enums import IncidentType
+
+
+class MonitorDailyStatusModel(Base):
+    """Per-day incident rollup of a monitor (UTC days)."""
+
+    __tablename__ = "monitor_daily_status"
+
+    monitor_id: Mapped[UUID] = mapped_column(
+        UUIDTYPE,
+        ForeignKey("monitors.id"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    worst_type: Mapped[IncidentType] = mapped_column(
+        Enum(IncidentType),
+        nullable=False,
+    )
+    downtime_seconds: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+    )
+    incident_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+    )
+
+    revision: Mapped[int] = mapped_column(
+        BigInteger,
+        index=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
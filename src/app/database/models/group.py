@@ -3,17 +3,36 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import TIMESTAMP, Boolean, String
 from sqlalchemy import UUID as UUIDTYPE
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    FetchedValue,
+    Index,
+    Integer,
+    String,
+    literal_column,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.base import Base
+from app.database.types import UTCDateTime
 
 
 class MonitorGroupModel(Base):
     """Monitorgroups model."""
 
     __tablename__ = "groups"
+    __table_args__ = (
+        Index(
+            "ix_groups_created_at_active",
+            "created_at",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = false"),
+        ),
+    )
+
     id: Mapped[UUID] = mapped_column(
         UUIDTYPE,
         default=uuid4,
@@ -29,13 +48,28 @@ class MonitorGroupModel(Base):
     )
 
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
+        UTCDateTime,
         default=datetime.now,
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
+        UTCDateTime,
         onupdate=datetime.now,
         default=datetime.now,
         nullable=False,
     )
+    # Bumped by every update, admin edits compare and swap on it
+    version: Mapped[int] = mapped_column(
+        Integer,
+        server_default=text("1"),
+        onupdate=literal_column("version") + 1,
+        nullable=False,
+    )
+
+    revision: Mapped[int] = mapped_column(
+        BigInteger,
+        index=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
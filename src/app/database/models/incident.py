@@ -3,11 +3,20 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import TIMESTAMP, Enum, ForeignKey, String
 from sqlalchemy import UUID as UUIDTYPE
+from sqlalchemy import (
+    BigInteger,
+    Enum,
+    FetchedValue,
+    ForeignKey,
+    Index,
+    String,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.base import Base
+from app.database.types import UTCDateTime
 from app.enums import IncidentStatus, IncidentType
 
 
@@ -15,6 +24,25 @@ class IncidentModel(Base):
     """Incident model."""
 
     __tablename__ = "incidents"
+    # On Postgres open incidents have their own partition, holding the
+    # unique index on monitor_id. Resolved ones are partitioned by the
+    # month they ended in, see IncidentPartitionRepository. SQLite keeps a
+    # single table with a partial unique index instead.
+    __table_args__ = (
+        Index(
+            "ix_incidents_monitor_id_created_at",
+            "monitor_id",
+            "created_at",
+        ),
+        Index(
+            "ux_incidents_monitor_id_open",
+            "monitor_id",
+            unique=True,
+            sqlite_where=text("status = 'OPEN'"),
+        ).ddl_if(dialect="sqlite"),
+        {"postgresql_partition_by": "LIST (status)"},
+    )
+
     id: Mapped[UUID] = mapped_column(
         UUIDTYPE,
         default=uuid4,
@@ -39,12 +67,21 @@ class IncidentModel(Base):
     message: Mapped[str] = mapped_column(String, nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
+        UTCDateTime,
         default=datetime.now,
+        index=True,
         nullable=False,
     )
 
     ended_at: Mapped[datetime | None] = mapped_column(
-        TIMESTAMP(timezone=True),
+        UTCDateTime,
         nullable=True,
     )
+
+    revision: Mapped[int] = mapped_column(
+        BigInteger,
+        index=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
@@ -5,17 +5,22 @@ from uuid import UUID, uuid4
 
 from sqlalchemy import (
     JSON,
-    TIMESTAMP,
+    BigInteger,
     Boolean,
     Enum,
+    FetchedValue,
     ForeignKey,
+    Index,
     Integer,
     String,
+    literal_column,
+    text,
 )
 from sqlalchemy import UUID as UUIDTYPE
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.base import Base
+from app.database.types import UTCDateTime
 from app.enums import MonitorType
 
 
@@ -23,6 +28,21 @@ class MonitorModel(Base):
     """Monitor model."""
 
     __tablename__ = "monitors"
+    __table_args__ = (
+        Index(
+            "ix_monitors_created_at_active",
+            "created_at",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = false"),
+        ),
+        Index(
+            "ix_monitors_group_id_active",
+            "group_id",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = false"),
+        ),
+    )
+
     id: Mapped[UUID] = mapped_column(
         UUIDTYPE,
         default=uuid4,
@@ -68,13 +88,28 @@ class MonitorModel(Base):
     )
 
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
+        UTCDateTime,
         default=datetime.now,
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
+        UTCDateTime,
         onupdate=datetime.now,
         default=datetime.now,
         nullable=False,
     )
+    # Bumped by every update, admin edits compare and swap on it
+    version: Mapped[int] = mapped_column(
+        Integer,
+        server_default=text("1"),
+        onupdate=literal_column("version") + 1,
+        nullable=False,
+    )
+
+    revision: Mapped[int] = mapped_column(
+        BigInteger,
+        index=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
@@ -0,0 +1,163 @@
+"""Connection pools per workload."""
+
+from __future__ import annotations
+
+import secrets
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+    from sqlalchemy.engine.interfaces import DBAPIConnection
+    from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
+
+    from app.shared._config import PoolConfig
+
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -8000",
+)
+
+# Sent along by every connection of this process, writes to the public
+# status carry it in their notification, see StatusChangeListener
+INSTANCE = secrets.token_hex(8)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool counting checkouts, their wait time and timeouts."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the instrumented pool."""
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, recording how long it took."""
+        started_at = time.perf_counter()
+
+        try:
+            return super().connect()
+
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+
+        finally:
+            self.checkouts += 1
+            self.wait_seconds += time.perf_counter() - started_at
+
+
+@dataclass(slots=True, frozen=True)
+class PoolStats:
+    """Point-in-time statistics of a connection pool."""
+
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    wait_seconds: float
+    timeouts: int
+
+
+def create_engine(url: str, workload: str, pool: PoolConfig) -> AsyncEngine:
+    """Create an engine with its own pool and statement timeout."""
+    if url.startswith("sqlite"):
+        return _create_sqlite_engine(url, pool)
+
+    return create_async_engine(
+        url,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=pool.size,
+        max_overflow=pool.max_overflow,
+        pool_timeout=pool.timeout,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        connect_args={
+            "server_settings": {
+                "application_name": f"status-page-{workload}",
+                "statement_timeout": str(pool.statement_timeout),
+                "status_page.instance": INSTANCE,
+            },
+        },
+    )
+
+
+def _create_sqlite_engine(url: str, pool: PoolConfig) -> AsyncEngine:
+    """Create an engine for an SQLite database in WAL mode.
+
+    SQLite has no statement timeout, a statement waits for the write lock
+    as long as the pool would wait for a connection instead.
+    """
+    engine = create_async_engine(
+        url,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=pool.size,
+        max_overflow=pool.max_overflow,
+        pool_timeout=pool.timeout,
+    )
+    busy_timeout = int(pool.timeout * 1000)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def configure(
+        dbapi_connection: DBAPIConnection,
+        connection_record: ConnectionPoolEntry,
+    ) -> None:
+        """Apply the pragmas and leave BEGIN to SQLAlchemy."""
+        # The driver would only begin before writes, reads would not
+        # share a snapshot
+        dbapi_connection.isolation_level = None  # type: ignore[attr-defined]
+
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+
+        cursor.execute(f"PRAGMA busy_timeout = {busy_timeout}")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def begin(connection: Connection) -> None:
+        """Begin a transaction."""
+        connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+def read_only(engine: AsyncEngine) -> AsyncEngine:
+    """Share an engine's pool for sessions that only read.
+
+    Postgres statements run in autocommit, without the BEGIN and COMMIT
+    round trips. Reads asking for an isolation level, like the status
+    snapshot, still get a transaction. SQLite transactions cost no round
+    trip, the engine is returned as is.
+    """
+    if engine.dialect.name == "sqlite":
+        return engine
+
+    return engine.execution_options(isolation_level="AUTOCOMMIT")
+
+
+def pool_stats(engine: AsyncEngine) -> PoolStats:
+    """Read the statistics of an engine's pool."""
+    pool = cast("InstrumentedPool", engine.pool)
+
+    return PoolStats(
+        size=pool.size(),
+        checked_out=pool.checkedout(),
+        overflow=max(pool.overflow(), 0),
+        checkouts=pool.checkouts,
+        wait_seconds=pool.wait_seconds,
+        timeouts=pool.timeouts,
+    )
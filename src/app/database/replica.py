@@ -0,0 +1,125 @@
+"""Read replica routing."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.services.status.version import StatusVersion
+
+logger = logging.getLogger(__name__)
+
+# Seconds since the last replayed transaction, zero when caught up. A
+# server that is not in recovery, such as a promoted replica, has no lag.
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT COALESCE(
+        CASE
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END,
+        0
+    )
+    """,
+)
+
+
+class ReplicaRouter:
+    """Session factory preferring a read replica within a staleness budget.
+
+    Sessions are opened on the primary while the replica is unreachable
+    or lags behind more than ``max_lag`` seconds, and for ``max_lag``
+    seconds after a status change so that reads see the local writes.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replica: async_sessionmaker[AsyncSession] | None,
+        status_version: StatusVersion,
+        max_lag: float,
+        check_interval: float,
+    ) -> None:
+        """Initialize the replica router."""
+        self._primary = primary
+        self._replica = replica
+        self._status_version = status_version
+        self._max_lag = max_lag
+        self._check_interval = check_interval
+        self._is_healthy: bool | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_healthy(self) -> bool:
+        """Whether the replica was within the budget at the last check."""
+        return bool(self._is_healthy)
+
+    def __call__(self) -> AsyncSession:
+        """Open a session on the replica if it is fresh enough."""
+        if self._replica is None or not self.is_healthy:
+            return self._primary()
+
+        since_change = datetime.now(UTC) - self._status_version.updated_at
+        if since_change.total_seconds() < self._max_lag:
+            return self._primary()
+
+        return self._replica()
+
+    async def start(self) -> None:
+        """Check the replica now and then periodically."""
+        if self._replica is None or self._task is not None:
+            return
+
+        await self.check()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic checks."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+
+    async def check(self) -> bool:
+        """Measure the replica lag and update its health."""
+        if self._replica is None:
+            return False
+
+        try:
+            async with asyncio.timeout(self._check_interval):
+                async with self._replica() as session:
+                    lag = (await session.execute(REPLICA_LAG_QUERY)).scalar()
+
+        except (TimeoutError, SQLAlchemyError, OSError):
+            logger.debug("Replica check failed", exc_info=True)
+            lag = None
+
+        is_healthy = lag is not None and lag <= self._max_lag
+
+        if is_healthy and not self._is_healthy:
+            logger.info("Reading from the replica, lag=%ss", lag)
+
+        elif not is_healthy and self._is_healthy is not False:
+            logger.warning("Replica unavailable, lag=%s, reading primary", lag)
+
+        self._is_healthy = is_healthy
+        return is_healthy
+
+    async def _run(self) -> None:
+        """Check the replica periodically."""
+        while True:
+            await asyncio.sleep(self._check_interval)
+            await self.check()
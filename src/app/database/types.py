@@ -0,0 +1,36 @@
+"""Column types shared by the models."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import TIMESTAMP, Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class UTCDateTime(TypeDecorator[datetime]):
+    """Timezone-aware timestamp, written and read in UTC.
+
+    SQLite stores no offset, so naive values read back are UTC. Naive
+    values written are taken as local time, like ``datetime.now()``.
+    """
+
+    impl = TIMESTAMP(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(
+        self,
+        value: datetime | None,
+        dialect: Dialect,  # noqa: ARG002
+    ) -> datetime | None:
+        """Convert to UTC before writing."""
+        return None if value is None else value.astimezone(UTC)
+
+    def process_result_value(
+        self,
+        value: datetime | None,
+        dialect: Dialect,  # noqa: ARG002
+    ) -> datetime | None:
+        """Attach UTC to naive values read back."""
+        if value is None or value.tzinfo is not None:
+            return value
+
+        return value.replace(tzinfo=UTC)
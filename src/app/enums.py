@@ -54,3 +54,13 @@ class IncidentStatus(str, Enum):
 
     OPEN = "open"
     RESOLVED = "resolved"
+
+
+class StatusEventType(str, Enum):
+    """Status stream event types."""
+
+    SNAPSHOT = "snapshot"
+    INCIDENT_OPENED = "incident_opened"
+    INCIDENT_RESOLVED = "incident_resolved"
+    MONITOR_ADDED = "monitor_added"
+    MONITOR_REMOVED = "monitor_removed"
@@ -0,0 +1,75 @@
+import assert from "node:assert/strict";
+import { beforeEach, describe, it } from "node:test";
+
+import { followStream } from "../ts/shared/lib/stream";
+
+class FakeEventSource extends EventTarget {
+  static CONNECTING = 0;
+  static OPEN = 1;
+  static CLOSED = 2;
+
+  readyState = FakeEventSource.CONNECTING;
+  closed = false;
+
+  close() {
+    this.readyState = FakeEventSource.CLOSED;
+    this.closed = true;
+  }
+
+  fail(readyState) {
+    this.readyState = readyState;
+    this.dispatchEvent(new Event("error"));
+  }
+
+  send(event, data) {
+    this.dispatchEvent(new MessageEvent(event, { data }));
+  }
+}
+
+globalThis.EventSource = FakeEventSource;
+
+describe("followStream", () => {
+  let source;
+  let controller;
+
+  beforeEach(() => {
+    source = new FakeEventSource();
+    controller = new AbortController();
+  });
+
+  it("ends when the stream is closed for good", async () => {
+    const ended = followStream(source, {}, controller.signal);
+
+    source.fail(FakeEventSource.CLOSED);
+
+    assert.equal(await ended, "closed");
+    assert.ok(source.closed);
+  });
+
+  it("keeps following a stream that reconnects", async () => {
+    const received = [];
+    const ended = followStream(
+      source,
+      { snapshot: (event) => received.push(event.data) },
+      controller.signal,
+    );
+
+    source.fail(FakeEventSource.CONNECTING);
+    source.send("snapshot", "{}");
+    controller.abort();
+
+    assert.equal(await ended, "aborted");
+    assert.deepEqual(received, ["{}"]);
+    assert.ok(source.closed);
+  });
+
+  it("ends at once when already aborted", async () => {
+    controller.abort();
+
+    assert.equal(
+      await followStream(source, {}, controller.signal),
+      "aborted",
+    );
+    assert.ok(source.closed);
+  });
+});
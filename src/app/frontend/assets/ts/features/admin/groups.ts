@@ -8,8 +8,8 @@ export function groups(adminPath: string) {
   const crud = createCrudStore<GroupForCRUD, { name: string | null }>({
     fetch: () => api.getGroups(),
     create: (data) => api.createGroup(data.name!),
-    update: (id, data) => api.updateGroup(id, data.name!),
-    delete: (id) => api.deleteGroup(id),
+    update: (group, data) => api.updateGroup(group, data.name!),
+    delete: (group) => api.deleteGroup(group),
 
     emptyForm: {
       name: null,
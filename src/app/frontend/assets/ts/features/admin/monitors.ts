@@ -27,8 +27,8 @@ export function monitors(adminPath: string) {
     },
 
     create: (data) => api.createMonitor(data as MonitorForm),
-    update: (id, data) => api.updateMonitor(id, data as MonitorForm),
-    delete: (id) => api.deleteMonitor(id),
+    update: (monitor, data) => api.updateMonitor(monitor, data as MonitorForm),
+    delete: (monitor) => api.deleteMonitor(monitor),
 
     emptyForm: EMPTY_MONITOR_FORM,
 
@@ -1,19 +1,44 @@
 import { API } from "@/shared/lib/api";
+import { ExportAPI } from "@/shared/lib/export";
 import type {
   Days,
   EnrichedIncident,
   EnrichedStatusComponent,
   Tooltip,
 } from "../shared/types/status";
-import { OPERATIONAL_STATUS, REFRESH_INTERVAL_MS } from "@/shared/constants";
+import {
+  INITIAL_STATUS_ID,
+  OPERATIONAL_STATUS,
+  REFRESH_INTERVAL_MS,
+  STREAM_RETRY_MAX_MS,
+  STREAM_RETRY_MS,
+} from "@/shared/constants";
 import { StatusProcessor } from "@/shared/services/status.processor";
 import { notyf } from "@/shared/lib/notyf";
+import { followStream } from "@/shared/lib/stream";
+import type { StreamEnd } from "@/shared/lib/stream";
+import { isGroup } from "@/shared/utils/status.utils";
+import { IncidentStatus } from "@/shared/types/incident";
+import type {
+  GroupChange,
+  IncidentEvent,
+  MonitorAddedEvent,
+  MonitorChange,
+  MonitorForStatus,
+  MonitorRemovedEvent,
+  StatusComponent,
+  StatusComponents,
+  StatusDelta,
+} from "@/shared/types/api";
 
 export class StatusService {
   private readonly api: API;
   private readonly statusProcessor: StatusProcessor;
   private started = false;
   private abortController: AbortController | null = null;
+  private rawComponents: StatusComponent[] = [];
+  private cursor: string | null = null;
+  private hoveredDay: string | null = null;
 
   public tooltip: Tooltip = {
     isActive: false,
@@ -25,26 +50,22 @@ export class StatusService {
   public currentIncident: EnrichedIncident | typeof OPERATIONAL_STATUS | null =
     null;
 
-  constructor(api?: API) {
+  constructor(
+    api?: API,
+    private readonly stream: boolean = true,
+  ) {
     this.api = api ?? new API();
     this.statusProcessor = new StatusProcessor();
   }
 
   public async refresh(): Promise<void> {
-    const { components, last_update_at } = await this.api.getStatus();
-
-    this.lastUpdateAt = new Date(last_update_at).toLocaleTimeString("en-US");
+    const status = await this.api.getStatus(this.cursor);
 
-    const incidentsMap =
-      this.statusProcessor.buildEnrichedIncidents(components);
-    this.incidents = Array.from(incidentsMap.values()).flat();
-    this.currentIncident = this.statusProcessor.findActiveIncident(
-      this.incidents,
-    );
-    this.components = this.statusProcessor.buildEnrichedStatusComponent(
-      components,
-      incidentsMap,
-    );
+    if ("components" in status) {
+      this.applySnapshot(status);
+    } else {
+      this.applyDelta(status);
+    }
   }
 
   public async start(): Promise<void> {
@@ -54,9 +75,14 @@ export class StatusService {
 
     this.started = true;
     this.abortController = new AbortController();
+    this.hydrate();
 
     try {
-      await this.runRefreshLoop();
+      if (this.stream && "EventSource" in window) {
+        await this.runLive();
+      } else {
+        await this.runRefreshLoop();
+      }
     } finally {
       this.started = false;
       this.abortController = null;
@@ -98,19 +124,321 @@ export class StatusService {
       const index = target.dataset.index;
 
       if (!index) {
+        this.hoveredDay = null;
         this.setTooltip();
         return;
       }
 
       const day = history[parseInt(index)];
+
+      if (day.incidents || !day.day || !day.monitorId) {
+        this.hoveredDay = null;
+        this.setTooltip(day, event);
+        return;
+      }
+
+      this.loadDayIncidents(day, event);
+    } catch {
+      notyf.error("Something went wrong");
+    }
+  }
+
+  private async loadDayIncidents(day: Days, event: MouseEvent): Promise<void> {
+    const key = `${day.monitorId}/${day.day}`;
+    if (this.hoveredDay === key) return;
+    this.hoveredDay = key;
+
+    const monitor = day.monitorId ? this.findMonitor(day.monitorId) : null;
+    if (!monitor || !day.day) return;
+
+    try {
+      const { incidents } = await this.api.getDayIncidents(monitor.id, day.day);
+      day.incidents = this.statusProcessor.buildDayIncidents(
+        monitor,
+        incidents,
+        day.day,
+      );
+    } catch {
+      notyf.error("Something went wrong");
+      return;
+    }
+
+    if (this.hoveredDay === key) {
       this.setTooltip(day, event);
+    }
+  }
+
+  private applySnapshot({
+    components,
+    cursor,
+    last_update_at,
+  }: StatusComponents): void {
+    this.rawComponents = components;
+    this.cursor = cursor ?? null;
+    this.render(last_update_at);
+  }
+
+  private applyDelta({
+    cursor,
+    groups,
+    monitors,
+    incidents,
+    history,
+    last_update_at,
+  }: StatusDelta): void {
+    this.cursor = cursor;
+
+    groups.forEach((group) => this.applyGroupChange(group));
+    monitors.forEach((monitor) => this.applyMonitorChange(monitor));
+
+    for (const incident of incidents) {
+      const monitor = this.findMonitor(incident.monitor_id);
+      if (!monitor) continue;
+
+      // Resolved incidents are already accounted for in the history days
+      monitor.incidents = monitor.incidents.filter((i) => i.id !== incident.id);
+      if (incident.status === IncidentStatus.OPEN) {
+        monitor.incidents.unshift(incident);
+      }
+    }
+
+    for (const daily of history) {
+      const monitor = this.findMonitor(daily.monitor_id);
+      if (!monitor) continue;
+
+      monitor.history = monitor.history.filter((d) => d.day !== daily.day);
+      monitor.history.push(daily);
+    }
+
+    this.render(last_update_at);
+  }
+
+  private applyGroupChange({ id, name, is_deleted }: GroupChange): void {
+    const index = this.rawComponents.findIndex(
+      (c) => isGroup(c) && c.id === id,
+    );
+    const group = this.rawComponents[index];
+
+    if (is_deleted) {
+      if (index !== -1) this.rawComponents.splice(index, 1);
+    } else if (group && isGroup(group)) {
+      group.name = name;
+    } else {
+      this.rawComponents.unshift({ type: "group", id, name, monitors: [] });
+    }
+  }
+
+  private applyMonitorChange(change: MonitorChange): void {
+    const known = this.findMonitor(change.id);
+    this.removeMonitor(change.id);
+
+    if (change.is_deleted) return;
+
+    if (!known) {
+      // Older incidents and history of a monitor we have not seen are not
+      // part of the delta, so ask for a full snapshot next time.
+      this.cursor = null;
+    }
+
+    this.insertMonitor(change.group_id, {
+      type: "monitor",
+      id: change.id,
+      name: change.name,
+      incidents: known?.incidents ?? [],
+      history: known?.history ?? [],
+      created_at: change.created_at,
+    });
+  }
+
+  private removeMonitor(monitorId: string): void {
+    this.rawComponents = this.rawComponents
+      .filter((component) => isGroup(component) || component.id !== monitorId)
+      .map((component) =>
+        isGroup(component)
+          ? {
+              ...component,
+              monitors: component.monitors.filter((m) => m.id !== monitorId),
+            }
+          : component,
+      );
+  }
+
+  // Monitors are ordered newest first, after the groups when ungrouped.
+  private insertMonitor(
+    groupId: string | null,
+    monitor: MonitorForStatus,
+  ): void {
+    const isOlder = (c: StatusComponent) =>
+      !isGroup(c) &&
+      new Date(c.created_at).getTime() < new Date(monitor.created_at).getTime();
+
+    if (groupId === null) {
+      const index = this.rawComponents.findIndex(isOlder);
+      this.rawComponents.splice(
+        index === -1 ? this.rawComponents.length : index,
+        0,
+        monitor,
+      );
+      return;
+    }
+
+    const group = this.rawComponents.find(
+      (c) => isGroup(c) && c.id === groupId,
+    );
+    if (!group || !isGroup(group)) return;
+
+    const index = group.monitors.findIndex(isOlder);
+    group.monitors.splice(
+      index === -1 ? group.monitors.length : index,
+      0,
+      monitor,
+    );
+  }
+
+  private render(lastUpdateAt: string): void {
+    const components = this.rawComponents;
+
+    this.lastUpdateAt = new Date(lastUpdateAt).toLocaleTimeString("en-US");
+
+    const incidentsMap =
+      this.statusProcessor.buildEnrichedIncidents(components);
+    this.incidents = Array.from(incidentsMap.values()).flat();
+    this.currentIncident = this.statusProcessor.findActiveIncident(
+      this.incidents,
+    );
+    this.components = this.statusProcessor.buildEnrichedStatusComponent(
+      components,
+      incidentsMap,
+    );
+  }
+
+  private findMonitor(monitorId: string): MonitorForStatus | undefined {
+    for (const component of this.rawComponents) {
+      if (!isGroup(component)) {
+        if (component.id === monitorId) return component;
+        continue;
+      }
+
+      const monitor = component.monitors.find((m) => m.id === monitorId);
+      if (monitor) return monitor;
+    }
+    return undefined;
+  }
+
+  // Deltas may overlap the snapshot they follow, so applying them must be
+  // idempotent.
+  private applyIncident({
+    monitor_id,
+    incident,
+    last_update_at,
+  }: IncidentEvent): void {
+    const monitor = this.findMonitor(monitor_id);
+    if (!monitor) return;
+
+    // Only open incidents are kept, resolved ones move into the history
+    const known = monitor.incidents.some((i) => i.id === incident.id);
+    monitor.incidents = monitor.incidents.filter((i) => i.id !== incident.id);
+
+    if (incident.status === IncidentStatus.OPEN) {
+      monitor.incidents.unshift(incident);
+    } else if (known) {
+      this.statusProcessor.foldIncident(monitor, incident);
+    }
+
+    this.render(last_update_at);
+  }
+
+  private applyMonitorRemoved({
+    monitor_id,
+    last_update_at,
+  }: MonitorRemovedEvent): void {
+    this.removeMonitor(monitor_id);
+    this.render(last_update_at);
+  }
+
+  private applyMonitorAdded({
+    group_id,
+    monitor,
+    last_update_at,
+  }: MonitorAddedEvent): void {
+    if (this.findMonitor(monitor.id)) return;
+
+    this.insertMonitor(group_id, monitor);
+    this.render(last_update_at);
+  }
+
+  // The page embeds the snapshot it was rendered with, so the status shows
+  // before the first request completes.
+  private hydrate(): void {
+    const element = document.getElementById(INITIAL_STATUS_ID);
+    if (!element) return;
+
+    try {
+      this.applySnapshot(JSON.parse(element.textContent ?? ""));
     } catch {
       notyf.error("Something went wrong");
+    } finally {
+      element.remove();
     }
   }
 
-  private async runRefreshLoop(): Promise<void> {
+  // A stream that closes for good is replaced by polling, and retried
+  // later with a backoff.
+  private async runLive(): Promise<void> {
+    let retryDelay = STREAM_RETRY_MS;
+
     while (!this.abortController?.signal.aborted) {
+      let connected = false;
+      const end = await this.runStream(() => (connected = true));
+      if (end === "aborted") return;
+
+      retryDelay = connected
+        ? STREAM_RETRY_MS
+        : Math.min(retryDelay * 2, STREAM_RETRY_MAX_MS);
+      await this.runRefreshLoop(Date.now() + retryDelay);
+    }
+  }
+
+  private async runStream(onSnapshot: () => void): Promise<StreamEnd> {
+    const signal = this.abortController?.signal;
+    if (!signal) return "aborted";
+
+    const on =
+      <T>(handler: (data: T) => void) =>
+      (event: MessageEvent<string>) => {
+        try {
+          handler(JSON.parse(event.data));
+        } catch {
+          notyf.error("Something went wrong");
+        }
+      };
+
+    // EventSource reconnects on its own and the server answers every new
+    // connection with a fresh snapshot.
+    return followStream(
+      this.api.openStatusStream(),
+      {
+        snapshot: on<StatusComponents>((data) => {
+          onSnapshot();
+          this.applySnapshot(data);
+        }),
+        incident_opened: on<IncidentEvent>((data) => this.applyIncident(data)),
+        incident_resolved: on<IncidentEvent>((data) =>
+          this.applyIncident(data),
+        ),
+        monitor_added: on<MonitorAddedEvent>((data) =>
+          this.applyMonitorAdded(data),
+        ),
+        monitor_removed: on<MonitorRemovedEvent>((data) =>
+          this.applyMonitorRemoved(data),
+        ),
+      },
+      signal,
+    );
+  }
+
+  private async runRefreshLoop(until = Infinity): Promise<void> {
+    while (!this.abortController?.signal.aborted && Date.now() < until) {
       try {
         await this.refresh();
       } catch {
@@ -135,7 +463,9 @@ let statusInstance: StatusService | null = null;
 
 export function status(): StatusService {
   if (!statusInstance) {
-    statusInstance = new StatusService();
+    // A static export has no stream, it is only polled
+    const exportAPI = ExportAPI.fromPage();
+    statusInstance = new StatusService(exportAPI ?? undefined, !exportAPI);
   }
   return statusInstance;
 }
@@ -50,6 +50,13 @@ export const OPERATIONAL_STATUS = {
 } as const;
 
 export const REFRESH_INTERVAL_MS = 20_000;
+export const STREAM_RETRY_MS = 20_000;
+export const STREAM_RETRY_MAX_MS = 300_000;
+
+export const INITIAL_STATUS_ID = "initial-status";
+
+export const EXPORT_MANIFEST_ID = "status-export";
+export const EXPORT_MANIFEST_URL = "manifest.json";
 
 export const INCIDENT_PRIORITY_ORDER: readonly IncidentType[] = [
   IncidentType.MAJOR_OUTAGE,
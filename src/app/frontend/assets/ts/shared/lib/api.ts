@@ -1,7 +1,9 @@
 import type {
+  DayIncidents,
   GroupForCRUD,
   MonitorForCRUD,
   StatusComponents,
+  StatusDelta,
 } from "@/shared/types/api";
 import type { MonitorForm } from "@/shared/types/monitor";
 
@@ -60,6 +62,10 @@ export class API {
     }
   }
 
+  private ifMatch(version: number): HeadersInit {
+    return { "If-Match": `"${version}"` };
+  }
+
   private serializeMonitor(monitor: MonitorForm) {
     return {
       ...monitor,
@@ -80,12 +86,26 @@ export class API {
     };
   }
 
-  async getStatus(): Promise<StatusComponents> {
-    return this.request<StatusComponents>("/status", {
+  async getStatus(
+    since?: string | null,
+  ): Promise<StatusComponents | StatusDelta> {
+    const query = since ? `?since=${encodeURIComponent(since)}` : "";
+    return this.request<StatusComponents | StatusDelta>(`/status${query}`, {
       method: "GET",
     });
   }
 
+  async getDayIncidents(monitorId: string, day: string): Promise<DayIncidents> {
+    return this.request<DayIncidents>(
+      `/status/${monitorId}/incidents?day=${day}`,
+      { method: "GET" },
+    );
+  }
+
+  openStatusStream(): EventSource {
+    return new EventSource(`${this.baseUrl}/status/stream`);
+  }
+
   async login(username: string, password: string): Promise<void> {
     return this.request(`/${this.adminPath}/login`, {
       method: "POST",
@@ -112,16 +132,18 @@ export class API {
     });
   }
 
-  async updateGroup(id: string, name: string): Promise<GroupForCRUD> {
-    return this.request<GroupForCRUD>(`/${this.adminPath}/groups/${id}`, {
+  async updateGroup(group: GroupForCRUD, name: string): Promise<GroupForCRUD> {
+    return this.request<GroupForCRUD>(`/${this.adminPath}/groups/${group.id}`, {
       method: "PUT",
+      headers: this.ifMatch(group.version),
       body: JSON.stringify({ name }),
     });
   }
 
-  async deleteGroup(id: string): Promise<void> {
-    return this.request<void>(`/${this.adminPath}/groups/${id}`, {
+  async deleteGroup(group: GroupForCRUD): Promise<void> {
+    return this.request<void>(`/${this.adminPath}/groups/${group.id}`, {
       method: "DELETE",
+      headers: this.ifMatch(group.version),
     });
   }
 
@@ -147,18 +169,23 @@ export class API {
   }
 
   async updateMonitor(
-    id: string,
+    current: MonitorForCRUD,
     monitor: MonitorForm,
   ): Promise<MonitorForCRUD> {
-    return this.request<MonitorForCRUD>(`/${this.adminPath}/monitors/${id}`, {
-      method: "PUT",
-      body: JSON.stringify(this.serializeMonitor(monitor)),
-    });
+    return this.request<MonitorForCRUD>(
+      `/${this.adminPath}/monitors/${current.id}`,
+      {
+        method: "PUT",
+        headers: this.ifMatch(current.version),
+        body: JSON.stringify(this.serializeMonitor(monitor)),
+      },
+    );
   }
 
-  async deleteMonitor(id: string): Promise<void> {
-    return this.request<void>(`/${this.adminPath}/monitors/${id}`, {
+  async deleteMonitor(monitor: MonitorForCRUD): Promise<void> {
+    return this.request<void>(`/${this.adminPath}/monitors/${monitor.id}`, {
       method: "DELETE",
+      headers: this.ifMatch(monitor.version),
     });
   }
 }
@@ -0,0 +1,65 @@
+import { API, APIError } from "@/shared/lib/api";
+import { EXPORT_MANIFEST_ID, EXPORT_MANIFEST_URL } from "@/shared/constants";
+import type {
+  DayIncidents,
+  ExportManifest,
+  StatusComponents,
+  StatusDelta,
+} from "@/shared/types/api";
+
+// Reads the status from a static export of the site. Only the manifest
+// keeps its name, so it is the one file polled for changes.
+export class ExportAPI extends API {
+  constructor(private manifest: ExportManifest) {
+    super();
+  }
+
+  static fromPage(): ExportAPI | null {
+    const element = document.getElementById(EXPORT_MANIFEST_ID);
+    if (!element?.textContent) return null;
+
+    return new ExportAPI(JSON.parse(element.textContent));
+  }
+
+  override async getStatus(
+    since?: string | null,
+  ): Promise<StatusComponents | StatusDelta> {
+    this.manifest = await this.fetchFile<ExportManifest>(EXPORT_MANIFEST_URL, {
+      cache: "no-cache",
+    });
+    const { cursor, last_update_at } = this.manifest;
+
+    if (cursor === since) {
+      return {
+        cursor,
+        groups: [],
+        monitors: [],
+        incidents: [],
+        history: [],
+        last_update_at,
+      };
+    }
+
+    return this.fetchFile<StatusComponents>(this.manifest.status);
+  }
+
+  override async getDayIncidents(
+    monitorId: string,
+    day: string,
+  ): Promise<DayIncidents> {
+    const file = this.manifest.incidents[`${monitorId}/${day}`];
+    if (!file) return { day, incidents: [] };
+
+    return this.fetchFile<DayIncidents>(file);
+  }
+
+  private async fetchFile<T>(url: string, options: RequestInit = {}) {
+    const response = await fetch(url, options);
+
+    if (!response.ok) {
+      throw new APIError(response.status, `HTTP ${response.status}`);
+    }
+
+    return response.json() as Promise<T>;
+  }
+}
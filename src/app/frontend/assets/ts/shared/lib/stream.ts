@@ -0,0 +1,36 @@
+export type StreamEnd = "aborted" | "closed";
+
+// Follows an event stream until it is aborted or closed for good. The
+// browser reconnects a dropped stream on its own, but gives up on an error
+// response such as a 503, which leaves the stream closed.
+export function followStream(
+  source: EventSource,
+  listeners: Record<string, (event: MessageEvent<string>) => void>,
+  signal: AbortSignal,
+): Promise<StreamEnd> {
+  return new Promise((resolve) => {
+    const end = (reason: StreamEnd) => {
+      source.close();
+      signal.removeEventListener("abort", onAbort);
+      resolve(reason);
+    };
+    const onAbort = () => end("aborted");
+
+    for (const [event, listener] of Object.entries(listeners)) {
+      source.addEventListener(event, (e) =>
+        listener(e as MessageEvent<string>),
+      );
+    }
+
+    source.addEventListener("error", () => {
+      if (source.readyState === EventSource.CLOSED) end("closed");
+    });
+
+    if (signal.aborted) {
+      end("aborted");
+      return;
+    }
+
+    signal.addEventListener("abort", onAbort);
+  });
+}
@@ -1,5 +1,6 @@
-import { parseISO, startOfDay, endOfDay, subDays, isBefore } from "date-fns";
+import { parseISO, isBefore } from "date-fns";
 import type {
+  DailyStatusForStatus,
   IncidentForStatus,
   MonitorForStatus,
   StatusComponent,
@@ -19,6 +20,7 @@ import { BaseIncident, IncidentStatus } from "@/shared/types/incident";
 
 const HISTORY_DAYS = 30;
 const HISTORY_OFFSET = HISTORY_DAYS - 1;
+const DAY_MS = 24 * 60 * 60 * 1000;
 const LOCALE = "en-US" as const;
 
 const DATE_FORMAT_OPTIONS = {
@@ -155,13 +157,16 @@ export class StatusProcessor {
     });
   }
 
+  // History days are UTC days, matching the server-side rollups.
   private buildHistoryForMonitors(monitors: MonitorForStatus[]): Days[] {
-    const now = this.dateProvider.now();
+    const today = this.utcDayStart(this.dateProvider.now());
 
     return Array.from({ length: HISTORY_DAYS }, (_, dayIndex) => {
-      const day = subDays(now, HISTORY_OFFSET - dayIndex);
-      const dayStart = startOfDay(day);
-      const dayEnd = endOfDay(day);
+      const dayStart = new Date(
+        today.getTime() - (HISTORY_OFFSET - dayIndex) * DAY_MS,
+      );
+      const dayEnd = new Date(dayStart.getTime() + DAY_MS - 1);
+      const day = this.toUtcDay(dayStart);
 
       const hasActiveMonitor = this.hasActiveMonitorOnDay(monitors, dayEnd);
 
@@ -169,13 +174,14 @@ export class StatusProcessor {
         return { color: "bg-empty", index: dayIndex };
       }
 
-      const dayIncidents = this.filterIncidentsByDateRange(
-        monitors,
-        dayStart,
-        dayEnd,
-      );
+      const types = monitors.flatMap((monitor) => [
+        ...monitor.history.filter((d) => d.day === day).map((d) => d.type),
+        ...monitor.incidents
+          .filter((i) => this.isIncidentInDateRange(i, dayStart, dayEnd))
+          .map((i) => i.type),
+      ]);
 
-      if (dayIncidents.length === 0) {
+      if (types.length === 0) {
         return {
           color: "bg-operational",
           index: dayIndex,
@@ -183,19 +189,95 @@ export class StatusProcessor {
         };
       }
 
-      const prioritizedIncidents = this.prioritizeIncidents(
-        dayIncidents,
-        false,
-      );
-
       return {
         index: dayIndex,
-        color: prioritizedIncidents[0].color,
-        incidents: this.sortIncidentsByLatest(prioritizedIncidents, false),
+        color: INCIDENT_CONFIG[this.worstType(types)].color,
+        day,
+        monitorId: monitors.length === 1 ? monitors[0].id : undefined,
       };
     });
   }
 
+  buildDayIncidents(
+    monitor: MonitorForStatus,
+    incidents: IncidentForStatus[],
+    day: string,
+  ): EnrichedIncident[] {
+    const start = parseISO(`${day}T00:00:00Z`);
+    const end = new Date(start.getTime() + DAY_MS - 1);
+
+    const enriched = incidents
+      .map((i) => this.enrichIncident(monitor, i, { start, end }))
+      .filter((e): e is EnrichedIncident => e !== null);
+
+    return this.sortIncidentsByLatest(
+      this.prioritizeIncidents(enriched, false),
+      false,
+    );
+  }
+
+  foldIncident(monitor: MonitorForStatus, incident: IncidentForStatus): void {
+    const start = this.parseDateSafe(incident.created_at);
+    const end = incident.ended_at
+      ? this.parseDateSafe(incident.ended_at)
+      : null;
+    if (!start || !end) return;
+
+    const firstDay = this.toUtcDay(start);
+
+    for (
+      let dayStart = this.utcDayStart(start);
+      dayStart <= end;
+      dayStart = new Date(dayStart.getTime() + DAY_MS)
+    ) {
+      const day = this.toUtcDay(dayStart);
+      const daily = monitor.history.find((d) => d.day === day);
+      const downtime = Math.max(
+        0,
+        Math.min(end.getTime(), dayStart.getTime() + DAY_MS) -
+          Math.max(start.getTime(), dayStart.getTime()),
+      );
+
+      if (!daily) {
+        monitor.history.push(this.newDailyStatus(day, incident, downtime));
+        continue;
+      }
+
+      daily.downtime_seconds += Math.floor(downtime / 1000);
+      daily.incident_count += day === firstDay ? 0 : 1;
+      daily.type = this.worstType([daily.type, incident.type]);
+    }
+  }
+
+  private newDailyStatus(
+    day: string,
+    incident: IncidentForStatus,
+    downtimeMs: number,
+  ): DailyStatusForStatus {
+    return {
+      day,
+      type: incident.type,
+      downtime_seconds: Math.floor(downtimeMs / 1000),
+      incident_count: 1,
+    };
+  }
+
+  private worstType(types: IncidentType[]): IncidentType {
+    return (
+      INCIDENT_PRIORITY_ORDER.find((type) => types.includes(type)) ?? types[0]
+    );
+  }
+
+  private utcDayStart(date: Date): Date {
+    return new Date(
+      Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), date.getUTCDate()),
+    );
+  }
+
+  private toUtcDay(date: Date): string {
+    return date.toISOString().slice(0, 10);
+  }
+
   private hasActiveMonitorOnDay(
     monitors: MonitorForStatus[],
     dayEnd: Date,
@@ -206,21 +288,6 @@ export class StatusProcessor {
     });
   }
 
-  private filterIncidentsByDateRange(
-    monitors: MonitorForStatus[],
-    dayStart: Date,
-    dayEnd: Date,
-  ): EnrichedIncident[] {
-    return monitors.flatMap((monitor) =>
-      monitor.incidents
-        .filter((i) => this.isIncidentInDateRange(i, dayStart, dayEnd))
-        .map((i) =>
-          this.enrichIncident(monitor, i, { start: dayStart, end: dayEnd }),
-        )
-        .filter((e): e is EnrichedIncident => e !== null),
-    );
-  }
-
   private isIncidentInDateRange(
     incident: IncidentForStatus,
     dayStart: Date,
@@ -278,8 +345,7 @@ export class StatusProcessor {
 
     if (!isEndedForTooltip && dateRange) {
       const now = this.dateProvider.now();
-      const isToday =
-        startOfDay(now).getTime() === startOfDay(dateRange.start).getTime();
+      const isToday = this.toUtcDay(now) === this.toUtcDay(dateRange.start);
       isEndedForTooltip = !isToday;
     }
 
@@ -1,13 +1,15 @@
-import { BaseIncident } from "@/shared/types/incident";
+import { BaseIncident, IncidentType } from "@/shared/types/incident";
 import { MonitorForm } from "./monitor";
 
 export interface GroupForCRUD {
   id: string;
   name: string;
+  version: number;
 }
 
 export interface MonitorForCRUD extends MonitorForm {
   id: string;
+  version: number;
 }
 
 export interface IncidentForStatus extends BaseIncident {
@@ -17,11 +19,19 @@ export interface IncidentForStatus extends BaseIncident {
   ended_at: string | null;
 }
 
+export interface DailyStatusForStatus {
+  day: string;
+  type: IncidentType;
+  downtime_seconds: number;
+  incident_count: number;
+}
+
 export interface MonitorForStatus {
   type: string;
   id: string;
   name: string;
   incidents: IncidentForStatus[];
+  history: DailyStatusForStatus[];
   created_at: string;
 }
 
@@ -36,5 +46,67 @@ export type StatusComponent = GroupForStatus | MonitorForStatus;
 
 export interface StatusComponents {
   components: StatusComponent[];
+  cursor?: string | null;
+  last_update_at: string;
+}
+
+export interface GroupChange {
+  id: string;
+  name: string;
+  created_at: string;
+  is_deleted: boolean;
+}
+
+export interface MonitorChange {
+  id: string;
+  name: string;
+  group_id: string | null;
+  created_at: string;
+  is_deleted: boolean;
+}
+
+export interface IncidentChange extends IncidentForStatus {
+  monitor_id: string;
+}
+
+export interface DailyStatusChange extends DailyStatusForStatus {
+  monitor_id: string;
+}
+
+export interface StatusDelta {
+  cursor: string;
+  groups: GroupChange[];
+  monitors: MonitorChange[];
+  incidents: IncidentChange[];
+  history: DailyStatusChange[];
+  last_update_at: string;
+}
+
+export interface ExportManifest {
+  cursor: string;
+  last_update_at: string;
+  status: string;
+  incidents: Record<string, string>;
+}
+
+export interface DayIncidents {
+  day: string;
+  incidents: IncidentForStatus[];
+}
+
+export interface IncidentEvent {
+  monitor_id: string;
+  incident: IncidentForStatus;
+  last_update_at: string;
+}
+
+export interface MonitorAddedEvent {
+  group_id: string | null;
+  monitor: MonitorForStatus;
+  last_update_at: string;
+}
+
+export interface MonitorRemovedEvent {
+  monitor_id: string;
   last_update_at: string;
 }
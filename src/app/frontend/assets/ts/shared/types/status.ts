@@ -27,6 +27,8 @@ export interface Days {
   color: string;
   index: number;
   incidents?: EnrichedIncident[];
+  day?: string;
+  monitorId?: string;
 }
 
 export interface EnrichedMonitor extends MonitorForStatus {
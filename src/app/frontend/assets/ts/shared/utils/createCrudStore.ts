@@ -1,3 +1,4 @@
+import { APIError } from "@/shared/lib/api";
 import { handleApiError } from "@/shared/utils/errorHandler";
 import { createModalState, resetModal } from "@/shared/types/modal";
 
@@ -6,8 +7,8 @@ export type CrudAction = "create" | "update" | "delete";
 export function createCrudStore<TItem, TForm>(config: {
   fetch: () => Promise<TItem[]>;
   create: (data: TForm) => Promise<unknown>;
-  update: (id: string, data: TForm) => Promise<unknown>;
-  delete: (id: string) => Promise<void>;
+  update: (item: TItem, data: TForm) => Promise<unknown>;
+  delete: (item: TItem) => Promise<void>;
   validate?: (data: TForm, action: CrudAction) => boolean;
   modalTitles: Record<CrudAction, { title: string; buttonText: string }>;
   emptyForm: TForm;
@@ -43,6 +44,14 @@ export function createCrudStore<TItem, TForm>(config: {
       }
     },
 
+    selected(): TItem {
+      const item = this.state.items.find(
+        (candidate) => config.getId(candidate) === this.state.selectedId,
+      );
+      if (!item) throw new Error("No selected item");
+      return item;
+    },
+
     cancel() {
       this.state.selectedId = null;
       this.state.form = { ...config.emptyForm };
@@ -68,13 +77,11 @@ export function createCrudStore<TItem, TForm>(config: {
             break;
 
           case "update":
-            if (!this.state.selectedId) throw new Error("No selectedId");
-            await config.update(this.state.selectedId, this.state.form);
+            await config.update(this.selected(), this.state.form);
             break;
 
           case "delete":
-            if (!this.state.selectedId) throw new Error("No selectedId");
-            await config.delete(this.state.selectedId);
+            await config.delete(this.selected());
             break;
 
           default:
@@ -85,6 +92,11 @@ export function createCrudStore<TItem, TForm>(config: {
         this.cancel();
       } catch (error) {
         handleApiError(error);
+
+        // Changed by someone else meanwhile, show the current version
+        if (error instanceof APIError && error.status === 412) {
+          await this.fetch();
+        }
       } finally {
         this.state.modal.isLoading = false;
       }
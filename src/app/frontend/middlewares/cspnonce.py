@@ -1,54 +1,94 @@
 """CSP nonce middleware."""
 
 import secrets
-from collections.abc import Awaitable, Callable
 from typing import ClassVar
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.shared import config
-from app.shared.headers import get_secure_headers
+from app.shared.headers import SecureHeaders
 
 
-class CSPNonceMiddleware(BaseHTTPMiddleware):
-    """Middleware for generating nonce."""
+class CSPNonceMiddleware:
+    """ASGI middleware generating a nonce and securing HTML responses."""
 
     NONCE_LENGTH = 16
-    EXCLUDED_PATHS: ClassVar[set[str]] = {
+    EXCLUDED_PATHS: ClassVar[tuple[str, ...]] = (
         "/docs",
         "/openapi.json",
-    }
+    )
+    # Routes whose responses render no template, bar their error pages
+    NON_HTML_PATHS: ClassVar[tuple[str, ...]] = (
+        "/api",
+        "/static",
+        "/health",
+        "/metrics",
+    )
 
-    async def dispatch(
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize CSP nonce middleware."""
+        self.app = app
+        self._excluded_paths = (
+            self.EXCLUDED_PATHS if config.app.is_development else ()
+        )
+        self._headers = SecureHeaders(https=config.app.https)
+        # Whole path segments only, "/statics" is not under "/static"
+        self._non_html_dirs = tuple(f"{path}/" for path in self.NON_HTML_PATHS)
+
+    async def __call__(
         self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        """Dispatch middleware."""
-        if config.app.is_development and self._is_docs_path(request.url.path):
-            return await call_next(request)
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Process ASGI request."""
+        if scope["type"] != "http" or scope["path"].startswith(
+            self._excluded_paths,
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        nonce = None
 
-        nonce = secrets.token_urlsafe(self.NONCE_LENGTH)
-        request.state.csp_nonce = nonce
+        if not self._is_non_html(scope["path"]):
+            nonce = secrets.token_urlsafe(self.NONCE_LENGTH)
+            scope.setdefault("state", {})["csp_nonce"] = nonce
 
-        response = await call_next(request)
+        async def send_secured(message: Message) -> None:
+            """Apply security headers when an HTML response starts."""
+            if message["type"] == "http.response.start" and self._is_html(
+                message,
+            ):
+                message["headers"] = self._secure(
+                    message["headers"],
+                    nonce or secrets.token_urlsafe(self.NONCE_LENGTH),
+                )
 
-        content_type = response.headers.get("content-type", "").lower()
-        if content_type.startswith("text/html"):
-            self._apply_security_headers(response, nonce)
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_secured)
 
-    def _is_docs_path(self, path: str) -> bool:
-        """Check if path is API documentation."""
+    def _is_non_html(self, path: str) -> bool:
+        """Check whether a path is one of the routes rendering no template."""
+        return path in self.NON_HTML_PATHS or path.startswith(
+            self._non_html_dirs,
+        )
+
+    @staticmethod
+    def _is_html(message: Message) -> bool:
+        """Check whether a response start is of an HTML response."""
         return any(
-            path.startswith(excluded) for excluded in self.EXCLUDED_PATHS
+            key == b"content-type" and value.lower().startswith(b"text/html")
+            for key, value in message["headers"]
         )
 
-    def _apply_security_headers(self, response: Response, nonce: str) -> None:
-        """Apply security headers."""
-        secure_headers: list[tuple[str, str]] = get_secure_headers(nonce)
-        for key, value in secure_headers:
-            response.headers[key] = value
+    def _secure(
+        self,
+        headers: list[tuple[bytes, bytes]],
+        nonce: str,
+    ) -> list[tuple[bytes, bytes]]:
+        """Replace the security headers of a response with ours."""
+        return [
+            *(pair for pair in headers if pair[0] not in self._headers.names),
+            *self._headers.raw(nonce),
+        ]
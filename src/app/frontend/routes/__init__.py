@@ -2,9 +2,14 @@
 
 from fastapi import APIRouter
 
+from app.shared import config
+
 from . import admin, status
 
 router = APIRouter(tags=["Pages"], include_in_schema=False)
 
-router.include_router(status.router)
+# The public status is served from the static export instead
+if config.export.dir is None:
+    router.include_router(status.router)
+
 router.include_router(admin.router)
@@ -5,9 +5,9 @@ from typing import Annotated
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from app.container import Container
+from app.shared.templating import PageCache
 
 router = APIRouter()
 
@@ -16,13 +16,11 @@ router = APIRouter()
 @inject
 async def monitors_page(
     request: Request,
-    jinja: Annotated[Jinja2Templates, Depends(Provide[Container.jinja])],
+    pages: Annotated[PageCache, Depends(Provide[Container.pages])],
 ) -> HTMLResponse:
     """Get monitors page."""
-    return jinja.TemplateResponse(
+    return pages.render(
+        request,
         "admin/monitors/index.html",
-        {
-            "request": request,
-            "current_page": "monitors",
-        },
+        {"current_page": "monitors"},
     )
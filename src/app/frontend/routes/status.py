@@ -3,11 +3,13 @@
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from fastapi import APIRouter, Depends, Request, Response
 
 from app.container import Container
+from app.services.status.snapshot import StatusSnapshotCache
+from app.services.status.version import StatusVersion
+from app.shared.http_cache import cache_headers, etag_matches, not_modified
+from app.shared.templating import PageCache, json_script
 
 router = APIRouter()
 
@@ -16,10 +18,27 @@ router = APIRouter()
 @inject
 async def status_page(
     request: Request,
-    jinja: Annotated[Jinja2Templates, Depends(Provide[Container.jinja])],
-) -> HTMLResponse:
+    pages: Annotated[PageCache, Depends(Provide[Container.pages])],
+    status_version: Annotated[
+        StatusVersion,
+        Depends(Provide[Container.status_version]),
+    ],
+    snapshot_cache: Annotated[
+        StatusSnapshotCache,
+        Depends(Provide[Container.status_snapshot]),
+    ],
+) -> Response:
     """Status page."""
-    return jinja.TemplateResponse(
+    etag = status_version.etag("page")
+
+    if etag_matches(request, etag):
+        return not_modified(etag, private=True)
+
+    snapshot = await snapshot_cache.get()
+
+    return pages.render(
+        request,
         "status/index.html",
-        {"request": request},
+        slots={"initial_status": json_script(snapshot)},
+        headers=cache_headers(etag, private=True),
     )
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from app.monitoring.manager import WorkerManager
     from app.monitoring.workers.base import BaseWorker
     from app.repositories.uow import SqlAlchemyUnitOfWork
+    from app.services.status.broadcaster import StatusBroadcaster
 
 from app.monitoring.workers.base import WorkerConfig
 from app.monitoring.workers.http import HTTPWorker
@@ -41,10 +42,12 @@ class WorkerScheduler:
         self,
         manager: WorkerManager,
         uow_factory: Callable[[], SqlAlchemyUnitOfWork],
+        broadcaster: StatusBroadcaster,
     ) -> None:
         """Initialize worker scheduler."""
         self._manager = manager
         self._uow_factory = uow_factory
+        self._broadcaster = broadcaster
 
     async def initialize(self) -> None:
         """Initialize workers when app starts."""
@@ -149,4 +152,4 @@ class WorkerScheduler:
         worker_type = self._map_worker_type(monitor.type)
         config = self._map_config(monitor)
 
-        return worker_type(config, self._uow_factory)
+        return worker_type(config, self._uow_factory, self._broadcaster)
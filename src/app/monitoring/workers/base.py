@@ -10,9 +10,10 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from app.database.models.incident import IncidentModel
-from app.enums import IncidentStatus, IncidentType
+from app.enums import IncidentType
 from app.repositories.uow import SqlAlchemyUnitOfWork
+from app.services.status import rollup
+from app.services.status.broadcaster import StatusBroadcaster
 
 logger = logging.getLogger(__name__)
 
@@ -49,12 +50,14 @@ class BaseWorker(ABC):
         self,
         config: WorkerConfig,
         uow_factory: Callable[[], SqlAlchemyUnitOfWork],
+        broadcaster: StatusBroadcaster,
     ) -> None:
         """Initialize worker."""
         self._config = config
         self._task: asyncio.Task | None = None
         self._stop_event = asyncio.Event()
         self._uow_factory = uow_factory
+        self._broadcaster = broadcaster
         self._lock = asyncio.Lock()
 
     @abstractmethod
@@ -75,45 +78,34 @@ class BaseWorker(ABC):
     async def upsert_incident(self, incident: Incident) -> None:
         """Create or update incident."""
         async with self._uow_factory() as uow:
-            open_incident = await uow.incidents.find_open(
+            transition = await uow.incidents.transition(
                 self._config.id,
-                with_for_update=True,
+                incident.type,
+                incident.message,
+                now=datetime.now(UTC),
             )
 
-            if not open_incident:
-                incident_model = self._build_incident_model(incident, None)
-                await uow.incidents.save(incident_model)
-                return
-
-            is_same_incident = (
-                incident.message == open_incident.message
-                and incident.type == open_incident.type
-            )
-
-            if not is_same_incident:
-                await self._resolve_incident(uow, open_incident)
-                incident_model = self._build_incident_model(incident, None)
-
-            else:
-                incident_model = self._build_incident_model(
-                    incident,
-                    open_incident.id,
-                )
+        if transition.resolved is not None:
+            self._broadcaster.incident_resolved(transition.resolved)
 
-            await uow.incidents.save(incident_model)
+        if transition.opened is not None:
+            self._broadcaster.incident_opened(transition.opened)
 
     async def resolve_incident(self) -> None:
         """Resolve incident."""
         async with self._uow_factory() as uow:
-            open_incident = await uow.incidents.find_open(
+            resolved_incident = await uow.incidents.resolve_open(
                 self._config.id,
-                with_for_update=True,
+                now=datetime.now(UTC),
             )
 
-            if open_incident:
-                await self._resolve_incident(uow, open_incident)
+            if resolved_incident is not None:
+                await uow.daily_status.add(rollup.resolved(resolved_incident))
 
-                logger.debug("Incident ID=%s resolved", open_incident.id)
+                logger.debug("Incident ID=%s resolved", resolved_incident.id)
+
+        if resolved_incident is not None:
+            self._broadcaster.incident_resolved(resolved_incident)
 
     async def start(self) -> None:
         """Start worker."""
@@ -182,27 +174,3 @@ class BaseWorker(ABC):
         except asyncio.CancelledError:
             logger.debug("Worker ID=%s cancelled", self._config.id)
             raise
-
-    def _build_incident_model(
-        self,
-        incident: Incident,
-        incident_id: UUID | None,
-    ) -> IncidentModel:
-        """Build incident model."""
-        return IncidentModel(
-            id=incident_id,
-            monitor_id=self._config.id,
-            message=incident.message,
-            type=incident.type,
-        )
-
-    async def _resolve_incident(
-        self,
-        uow: SqlAlchemyUnitOfWork,
-        open_incident: IncidentModel,
-    ) -> None:
-        """Change incident status to resolved."""
-        open_incident.status = IncidentStatus.RESOLVED
-        open_incident.ended_at = datetime.now(UTC)
-
-        await uow.incidents.save(open_incident)
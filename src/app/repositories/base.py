@@ -0,0 +1,126 @@
+"""Shared repository statements."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm.attributes import instance_state
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import Table
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+ModelT = TypeVar("ModelT")
+
+POPULATE_EXISTING = {"populate_existing": True}
+
+
+class StaleVersionError(Exception):
+    """Row changed since the version an update was based on."""
+
+
+def is_sqlite(session: AsyncSession) -> bool:
+    """Check if a session runs against SQLite."""
+    return session.get_bind().dialect.name == "sqlite"
+
+
+def insert(
+    session: AsyncSession,
+    model: type[Any],
+) -> postgresql.Insert | sqlite.Insert:
+    """Start an ``INSERT`` with the ``ON CONFLICT`` clause of the dialect."""
+    if is_sqlite(session):
+        return sqlite.insert(model)
+
+    return postgresql.insert(model)
+
+
+def column_values(instance: object) -> dict[str, Any]:
+    """Column values set on a model instance.
+
+    Server-generated columns are left out, as are unset values of columns
+    with a Python-side default so that the default applies on insert.
+    """
+    state = instance_state(instance)
+
+    return {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+        and attr.columns[0].server_default is None
+        and not (
+            state.dict[attr.key] is None
+            and attr.columns[0].default is not None
+        )
+    }
+
+
+async def upsert(
+    session: AsyncSession,
+    model: type[ModelT],
+    instances: Sequence[ModelT],
+) -> list[ModelT]:
+    """Insert or update models by primary key, returning the stored rows.
+
+    Rows setting the same columns share one ``INSERT ... ON CONFLICT DO
+    UPDATE ... RETURNING`` statement, only those columns are updated.
+    Models partitioned on Postgres have no unique primary key to resolve
+    conflicts on and are refused.
+    """
+    mapper = class_mapper(model)
+
+    table = cast("Table", mapper.local_table)
+
+    if table.dialect_options["postgresql"]["partition_by"]:
+        msg = f"{model.__name__} is partitioned and cannot be upserted"
+        raise TypeError(msg)
+
+    primary_key = {
+        attr.key for attr in mapper.column_attrs if attr.columns[0].primary_key
+    }
+    on_update = {
+        attr.key: attr.columns[0].onupdate
+        for attr in mapper.column_attrs
+        if attr.columns[0].onupdate is not None
+    }
+
+    batches: dict[frozenset[str], list[tuple[int, dict[str, Any]]]] = {}
+    for index, instance in enumerate(instances):
+        values = column_values(instance)
+        batches.setdefault(frozenset(values), []).append((index, values))
+
+    saved: list[Any] = [None] * len(instances)
+
+    for columns, rows in batches.items():
+        stmt = insert(session, model)
+        set_: dict[str, Any] = {
+            key: stmt.excluded[key]
+            for key in (columns | on_update.keys()) - primary_key
+        }
+        # SQL expressions, like a version bump, apply to the stored row
+        set_.update(
+            {
+                key: onupdate.arg
+                for key, onupdate in on_update.items()
+                if onupdate.is_clause_element
+            },
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(primary_key),
+            set_=set_,
+        ).returning(model, sort_by_parameter_order=True)
+
+        result = await session.scalars(
+            stmt,
+            [values for _, values in rows],
+            execution_options=POPULATE_EXISTING,
+        )
+
+        for (index, _), stored in zip(rows, result, strict=True):
+            saved[index] = stored
+
+    return saved
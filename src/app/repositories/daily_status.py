@@ -0,0 +1,89 @@
+"""Monitor daily status repository implementation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import case
+
+from app.database.models.daily_status import MonitorDailyStatusModel
+from app.enums import IncidentType
+from app.repositories.base import insert
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
+
+    from app.services.status.rollup import DailyStatus
+
+
+class MonitorDailyStatusRepository:
+    """Monitor daily status repository."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the monitor daily status repository."""
+        self._session = session
+
+    async def add(self, rollups: Sequence[DailyStatus]) -> None:
+        """Add rollups to the stored daily totals.
+
+        Each monitor and day may appear only once, see ``rollup.combine``.
+        """
+        if not rollups:
+            return
+
+        stmt = insert(self._session, MonitorDailyStatusModel).values(
+            [
+                {
+                    "monitor_id": rollup.monitor_id,
+                    "day": rollup.day,
+                    "worst_type": rollup.worst_type,
+                    "downtime_seconds": rollup.downtime_seconds,
+                    "incident_count": rollup.incident_count,
+                }
+                for rollup in rollups
+            ],
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                MonitorDailyStatusModel.monitor_id,
+                MonitorDailyStatusModel.day,
+            ],
+            set_={
+                "worst_type": case(
+                    (
+                        _severity(stmt.excluded.worst_type)
+                        > _severity(MonitorDailyStatusModel.worst_type),
+                        stmt.excluded.worst_type,
+                    ),
+                    else_=MonitorDailyStatusModel.worst_type,
+                ),
+                "downtime_seconds": (
+                    MonitorDailyStatusModel.downtime_seconds
+                    + stmt.excluded.downtime_seconds
+                ),
+                "incident_count": (
+                    MonitorDailyStatusModel.incident_count
+                    + stmt.excluded.incident_count
+                ),
+            },
+        )
+
+        await self._session.execute(stmt)
+
+
+def _severity(
+    incident_type: (
+        ColumnElement[IncidentType] | InstrumentedAttribute[IncidentType]
+    ),
+) -> ColumnElement[int]:
+    """Rank of an incident type, types are declared least to most severe."""
+    return case(
+        *(
+            (incident_type == member, rank)
+            for rank, member in enumerate(IncidentType)
+        ),
+    )
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, select, update
 
 from app.database.models.group import MonitorGroupModel
+from app.repositories.base import (
+    POPULATE_EXISTING,
+    StaleVersionError,
+    upsert,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
     from uuid import UUID
 
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -50,11 +56,54 @@ class MonitorGroupRepository:
         )
         return list(result.scalars().all())
 
-    async def save(self, monitor: MonitorGroupModel) -> MonitorGroupModel:
-        """Save a monitor."""
-        persistent_model = await self._session.merge(monitor)
+    async def save(self, group: MonitorGroupModel) -> MonitorGroupModel:
+        """Insert or update a group."""
+        [saved] = await upsert(self._session, MonitorGroupModel, [group])
+        return saved
 
-        await self._session.flush()
-        await self._session.refresh(persistent_model)
+    async def save_all(
+        self,
+        groups: Sequence[MonitorGroupModel],
+    ) -> list[MonitorGroupModel]:
+        """Insert or update many groups."""
+        return await upsert(self._session, MonitorGroupModel, groups)
+
+    async def update(
+        self,
+        group_id: UUID,
+        values: Mapping[str, Any],
+        *,
+        version: int | None = None,
+    ) -> MonitorGroupModel | None:
+        """Update a group, ``None`` if it does not exist.
+
+        Given a ``version``, the group is only updated if it still has
+        that version, raises StaleVersionError otherwise.
+        """
+        stmt = (
+            update(MonitorGroupModel)
+            .where(
+                MonitorGroupModel.id == group_id,
+                MonitorGroupModel.is_deleted == False,  # noqa: E712
+            )
+            .values(**values)
+            .returning(MonitorGroupModel)
+        )
+
+        if version is not None:
+            stmt = stmt.where(MonitorGroupModel.version == version)
+
+        result = await self._session.scalars(
+            stmt,
+            execution_options=POPULATE_EXISTING,
+        )
+        updated = result.one_or_none()
+
+        if (
+            updated is None
+            and version is not None
+            and await self.find_by_id(group_id)
+        ):
+            raise StaleVersionError
 
-        return persistent_model
+        return updated
@@ -2,19 +2,54 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+from dataclasses import dataclass
+from datetime import UTC, datetime, time, timedelta
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
-from sqlalchemy import desc, select
+from sqlalchemy import (
+    bindparam,
+    delete,
+    desc,
+    insert,
+    or_,
+    select,
+    text,
+    update,
+)
 
 from app.database.models.incident import IncidentModel
 from app.enums import IncidentStatus
+from app.repositories.base import POPULATE_EXISTING, column_values, is_sqlite
+from app.repositories.daily_status import MonitorDailyStatusRepository
+from app.services.status import rollup
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import date
     from uuid import UUID
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from app.enums import IncidentType
+
+# Open incidents live in the incidents_open partition, whose unique index
+# on monitor_id arbitrates concurrent writers. The steps run in order in a
+# database function, which adds the incidents to the daily status too.
+_TRANSITION = text(
+    "SELECT id, monitor_id, type, status, message, created_at, ended_at, "
+    "revision FROM transition_incident(:id, :monitor_id, :type, :message, "
+    ":now)",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class IncidentTransition:
+    """Incidents changed by a transition of a monitor."""
+
+    resolved: IncidentModel | None = None
+    opened: IncidentModel | None = None
+
 
 class IncidentRepository:
     """Incident repository."""
@@ -23,59 +58,203 @@ class IncidentRepository:
         """Initialize the incident repository."""
         self._session = session
 
-    async def find_by_id(
+    async def find_open(self, monitor_id: UUID) -> IncidentModel | None:
+        """Find the open incident of a monitor."""
+        result = await self._session.execute(
+            select(IncidentModel).where(
+                IncidentModel.monitor_id == monitor_id,
+                IncidentModel.status == IncidentStatus.OPEN,
+            ),
+        )
+        return result.scalar_one_or_none()
+
+    async def find_by_day(
         self,
-        incident_id: UUID,
-        *,
-        with_for_update: bool = False,
-    ) -> IncidentModel | None:
-        """Find a incident by ID."""
-        stmt = select(IncidentModel).where(IncidentModel.id == incident_id)
+        monitor_id: UUID,
+        day: date,
+    ) -> list[IncidentModel]:
+        """Find incidents of a monitor overlapping a UTC day."""
+        day_start = datetime.combine(day, time.min, UTC)
+        day_end = day_start + timedelta(days=1)
 
-        if with_for_update:
-            stmt = stmt.with_for_update()
+        stmt = (
+            select(IncidentModel)
+            .where(
+                IncidentModel.monitor_id == monitor_id,
+                IncidentModel.created_at < day_end,
+                or_(
+                    IncidentModel.ended_at.is_(None),
+                    IncidentModel.ended_at >= day_start,
+                ),
+            )
+            .order_by(desc(IncidentModel.created_at))
+        )
 
         result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return list(result.scalars().all())
 
-    async def find_all(
+    async def find_since(self, start: datetime) -> list[IncidentModel]:
+        """Find incidents open at or after a time."""
+        stmt = (
+            select(IncidentModel)
+            .where(
+                or_(
+                    IncidentModel.ended_at.is_(None),
+                    IncidentModel.ended_at >= start,
+                ),
+            )
+            .order_by(desc(IncidentModel.created_at))
+        )
+
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def add(self, incident: IncidentModel) -> IncidentModel:
+        """Insert an incident."""
+        [added] = await self.add_all([incident])
+        return added
+
+    async def add_all(
         self,
-        *,
-        last_days: int | None = None,
+        incidents: Sequence[IncidentModel],
     ) -> list[IncidentModel]:
-        """Find all incidents."""
-        stmt = select(IncidentModel).order_by(desc(IncidentModel.created_at))
+        """Insert many incidents in one statement."""
+        if not incidents:
+            return []
+
+        result = await self._session.scalars(
+            insert(IncidentModel).returning(
+                IncidentModel,
+                sort_by_parameter_order=True,
+            ),
+            [column_values(incident) for incident in incidents],
+        )
+        return list(result.all())
 
-        if last_days:
-            cutoff = datetime.now(UTC) - timedelta(days=last_days)
-            stmt = stmt.where(IncidentModel.created_at > cutoff)
+    async def transition(
+        self,
+        monitor_id: UUID,
+        incident_type: IncidentType,
+        message: str,
+        *,
+        now: datetime,
+    ) -> IncidentTransition:
+        """Open an incident of a monitor, resolving a different open one.
 
-        result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        Both incidents are added to the daily status too. On Postgres this
+        is a single statement, run in autocommit when it starts the
+        session's transaction, without BEGIN and COMMIT round trips.
+        Nothing changes when the same incident is already open, or when a
+        concurrent writer opened one first.
+        """
+        if is_sqlite(self._session):
+            return await self._transition_sqlite(
+                monitor_id,
+                incident_type,
+                message,
+                now=now,
+            )
+
+        if not self._session.in_transaction():
+            await self._session.connection(
+                execution_options={"isolation_level": "AUTOCOMMIT"},
+            )
+
+        columns = IncidentModel.__table__.c
+        stmt = _TRANSITION.bindparams(
+            bindparam("id", uuid4(), type_=columns.id.type),
+            bindparam("monitor_id", monitor_id, type_=columns.monitor_id.type),
+            bindparam("type", incident_type, type_=columns.type.type),
+            bindparam("message", message, type_=columns.message.type),
+            bindparam("now", now, type_=columns.created_at.type),
+        ).columns(*columns)
+
+        result = await self._session.scalars(
+            select(IncidentModel).from_statement(stmt),
+            execution_options=POPULATE_EXISTING,
+        )
+        incidents = {incident.status: incident for incident in result}
+
+        return IncidentTransition(
+            resolved=incidents.get(IncidentStatus.RESOLVED),
+            opened=incidents.get(IncidentStatus.OPEN),
+        )
 
-    async def find_open(
+    async def resolve_open(
         self,
         monitor_id: UUID,
         *,
-        with_for_update: bool = False,
+        now: datetime,
     ) -> IncidentModel | None:
-        """Find all open incidents."""
-        stmt = select(IncidentModel).where(
-            IncidentModel.monitor_id == monitor_id,
-            IncidentModel.status == IncidentStatus.OPEN,
+        """Resolve the open incident of a monitor, ``None`` without one."""
+        result = await self._session.scalars(
+            update(IncidentModel)
+            .where(
+                IncidentModel.monitor_id == monitor_id,
+                IncidentModel.status == IncidentStatus.OPEN,
+            )
+            .values(status=IncidentStatus.RESOLVED, ended_at=now)
+            .returning(IncidentModel),
+            execution_options=POPULATE_EXISTING,
         )
+        return result.one_or_none()
 
-        if with_for_update:
-            stmt = stmt.with_for_update()
+    async def delete_resolved(self, *, ended_before: datetime) -> int:
+        """Delete incidents resolved before a time, returning their count."""
+        result = await self._session.execute(
+            delete(IncidentModel).where(
+                IncidentModel.status == IncidentStatus.RESOLVED,
+                IncidentModel.ended_at < ended_before,
+            ),
+        )
+        return result.rowcount  # type: ignore[attr-defined]
 
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+    async def _transition_sqlite(
+        self,
+        monitor_id: UUID,
+        incident_type: IncidentType,
+        message: str,
+        *,
+        now: datetime,
+    ) -> IncidentTransition:
+        """Run a transition step by step, SQLite has no writable CTEs.
 
-    async def save(self, monitor: IncidentModel) -> IncidentModel:
-        """Save a incident."""
-        persistent_model = await self._session.merge(monitor)
+        The first statement takes the database write lock, so the open
+        incident cannot change before the transaction ends.
+        """
+        result = await self._session.scalars(
+            update(IncidentModel)
+            .where(
+                IncidentModel.monitor_id == monitor_id,
+                IncidentModel.status == IncidentStatus.OPEN,
+                or_(
+                    IncidentModel.type != incident_type,
+                    IncidentModel.message != message,
+                ),
+            )
+            .values(status=IncidentStatus.RESOLVED, ended_at=now)
+            .returning(IncidentModel),
+            execution_options=POPULATE_EXISTING,
+        )
+        resolved = result.one_or_none()
+
+        if resolved is None and await self.find_open(monitor_id):
+            return IncidentTransition()
 
-        await self._session.flush()
-        await self._session.refresh(persistent_model)
+        opened = await self.add(
+            IncidentModel(
+                monitor_id=monitor_id,
+                type=incident_type,
+                message=message,
+                created_at=now,
+            ),
+        )
+        rollups = rollup.opened(opened)
 
-        return persistent_model
+        if resolved is not None:
+            rollups += rollup.resolved(resolved)
+
+        await MonitorDailyStatusRepository(self._session).add(
+            rollup.combine(rollups),
+        )
+        return IncidentTransition(resolved=resolved, opened=opened)
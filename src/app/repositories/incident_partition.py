@@ -0,0 +1,179 @@
+"""Incident partition repository implementation."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, cast
+
+from sqlalchemy import text
+
+from app.repositories.base import is_sqlite
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from asyncpg import Connection
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+PARENT = "incidents_resolved"
+PREFIX = f"{PARENT}_"
+DEFAULT = f"{PREFIX}default"
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month ``months`` after the month of a date."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+@dataclass(slots=True, frozen=True)
+class IncidentPartition:
+    """Partition of the incidents resolved in one UTC month."""
+
+    month: date
+
+    @property
+    def name(self) -> str:
+        """Partition table name."""
+        return f"{PREFIX}{self.month:%Y_%m}"
+
+    @classmethod
+    def from_name(cls, name: str) -> IncidentPartition:
+        """Create an IncidentPartition from its table name."""
+        year, month = name.removeprefix(PREFIX).split("_")
+        return cls(month=date(int(year), int(month), 1))
+
+
+class IncidentPartitionRepository:
+    """Monthly partitions of resolved incidents."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the incident partition repository."""
+        self._session = session
+
+    @property
+    def is_supported(self) -> bool:
+        """Check if the database partitions incidents, SQLite does not."""
+        return not is_sqlite(self._session)
+
+    async def lock(self) -> None:
+        """Wait for other instances to finish maintaining partitions.
+
+        The lock is held until the end of the transaction.
+        """
+        await self._session.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:parent))"),
+            {"parent": PARENT},
+        )
+
+    async def exists(self, partition: IncidentPartition) -> bool:
+        """Check if a partition is attached."""
+        result = await self._session.execute(
+            text(
+                "SELECT EXISTS (SELECT FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:parent AS regclass) "
+                "AND c.relname = :name)",
+            ),
+            {"parent": PARENT, "name": partition.name},
+        )
+        return bool(result.scalar())
+
+    async def find_all(self) -> list[IncidentPartition]:
+        """Find attached monthly partitions, oldest first."""
+        result = await self._session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:parent AS regclass) "
+                "AND c.relname <> :default "
+                "ORDER BY c.relname",
+            ),
+            {"parent": PARENT, "default": DEFAULT},
+        )
+        return [IncidentPartition.from_name(name) for name in result.scalars()]
+
+    async def find_default_months(self) -> list[date]:
+        """Find months with incidents in the default partition."""
+        result = await self._session.execute(
+            text(
+                "SELECT DISTINCT "
+                "date_trunc('month', ended_at AT TIME ZONE 'UTC')::date "
+                "FROM incidents_resolved_default "
+                "WHERE ended_at IS NOT NULL",
+            ),
+        )
+        return list(result.scalars())
+
+    async def create(self, month: date) -> IncidentPartition:
+        """Create the partition of a month unless it exists.
+
+        Incidents of the month in the default partition are moved into
+        it, the partition could not be created over them otherwise.
+        """
+        partition = IncidentPartition(month=month.replace(day=1))
+
+        if await self.exists(partition):
+            return partition
+
+        lower = f"{partition.month} 00:00:00+00"
+        upper = f"{add_months(partition.month, 1)} 00:00:00+00"
+
+        await self._session.execute(
+            text(
+                "CREATE TEMPORARY TABLE incidents_moved "
+                "(LIKE incidents_resolved_default)",
+            ),
+        )
+        await self._session.execute(
+            text(
+                "WITH moved AS (DELETE FROM incidents_resolved_default "
+                "WHERE ended_at >= CAST(:lower AS timestamptz) "
+                "AND ended_at < CAST(:upper AS timestamptz) "
+                "RETURNING *) "
+                "INSERT INTO incidents_moved SELECT * FROM moved",
+            ),
+            {"lower": lower, "upper": upper},
+        )
+        await self._session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {partition.name} "
+                f"PARTITION OF {PARENT} (PRIMARY KEY (id)) "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')",
+            ),
+        )
+        await self._session.execute(
+            text("INSERT INTO incidents_resolved TABLE incidents_moved"),
+        )
+        await self._session.execute(text("DROP TABLE incidents_moved"))
+        return partition
+
+    async def export(
+        self,
+        partition: IncidentPartition,
+        output: Callable[[bytes], Awaitable[None]],
+    ) -> None:
+        """Stream the rows of a partition as CSV."""
+        # A month of incidents may outlast the workload's statement timeout
+        await self._session.execute(text("SET LOCAL statement_timeout = 0"))
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver = cast("Connection", raw_connection.driver_connection)
+
+        await driver.copy_from_table(
+            partition.name,
+            output=output,
+            format="csv",
+            header=True,
+        )
+
+    async def detach(self, partition: IncidentPartition) -> None:
+        """Detach a partition, keeping it as a standalone table."""
+        await self._session.execute(
+            text(f"ALTER TABLE {PARENT} DETACH PARTITION {partition.name}"),
+        )
+
+    async def drop(self, partition: IncidentPartition) -> None:
+        """Drop a detached partition."""
+        await self._session.execute(text(f"DROP TABLE {partition.name}"))
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, select, update
 
 from app.database.models.monitor import MonitorModel
+from app.repositories.base import (
+    POPULATE_EXISTING,
+    StaleVersionError,
+    upsert,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
     from uuid import UUID
 
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -63,10 +69,53 @@ class MonitorRepository:
         return list(result.scalars().all())
 
     async def save(self, monitor: MonitorModel) -> MonitorModel:
-        """Save a monitor."""
-        persistent_model = await self._session.merge(monitor)
+        """Insert or update a monitor."""
+        [saved] = await upsert(self._session, MonitorModel, [monitor])
+        return saved
 
-        await self._session.flush()
-        await self._session.refresh(persistent_model)
+    async def save_all(
+        self,
+        monitors: Sequence[MonitorModel],
+    ) -> list[MonitorModel]:
+        """Insert or update many monitors."""
+        return await upsert(self._session, MonitorModel, monitors)
+
+    async def update(
+        self,
+        monitor_id: UUID,
+        values: Mapping[str, Any],
+        *,
+        version: int | None = None,
+    ) -> MonitorModel | None:
+        """Update a monitor, ``None`` if it does not exist.
+
+        Given a ``version``, the monitor is only updated if it still has
+        that version, raises StaleVersionError otherwise.
+        """
+        stmt = (
+            update(MonitorModel)
+            .where(
+                MonitorModel.id == monitor_id,
+                MonitorModel.is_deleted == False,  # noqa: E712
+            )
+            .values(**values)
+            .returning(MonitorModel)
+        )
+
+        if version is not None:
+            stmt = stmt.where(MonitorModel.version == version)
+
+        result = await self._session.scalars(
+            stmt,
+            execution_options=POPULATE_EXISTING,
+        )
+        updated = result.one_or_none()
+
+        if (
+            updated is None
+            and version is not None
+            and await self.find_by_id(monitor_id)
+        ):
+            raise StaleVersionError
 
-        return persistent_model
+        return updated
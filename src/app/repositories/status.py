@@ -0,0 +1,464 @@
+"""Public status read repository implementation."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import desc, or_, select
+
+from app.database.functions import json_array_agg, status_cursor
+from app.database.models.daily_status import MonitorDailyStatusModel
+from app.database.models.group import MonitorGroupModel
+from app.database.models.incident import IncidentModel
+from app.database.models.monitor import MonitorModel
+from app.enums import IncidentStatus, IncidentType
+from app.repositories.base import is_sqlite
+from app.services.status.rollup import DailyStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import Select
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
+
+
+@dataclass(slots=True, frozen=True)
+class StatusIncidentRow:
+    """Incident of the public status."""
+
+    id: UUID
+    monitor_id: UUID
+    type: IncidentType
+    message: str
+    created_at: datetime
+    status: IncidentStatus = IncidentStatus.OPEN
+    ended_at: datetime | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class StatusMonitorRow:
+    """Monitor of the public status."""
+
+    id: UUID
+    name: str
+    created_at: datetime
+    incidents: list[StatusIncidentRow]
+    history: list[DailyStatus]
+
+
+@dataclass(slots=True, frozen=True)
+class StatusGroupRow:
+    """Monitor group of the public status."""
+
+    id: UUID
+    name: str
+    monitors: list[StatusMonitorRow]
+
+
+@dataclass(slots=True, frozen=True)
+class StatusComponents:
+    """Public status as of a revision."""
+
+    revision: int
+    components: list[StatusGroupRow | StatusMonitorRow]
+
+
+@dataclass(slots=True, frozen=True)
+class ChangedGroupRow:
+    """Group written after a revision."""
+
+    id: UUID
+    name: str
+    created_at: datetime
+    is_deleted: bool
+
+
+@dataclass(slots=True, frozen=True)
+class ChangedMonitorRow:
+    """Monitor written after a revision."""
+
+    id: UUID
+    name: str
+    group_id: UUID | None
+    created_at: datetime
+    is_deleted: bool
+
+
+@dataclass(slots=True, frozen=True)
+class StatusChanges:
+    """Writes to the public status between two revisions."""
+
+    revision: int
+    groups: list[ChangedGroupRow]
+    monitors: list[ChangedMonitorRow]
+    incidents: list[StatusIncidentRow]
+    history: list[DailyStatus]
+    open_incidents: list[StatusIncidentRow]
+    open_history: list[DailyStatus]
+
+
+class StatusReadRepository:
+    """Read-only access to the public status."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the status read repository."""
+        self._session = session
+
+    async def find_components(
+        self,
+        *,
+        last_days: int,
+    ) -> StatusComponents:
+        """Find groups and monitors with open incidents and daily history.
+
+        Everything is fetched in a single statement: one row per monitor
+        (or empty group), with its open incidents and the rollups of the
+        last days aggregated to JSON by the database. Each row carries the
+        cursor of the snapshot, a status without components still gets
+        one row for it.
+        """
+        await self._begin_snapshot()
+        since = datetime.now(UTC).date() - timedelta(days=last_days - 1)
+
+        groups = (
+            select(
+                MonitorGroupModel.id,
+                MonitorGroupModel.name,
+                MonitorGroupModel.created_at,
+            )
+            .where(MonitorGroupModel.is_deleted == False)  # noqa: E712
+            .cte("g")
+        )
+        monitors = (
+            select(
+                MonitorModel.id,
+                MonitorModel.name,
+                MonitorModel.group_id,
+                MonitorModel.created_at,
+            )
+            .where(MonitorModel.is_deleted == False)  # noqa: E712
+            .cte("m")
+        )
+        incidents = (
+            select(
+                IncidentModel.monitor_id,
+                json_array_agg(
+                    IncidentModel.id,
+                    IncidentModel.type,
+                    IncidentModel.message,
+                    IncidentModel.created_at,
+                ).label("incidents"),
+            )
+            .where(IncidentModel.status == IncidentStatus.OPEN)
+            .group_by(IncidentModel.monitor_id)
+            .cte("i")
+        )
+        history = (
+            select(
+                MonitorDailyStatusModel.monitor_id,
+                json_array_agg(
+                    MonitorDailyStatusModel.day,
+                    MonitorDailyStatusModel.worst_type,
+                    MonitorDailyStatusModel.downtime_seconds,
+                    MonitorDailyStatusModel.incident_count,
+                ).label("history"),
+            )
+            .where(MonitorDailyStatusModel.day >= since)
+            .group_by(MonitorDailyStatusModel.monitor_id)
+            .cte("h")
+        )
+
+        cursor = select(status_cursor().label("cursor")).cte("c")
+
+        stmt = (
+            select(
+                cursor.c.cursor,
+                groups.c.id,
+                groups.c.name,
+                monitors.c.id,
+                monitors.c.name,
+                monitors.c.created_at,
+                incidents.c.incidents,
+                history.c.history,
+            )
+            .select_from(
+                cursor.outerjoin(
+                    groups.join(
+                        monitors,
+                        monitors.c.group_id == groups.c.id,
+                        full=True,
+                    )
+                    .outerjoin(
+                        incidents,
+                        incidents.c.monitor_id == monitors.c.id,
+                    )
+                    .outerjoin(
+                        history,
+                        history.c.monitor_id == monitors.c.id,
+                    ),
+                    # Monitors of deleted groups are not shown
+                    or_(
+                        monitors.c.group_id.is_(None),
+                        groups.c.id.isnot(None),
+                    ),
+                ),
+            )
+            .order_by(
+                desc(groups.c.created_at).nulls_last(),
+                groups.c.id,
+                desc(monitors.c.created_at),
+            )
+        )
+
+        result = await self._session.execute(stmt)
+        rows = result.tuples().all()
+
+        return StatusComponents(
+            revision=rows[0][0],
+            components=self._build_components([row[1:] for row in rows]),
+        )
+
+    async def find_changes(
+        self,
+        since: int,
+        *,
+        last_days: int,
+        limit: int,
+    ) -> StatusChanges | None:
+        """Find writes at or after the ``since`` revision.
+
+        Open incidents and the history of their monitors come along
+        whether changed or not, their downtime grows without writes.
+        Returns ``None`` when there are more than ``limit`` changed rows
+        in a table, a full snapshot is cheaper then.
+        """
+        await self._begin_snapshot()
+        since_day = datetime.now(UTC).date() - timedelta(days=last_days - 1)
+
+        groups = await self._find_changed(
+            select(
+                MonitorGroupModel.id,
+                MonitorGroupModel.name,
+                MonitorGroupModel.created_at,
+                MonitorGroupModel.is_deleted,
+            ).where(MonitorGroupModel.revision >= since),
+            MonitorGroupModel.revision,
+            limit,
+        )
+        monitors = await self._find_changed(
+            select(
+                MonitorModel.id,
+                MonitorModel.name,
+                MonitorModel.group_id,
+                MonitorModel.created_at,
+                MonitorModel.is_deleted,
+            ).where(MonitorModel.revision >= since),
+            MonitorModel.revision,
+            limit,
+        )
+        incidents = await self._find_changed(
+            select(
+                IncidentModel.id,
+                IncidentModel.monitor_id,
+                IncidentModel.type,
+                IncidentModel.message,
+                IncidentModel.created_at,
+                IncidentModel.status,
+                IncidentModel.ended_at,
+            ).where(IncidentModel.revision >= since),
+            IncidentModel.revision,
+            limit,
+        )
+        history = await self._find_changed(
+            select(
+                MonitorDailyStatusModel.monitor_id,
+                MonitorDailyStatusModel.day,
+                MonitorDailyStatusModel.worst_type,
+                MonitorDailyStatusModel.downtime_seconds,
+                MonitorDailyStatusModel.incident_count,
+            ).where(
+                MonitorDailyStatusModel.revision >= since,
+                MonitorDailyStatusModel.day >= since_day,
+            ),
+            MonitorDailyStatusModel.revision,
+            limit,
+        )
+
+        if (
+            groups is None
+            or monitors is None
+            or incidents is None
+            or history is None
+        ):
+            return None
+
+        open_incidents = (
+            select(IncidentModel.monitor_id)
+            .where(IncidentModel.status == IncidentStatus.OPEN)
+            .subquery()
+        )
+        open_history = await self._session.execute(
+            select(
+                MonitorDailyStatusModel.monitor_id,
+                MonitorDailyStatusModel.day,
+                MonitorDailyStatusModel.worst_type,
+                MonitorDailyStatusModel.downtime_seconds,
+                MonitorDailyStatusModel.incident_count,
+            ).where(
+                MonitorDailyStatusModel.monitor_id.in_(select(open_incidents)),
+                MonitorDailyStatusModel.day >= since_day,
+            ),
+        )
+
+        return StatusChanges(
+            revision=await self._find_revision(),
+            groups=[ChangedGroupRow(*row) for row in groups],
+            monitors=[ChangedMonitorRow(*row) for row in monitors],
+            incidents=[StatusIncidentRow(*row) for row in incidents],
+            history=[DailyStatus(*row) for row in history],
+            open_incidents=await self._find_open_incidents(),
+            open_history=[DailyStatus(*row) for row in open_history],
+        )
+
+    async def _begin_snapshot(self) -> None:
+        """Run the following reads in one read-only snapshot transaction.
+
+        SQLite transactions always read from one snapshot.
+        """
+        if is_sqlite(self._session):
+            return
+
+        await self._session.connection(
+            execution_options={
+                "isolation_level": "REPEATABLE READ",
+                "postgresql_readonly": True,
+            },
+        )
+
+    async def _find_open_incidents(self) -> list[StatusIncidentRow]:
+        """Find the open incidents of every monitor."""
+        result = await self._session.execute(
+            select(
+                IncidentModel.id,
+                IncidentModel.monitor_id,
+                IncidentModel.type,
+                IncidentModel.message,
+                IncidentModel.created_at,
+            ).where(IncidentModel.status == IncidentStatus.OPEN),
+        )
+        return [StatusIncidentRow(*row) for row in result]
+
+    async def _find_revision(self) -> int:
+        """Find the cursor of the snapshot, the next delta starts there."""
+        result = await self._session.execute(select(status_cursor()))
+        return result.scalar_one()
+
+    async def _find_changed(
+        self,
+        stmt: Select,
+        revision: InstrumentedAttribute[int],
+        limit: int,
+    ) -> Sequence[tuple] | None:
+        """Find changed rows in revision order, ``None`` past the limit."""
+        result = await self._session.execute(
+            stmt.order_by(revision).limit(limit + 1),
+        )
+        rows = result.tuples().all()
+
+        return None if len(rows) > limit else rows
+
+    @staticmethod
+    def _build_components(
+        rows: Sequence[tuple],
+    ) -> list[StatusGroupRow | StatusMonitorRow]:
+        """Fold joined rows into groups and orphan monitors."""
+        components: list[StatusGroupRow | StatusMonitorRow] = []
+        group: StatusGroupRow | None = None
+
+        for group_id, group_name, *monitor_columns in rows:
+            monitor = (
+                None
+                if monitor_columns[0] is None
+                else _build_monitor(*monitor_columns)
+            )
+
+            if group_id is None:
+                if monitor is not None:
+                    components.append(monitor)
+                continue
+
+            if group is None or group.id != group_id:
+                group = StatusGroupRow(
+                    id=group_id,
+                    name=group_name,
+                    monitors=[],
+                )
+                components.append(group)
+
+            if monitor is not None:
+                group.monitors.append(monitor)
+
+        return components
+
+
+def _build_monitor(
+    monitor_id: UUID,
+    name: str,
+    created_at: datetime,
+    incidents: list[list] | None,
+    history: list[list] | None,
+) -> StatusMonitorRow:
+    """Build a monitor row from its columns and JSON aggregates.
+
+    Incidents are ordered newest first and the history by day.
+    """
+    return StatusMonitorRow(
+        id=monitor_id,
+        name=name,
+        created_at=created_at,
+        incidents=sorted(
+            (
+                StatusIncidentRow(
+                    id=UUID(incident_id),
+                    monitor_id=monitor_id,
+                    type=IncidentType[incident_type],
+                    message=message,
+                    created_at=_parse_timestamp(started_at),
+                )
+                for incident_id, incident_type, message, started_at in (
+                    incidents or ()
+                )
+            ),
+            key=lambda incident: incident.created_at,
+            reverse=True,
+        ),
+        history=sorted(
+            (
+                DailyStatus(
+                    monitor_id=monitor_id,
+                    day=date.fromisoformat(day),
+                    worst_type=IncidentType[worst_type],
+                    downtime_seconds=downtime_seconds,
+                    incident_count=incident_count,
+                )
+                for day, worst_type, downtime_seconds, incident_count in (
+                    history or ()
+                )
+            ),
+            key=lambda rollup: rollup.day,
+        ),
+    )
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a JSON timestamp, SQLite ones are naive UTC."""
+    timestamp = datetime.fromisoformat(value)
+
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=UTC)
+
+    return timestamp
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING, Self
 
+from app.repositories.daily_status import MonitorDailyStatusRepository
 from app.repositories.group import MonitorGroupRepository
 from app.repositories.incident import IncidentRepository
+from app.repositories.incident_partition import IncidentPartitionRepository
 from app.repositories.monitor import MonitorRepository
+from app.repositories.status import StatusReadRepository
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -16,7 +20,10 @@ if TYPE_CHECKING:
 
 
 class SqlAlchemyUnitOfWork:
-    """SQLAlchemy implementation of Unit of Work."""
+    """SQLAlchemy implementation of Unit of Work.
+
+    Repositories are created on first use, an instance is entered once.
+    """
 
     def __init__(self, session_factory: Callable[[], AsyncSession]) -> None:
         """Initialize the SQLAlchemy unit of work."""
@@ -26,11 +33,6 @@ class SqlAlchemyUnitOfWork:
     async def __aenter__(self) -> Self:
         """Enter async context manager."""
         self._session = self._session_factory()
-
-        self.monitors = MonitorRepository(self._session)
-        self.groups = MonitorGroupRepository(self._session)
-        self.incidents = IncidentRepository(self._session)
-
         return self
 
     async def __aexit__(
@@ -51,6 +53,45 @@ class SqlAlchemyUnitOfWork:
             if self._session:
                 await self._session.close()
 
+    @cached_property
+    def monitors(self) -> MonitorRepository:
+        """Monitor repository."""
+        return MonitorRepository(self._entered_session)
+
+    @cached_property
+    def groups(self) -> MonitorGroupRepository:
+        """Monitor group repository."""
+        return MonitorGroupRepository(self._entered_session)
+
+    @cached_property
+    def incidents(self) -> IncidentRepository:
+        """Incident repository."""
+        return IncidentRepository(self._entered_session)
+
+    @cached_property
+    def partitions(self) -> IncidentPartitionRepository:
+        """Incident partition repository."""
+        return IncidentPartitionRepository(self._entered_session)
+
+    @cached_property
+    def daily_status(self) -> MonitorDailyStatusRepository:
+        """Monitor daily status repository."""
+        return MonitorDailyStatusRepository(self._entered_session)
+
+    @cached_property
+    def status(self) -> StatusReadRepository:
+        """Status read repository."""
+        return StatusReadRepository(self._entered_session)
+
+    @property
+    def _entered_session(self) -> AsyncSession:
+        """Session of the entered unit of work."""
+        if self._session is None:
+            msg = "Unit of work is used outside of its context"
+            raise RuntimeError(msg)
+
+        return self._session
+
     async def commit(self) -> None:
         """Commit transaction."""
         if self._session:
@@ -60,3 +101,26 @@ class SqlAlchemyUnitOfWork:
         """Rollback transaction."""
         if self._session:
             await self._session.rollback()
+
+
+class SqlAlchemyReadOnlyUnitOfWork(SqlAlchemyUnitOfWork):
+    """Unit of work for reads, nothing is committed.
+
+    Meant for sessions bound with ``app.database.pool.read_only``, where
+    closing the session ends the reads without a round trip.
+    """
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager."""
+        if self._session:
+            await self._session.close()
+
+    async def commit(self) -> None:
+        """Refuse to commit, the unit of work is read-only."""
+        msg = "Read-only unit of work cannot commit"
+        raise RuntimeError(msg)
@@ -0,0 +1 @@
+"""Incident services."""
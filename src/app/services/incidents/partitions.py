@@ -0,0 +1,184 @@
+"""Incident partition maintenance."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gzip
+import logging
+from datetime import UTC, date, datetime, time
+from typing import TYPE_CHECKING
+
+from app.repositories.incident_partition import add_months
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from app.repositories.incident_partition import IncidentPartition
+    from app.repositories.uow import SqlAlchemyUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class IncidentPartitionManager:
+    """Create upcoming incident partitions and retire expired ones.
+
+    Resolved incidents are partitioned by the UTC month they ended in,
+    months without a partition go to the default one until it is created.
+    Partitions older than the retention horizon are optionally archived
+    to gzipped CSV, then detached and dropped. Each step holds a database
+    lock, so instances maintaining at the same time take turns.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], SqlAlchemyUnitOfWork],
+        retention_months: int,
+        archive_dir: Path | None,
+        drop: bool,  # noqa: FBT001
+        interval: int,
+    ) -> None:
+        """Initialize the incident partition manager."""
+        self._uow_factory = uow_factory
+        self._retention_months = retention_months
+        self._archive_dir = archive_dir
+        self._drop = drop
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Maintain partitions in the background, now and periodically.
+
+        Archiving may take long, so startup does not wait for it.
+        """
+        if self._task is not None:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic maintenance."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+
+    async def maintain(self) -> None:
+        """Create partitions for this and next month, retire expired ones."""
+        month = datetime.now(UTC).date().replace(day=1)
+        horizon = add_months(month, -self._retention_months)
+
+        async with self._uow_factory() as uow:
+            if not uow.partitions.is_supported:
+                await self._delete_expired(uow, horizon)
+                return
+
+            await uow.partitions.lock()
+            months = {month, add_months(month, 1)}
+            months.update(await uow.partitions.find_default_months())
+
+            for created in sorted(months):
+                await uow.partitions.create(created)
+
+            partitions = await uow.partitions.find_all()
+
+        if not self._retention_months:
+            return
+
+        for partition in partitions:
+            if partition.month < horizon:
+                await self._retire(partition)
+
+    async def _delete_expired(
+        self,
+        uow: SqlAlchemyUnitOfWork,
+        horizon: date,
+    ) -> None:
+        """Delete incidents resolved before the horizon, without partitions."""
+        if not self._retention_months or not self._drop:
+            return
+
+        if self._archive_dir is not None:
+            logger.warning("Incident archives need Postgres, not archiving")
+
+        deleted = await uow.incidents.delete_resolved(
+            ended_before=datetime.combine(horizon, time.min, UTC),
+        )
+        logger.info(
+            "Deleted %d incidents resolved before %s",
+            deleted,
+            horizon,
+        )
+
+    async def _retire(self, partition: IncidentPartition) -> None:
+        """Archive, detach and drop an expired partition."""
+        async with self._uow_factory() as uow:
+            await uow.partitions.lock()
+
+            # Another instance retired it while this one waited
+            if partition not in await uow.partitions.find_all():
+                return
+
+            if self._archive_dir is not None:
+                await self._archive(uow, partition, self._archive_dir)
+
+            await uow.partitions.detach(partition)
+
+            if self._drop:
+                await uow.partitions.drop(partition)
+
+        logger.info(
+            "Incident partition %s %s",
+            partition.name,
+            "dropped" if self._drop else "detached",
+        )
+
+    async def _archive(
+        self,
+        uow: SqlAlchemyUnitOfWork,
+        partition: IncidentPartition,
+        archive_dir: Path,
+    ) -> None:
+        """Export a partition to a gzipped CSV file."""
+        path = archive_dir / f"{partition.name}.csv.gz"
+        partial_path = path.with_suffix(".gz.partial")
+
+        await asyncio.to_thread(
+            archive_dir.mkdir,
+            parents=True,
+            exist_ok=True,
+        )
+        archive = await asyncio.to_thread(gzip.open, partial_path, "wb")
+
+        async def write(chunk: bytes) -> None:
+            await asyncio.to_thread(archive.write, chunk)
+
+        try:
+            await uow.partitions.export(partition, write)
+
+        finally:
+            await asyncio.to_thread(archive.close)
+
+        # Only a complete export gets the final name
+        await asyncio.to_thread(partial_path.replace, path)
+        logger.info(
+            "Incident partition %s archived to %s",
+            partition.name,
+            path,
+        )
+
+    async def _run(self) -> None:
+        """Run maintenance now and then every interval."""
+        while True:
+            try:
+                await self.maintain()
+
+            except Exception:
+                logger.exception("Incident partition maintenance failed")
+
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,128 @@
+"""Token bucket rate limiter."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import math
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ParamSpec, Protocol, TypeVar
+
+from fastapi import HTTPException, status
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from fastapi import Request
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_RATE = re.compile(r"(\d+)\s*(?:/|per)\s*(\d*)\s*(second|minute|hour|day)s?")
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimit:
+    """Requests allowed per period, refilled one at a time."""
+
+    amount: int
+    period: float
+
+    @classmethod
+    def parse(cls, rate: str) -> RateLimit:
+        """Parse a rate such as ``5/minute`` or ``10 per 30 seconds``."""
+        match = _RATE.fullmatch(rate.strip().lower())
+
+        if match is None or not int(match[1]):
+            msg = f"Invalid rate limit: {rate!r}"
+            raise ValueError(msg)
+
+        amount, count, unit = match.groups()
+        return cls(
+            amount=int(amount),
+            period=int(count or 1) * PERIODS[unit],
+        )
+
+    @property
+    def interval(self) -> float:
+        """Seconds for a bucket to regain one request."""
+        return self.period / self.amount
+
+    def __str__(self) -> str:
+        """Describe the limit."""
+        plural = "" if self.period == 1 else "s"
+        return f"{self.amount} per {self.period:g} second{plural}"
+
+
+class RateLimitExceeded(HTTPException):
+    """Request over its rate limit."""
+
+    def __init__(self, limit: RateLimit, retry_after: float) -> None:
+        """Initialize the exception."""
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(limit),
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+class RateLimitBackend(Protocol):
+    """Store of the token buckets."""
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        """Take a request from a bucket.
+
+        Returns the seconds until the bucket has one, 0 when it was taken.
+        """
+        ...
+
+
+class Limiter:
+    """Rate limiter of endpoints, with a bucket per endpoint and client."""
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        key_func: Callable[[Request], str],
+    ) -> None:
+        """Initialize the rate limiter."""
+        self._backend = backend
+        self._key_func = key_func
+
+    def limit(
+        self,
+        rate: str,
+    ) -> Callable[
+        [Callable[P, Awaitable[R]]],
+        Callable[P, Awaitable[R]],
+    ]:
+        """Limit an endpoint taking a ``request`` to a rate per client."""
+        limit = RateLimit.parse(rate)
+
+        def decorator(
+            func: Callable[P, Awaitable[R]],
+        ) -> Callable[P, Awaitable[R]]:
+            if "request" not in inspect.signature(func).parameters:
+                msg = f"{func.__qualname__} has no 'request' parameter"
+                raise TypeError(msg)
+
+            scope = f"{func.__module__}.{func.__qualname__}"
+
+            @functools.wraps(func)
+            async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                request: Request = kwargs["request"]  # type: ignore[assignment]
+                await self.hit(f"{scope}:{self._key_func(request)}", limit)
+                return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    async def hit(self, key: str, limit: RateLimit) -> None:
+        """Count a request, raising if its bucket is empty."""
+        retry_after = await self._backend.take(key, limit)
+
+        if retry_after > 0:
+            raise RateLimitExceeded(limit, retry_after)
@@ -0,0 +1,49 @@
+"""In-process token buckets."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.services.ratelimit.limiter import RateLimit
+
+
+class MemoryRateLimitBackend:
+    """Token buckets of this process, each one float.
+
+    A bucket is kept as the time it is full again, which a request pushes
+    back by one interval while that stays within the period. Buckets full
+    again are the same as new ones and are swept away periodically.
+    """
+
+    def __init__(self, sweep_interval: float = 60) -> None:
+        """Initialize the memory backend."""
+        self._sweep_interval = sweep_interval
+        self._sweep_at = 0.0
+        self._full_at: dict[str, float] = {}
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        """Take a request from a bucket."""
+        now = time.monotonic()
+
+        if now >= self._sweep_at:
+            self._sweep(now)
+
+        full_at = max(self._full_at.get(key, now), now) + limit.interval
+        wait = full_at - now - limit.period
+
+        if wait > 0:
+            return wait
+
+        self._full_at[key] = full_at
+        return 0.0
+
+    def _sweep(self, now: float) -> None:
+        """Drop the buckets that are full again."""
+        self._full_at = {
+            key: full_at
+            for key, full_at in self._full_at.items()
+            if full_at > now
+        }
+        self._sweep_at = now + self._sweep_interval
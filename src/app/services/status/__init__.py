@@ -0,0 +1 @@
+"""Status services."""
@@ -0,0 +1,239 @@
+"""Status change broadcaster."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from typing import TYPE_CHECKING
+
+from app.api.models.status import (
+    IncidentEventResponse,
+    IncidentResponse,
+    MonitorAddedEventResponse,
+    MonitorRemovedEventResponse,
+    StatusMonitorResponse,
+)
+from app.enums import StatusEventType
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from app.database.models.incident import IncidentModel
+    from app.database.models.monitor import MonitorModel
+    from app.services.status.version import StatusVersion
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_FRAME = b": ping\n\n"
+
+
+class SubscriberLimitError(Exception):
+    """Raised when the subscriber limit is reached."""
+
+
+def encode_event(
+    event_type: StatusEventType,
+    data: bytes,
+    version: int,
+) -> bytes:
+    """Encode a server-sent event frame."""
+    return b"event: %s\nid: %d\ndata: %s\n\n" % (
+        event_type.value.encode(),
+        version,
+        data,
+    )
+
+
+class Subscription:
+    """Bounded queue of encoded frames for a single subscriber.
+
+    A subscriber that falls behind is not allowed to grow its queue: the
+    pending frames are dropped and it is told to resync from a snapshot.
+    """
+
+    __slots__ = ("_frames", "_maxsize", "_ready", "_resync")
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the subscription."""
+        self._frames: deque[bytes] = deque()
+        self._maxsize = maxsize
+        self._ready = asyncio.Event()
+        self._resync = False
+
+    def push(self, frame: bytes) -> None:
+        """Queue a frame, or switch to resync if the queue is full."""
+        if self._resync:
+            return
+
+        if len(self._frames) >= self._maxsize:
+            self.resync()
+            return
+
+        self._frames.append(frame)
+        self._ready.set()
+
+    def resync(self) -> None:
+        """Drop pending frames and request a full snapshot."""
+        self._frames.clear()
+        self._resync = True
+        self._ready.set()
+
+    async def next(self) -> list[bytes] | None:
+        """Wait for pending frames, ``None`` means a resync is required."""
+        while not self._frames and not self._resync:
+            self._ready.clear()
+            await self._ready.wait()
+
+        if self._resync:
+            self._resync = False
+            return None
+
+        frames = list(self._frames)
+        self._frames.clear()
+        return frames
+
+
+class StatusBroadcaster:
+    """In-process fan-out of public status changes."""
+
+    def __init__(
+        self,
+        status_version: StatusVersion,
+        max_subscribers: int,
+        queue_size: int,
+        heartbeat_interval: int,
+    ) -> None:
+        """Initialize the broadcaster."""
+        self._status_version = status_version
+        self._max_subscribers = max_subscribers
+        self._queue_size = queue_size
+        self._heartbeat_interval = heartbeat_interval
+        self._subscribers: set[Subscription] = set()
+        self._heartbeat_task: asyncio.Task | None = None
+
+    @property
+    def subscribers(self) -> int:
+        """Number of active subscribers."""
+        return len(self._subscribers)
+
+    async def start(self) -> None:
+        """Start sending heartbeats to subscribers."""
+        if self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    async def stop(self) -> None:
+        """Stop sending heartbeats."""
+        if self._heartbeat_task is None:
+            return
+
+        self._heartbeat_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._heartbeat_task
+
+        self._heartbeat_task = None
+
+    def subscribe(self) -> Subscription:
+        """Register a new subscriber."""
+        if len(self._subscribers) >= self._max_subscribers:
+            msg = "Status stream subscriber limit reached"
+            raise SubscriberLimitError(msg)
+
+        subscription = Subscription(self._queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber."""
+        self._subscribers.discard(subscription)
+
+    def incident_opened(self, incident: IncidentModel) -> None:
+        """Publish an opened incident."""
+        self._publish_incident(StatusEventType.INCIDENT_OPENED, incident)
+
+    def incident_resolved(self, incident: IncidentModel) -> None:
+        """Publish a resolved incident."""
+        self._publish_incident(StatusEventType.INCIDENT_RESOLVED, incident)
+
+    def monitor_added(self, monitor: MonitorModel) -> None:
+        """Publish a new monitor."""
+        version = self._status_version.bump()
+        self._publish(
+            StatusEventType.MONITOR_ADDED,
+            MonitorAddedEventResponse(
+                group_id=monitor.group_id,
+                monitor=StatusMonitorResponse.from_orm(monitor, []),
+                last_update_at=self._status_version.updated_at,
+            ),
+            version,
+        )
+
+    def monitor_removed(self, monitor: MonitorModel) -> None:
+        """Publish a removed monitor."""
+        version = self._status_version.bump()
+        self._publish(
+            StatusEventType.MONITOR_REMOVED,
+            MonitorRemovedEventResponse(
+                monitor_id=monitor.id,
+                last_update_at=self._status_version.updated_at,
+            ),
+            version,
+        )
+
+    def resync(self) -> None:
+        """Publish a change that requires a full snapshot."""
+        self._status_version.bump()
+
+        for subscription in self._subscribers:
+            subscription.resync()
+
+    def _publish_incident(
+        self,
+        event_type: StatusEventType,
+        incident: IncidentModel,
+    ) -> None:
+        """Publish an incident event."""
+        version = self._status_version.bump()
+        self._publish(
+            event_type,
+            IncidentEventResponse(
+                monitor_id=incident.monitor_id,
+                incident=IncidentResponse.from_orm(incident),
+                last_update_at=self._status_version.updated_at,
+            ),
+            version,
+        )
+
+    def _publish(
+        self,
+        event_type: StatusEventType,
+        payload: BaseModel,
+        version: int,
+    ) -> None:
+        """Encode an event once and queue it for every subscriber."""
+        if not self._subscribers:
+            return
+
+        frame = encode_event(
+            event_type,
+            payload.model_dump_json().encode(),
+            version,
+        )
+
+        for subscription in self._subscribers:
+            subscription.push(frame)
+
+        logger.debug(
+            "Published %s to %d subscribers",
+            event_type.value,
+            len(self._subscribers),
+        )
+
+    async def _heartbeat(self) -> None:
+        """Periodically ping subscribers to keep connections alive."""
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+
+            for subscription in self._subscribers:
+                subscription.push(HEARTBEAT_FRAME)
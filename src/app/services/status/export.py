@@ -0,0 +1,306 @@
+"""Static status site export."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gzip
+import hashlib
+import logging
+import os
+import shutil
+from collections import defaultdict
+from datetime import UTC, datetime, time, timedelta
+from functools import partial
+from typing import TYPE_CHECKING
+
+import brotli
+from markupsafe import Markup
+from pydantic_core import from_json, to_json
+from starlette.requests import Request
+
+from app.api.models.status import DayIncidentsResponse, IncidentResponse
+from app.services.status.snapshot import INCIDENT_HISTORY_DAYS
+from app.shared import config
+from app.shared.templating import json_script
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from datetime import date
+    from pathlib import Path
+
+    from fastapi.templating import Jinja2Templates
+
+    from app.database.models.incident import IncidentModel
+    from app.repositories.uow import SqlAlchemyUnitOfWork
+    from app.services.status.snapshot import StatusSnapshotCache
+    from app.services.status.version import StatusVersion
+
+logger = logging.getLogger(__name__)
+
+INDEX = "index.html"
+MANIFEST = "manifest.json"
+INCIDENTS_DIR = "incidents"
+STATIC_DIR = "static"
+
+_PRECOMPRESSED: dict[str, Callable[[bytes], bytes]] = {
+    ".br": partial(brotli.compress, quality=11),
+    ".gz": partial(gzip.compress, compresslevel=9, mtime=0),
+}
+
+
+def _hashed_name(stem: str, data: bytes) -> str:
+    """Name of a JSON file after its content."""
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:16]}.json"
+
+
+def _incidents_by_day(
+    incidents: list[IncidentModel],
+    since: date,
+    until: date,
+) -> dict[tuple[str, date], list[IncidentModel]]:
+    """Group incidents by monitor and every history day they overlap."""
+    days: defaultdict[tuple[str, date], list[IncidentModel]] = defaultdict(
+        list,
+    )
+
+    for incident in incidents:
+        day = max(since, incident.created_at.astimezone(UTC).date())
+        last_day = (
+            min(until, incident.ended_at.astimezone(UTC).date())
+            if incident.ended_at is not None
+            else until
+        )
+
+        while day <= last_day:
+            days[str(incident.monitor_id), day].append(incident)
+            day += timedelta(days=1)
+
+    return days
+
+
+class StatusExporter:
+    """Periodic export of the public status site to static files.
+
+    The page and the manifest keep their names, the status and the day
+    incidents are named after their content and never change. Every file
+    is written atomically next to its ``.br`` and ``.gz`` variants, and
+    content-named files outlive the last export referring to them by
+    ``retain`` seconds, for pages still held by caches.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        templates: Jinja2Templates,
+        snapshot_cache: StatusSnapshotCache,
+        uow_factory: Callable[[], SqlAlchemyUnitOfWork],
+        status_version: StatusVersion,
+        static_dir: Path,
+        assets: Mapping[str, str],
+        output_dir: Path | None,
+        interval: int,
+        retain: int,
+    ) -> None:
+        """Initialize the status exporter."""
+        self._templates = templates
+        self._snapshot_cache = snapshot_cache
+        self._uow_factory = uow_factory
+        self._status_version = status_version
+        self._static_dir = static_dir
+        self._assets = assets
+        self._output_dir = output_dir
+        self._interval = interval
+        self._retain = retain
+        self._version = -1
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Export now and then periodically, if an output is configured."""
+        if self._output_dir is None or self._task is not None:
+            return
+
+        await self.export()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic exports."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+
+    async def export(self) -> None:
+        """Export the status site unless the status is unchanged."""
+        if self._output_dir is None:
+            msg = "Export directory is not configured"
+            raise RuntimeError(msg)
+
+        version = self._status_version.value
+        if version == self._version:
+            return
+
+        snapshot = await self._snapshot_cache.get()
+
+        until = datetime.now(UTC).date()
+        since = until - timedelta(days=INCIDENT_HISTORY_DAYS - 1)
+
+        async with self._uow_factory() as uow:
+            incidents = await uow.incidents.find_since(
+                datetime.combine(since, time.min, UTC),
+            )
+
+        await asyncio.to_thread(
+            self._write,
+            self._output_dir,
+            snapshot,
+            _incidents_by_day(incidents, since, until),
+        )
+        self._version = version
+        logger.info("Status site exported to %s", self._output_dir)
+
+    def _write(
+        self,
+        output_dir: Path,
+        snapshot: bytes,
+        days: dict[tuple[str, date], list[IncidentModel]],
+    ) -> None:
+        """Write the files of an export, the page last."""
+        (output_dir / INCIDENTS_DIR).mkdir(parents=True, exist_ok=True)
+
+        # Assets only change with a deploy, which restarts the exporter
+        if self._version < 0:
+            shutil.copytree(
+                self._static_dir,
+                output_dir / STATIC_DIR,
+                dirs_exist_ok=True,
+            )
+
+        incidents = {}
+        for (monitor_id, day), day_incidents in days.items():
+            data = to_json(
+                DayIncidentsResponse.model_construct(
+                    day=day,
+                    incidents=[
+                        IncidentResponse.from_orm(i) for i in day_incidents
+                    ],
+                ),
+            )
+            name = f"{INCIDENTS_DIR}/{_hashed_name(monitor_id, data)}"
+            _put_hashed(output_dir / name, data)
+            incidents[f"{monitor_id}/{day.isoformat()}"] = name
+
+        status_name = _hashed_name("status", snapshot)
+        _put_hashed(output_dir / status_name, snapshot)
+
+        status = from_json(snapshot)
+        manifest = to_json(
+            {
+                "cursor": status["cursor"],
+                "last_update_at": status["last_update_at"],
+                "status": status_name,
+                "incidents": incidents,
+            },
+        )
+        _put(output_dir / MANIFEST, manifest)
+        _put(output_dir / INDEX, self._render(snapshot, manifest))
+        self._prune(
+            output_dir,
+            keep={
+                variant
+                for name in (status_name, *incidents.values())
+                for variant in _variants(output_dir / name)
+            },
+        )
+
+    def _render(self, snapshot: bytes, manifest: bytes) -> bytes:
+        """Render the status page of an export."""
+        # The page reads nothing else from the request
+        request = Request(
+            {
+                "type": "http",
+                "state": {
+                    "organization_name": config.app.organization_name,
+                    "theme": config.app.theme.value,
+                    "admin_path": None,
+                    "csp_nonce": "",
+                },
+            },
+        )
+
+        return (
+            self._templates.get_template("status/index.html")
+            .render(
+                request=request,
+                url_for=self._static_url,
+                # JSON escaped by json_script, it cannot close the script
+                initial_status=Markup(json_script(snapshot).decode()),  # noqa: S704 # nosec B704
+                export_manifest=Markup(json_script(manifest).decode()),  # noqa: S704 # nosec B704
+            )
+            .encode()
+        )
+
+    def _static_url(self, _name: str, /, *, path: str) -> str:
+        """Relative URL of a static file, replacing ``url_for``."""
+        return f"{STATIC_DIR}/{self._assets.get(path, path)}"
+
+    def _prune(self, output_dir: Path, keep: set[Path]) -> None:
+        """Delete content-named files no export referred to lately."""
+        horizon = datetime.now(UTC).timestamp() - self._retain
+
+        for path in (
+            *output_dir.glob("status.*"),
+            *(output_dir / INCIDENTS_DIR).iterdir(),
+        ):
+            with contextlib.suppress(FileNotFoundError):
+                if path not in keep and path.stat().st_mtime < horizon:
+                    path.unlink()
+
+    async def _run(self) -> None:
+        """Export every interval."""
+        while True:
+            await asyncio.sleep(self._interval)
+
+            try:
+                await self.export()
+
+            except Exception:
+                logger.exception("Status site export failed")
+
+
+def _variants(path: Path) -> list[Path]:
+    """Paths of a file and its compressed variants."""
+    return [
+        path,
+        *(path.with_name(path.name + suffix) for suffix in _PRECOMPRESSED),
+    ]
+
+
+def _replace(path: Path, data: bytes) -> None:
+    """Write a file through a partial file, so readers never see half."""
+    partial_path = path.with_name(path.name + ".partial")
+    partial_path.write_bytes(data)
+    partial_path.replace(path)
+
+
+def _put(path: Path, data: bytes) -> None:
+    """Write a file after its compressed variants, each atomically."""
+    for suffix, compress in _PRECOMPRESSED.items():
+        _replace(path.with_name(path.name + suffix), compress(data))
+
+    _replace(path, data)
+
+
+def _put_hashed(path: Path, data: bytes) -> None:
+    """Write a content-named file unless an earlier export did."""
+    if not path.exists():
+        _put(path, data)
+        return
+
+    # Still referred to, so its retention starts over
+    for variant in _variants(path):
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(variant)
@@ -0,0 +1,126 @@
+"""Status changes of other instances."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING, cast
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database.pool import INSTANCE
+
+if TYPE_CHECKING:
+    from asyncpg import Connection
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from app.services.status.broadcaster import StatusBroadcaster
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "status_changed"
+
+
+class StatusChangeListener:
+    """Resync this instance when another one changes the public status.
+
+    Every instance keeps its own status version, which drives the ETags,
+    the snapshot cache and the stream. Writes of other instances arrive
+    as Postgres notifications, a burst of them causes a single resync.
+    While not listening, changes are missed, so the listener resyncs
+    each time it connects. It holds one connection of the engine's pool.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        broadcaster: StatusBroadcaster,
+        resync_delay: float = 0.5,
+        ping_interval: float = 30,
+    ) -> None:
+        """Initialize the status change listener."""
+        self._engine = engine
+        self._broadcaster = broadcaster
+        self._resync_delay = resync_delay
+        self._ping_interval = ping_interval
+        self._resync: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start listening, SQLite runs a single instance."""
+        if self._engine.dialect.name == "sqlite" or self._task is not None:
+            return
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+
+        if self._resync is not None:
+            self._resync.cancel()
+            self._resync = None
+
+    async def _run(self) -> None:
+        """Listen, reconnecting after a lost connection."""
+        while True:
+            try:
+                await self._listen()
+
+            except (SQLAlchemyError, OSError):
+                logger.warning("Status listener disconnected", exc_info=True)
+
+            await asyncio.sleep(self._ping_interval)
+
+    async def _listen(self) -> None:
+        """Listen on a connection until it fails."""
+        async with self._engine.connect() as connection:
+            await connection.execution_options(isolation_level="AUTOCOMMIT")
+            raw = await connection.get_raw_connection()
+            driver = cast("Connection", raw.driver_connection)
+
+            try:
+                await driver.add_listener(CHANNEL, self._notified)
+                logger.info("Listening to status changes")
+                self._schedule_resync()
+
+                # A lost connection only shows when it is used
+                while True:
+                    await asyncio.sleep(self._ping_interval)
+                    await connection.exec_driver_sql("SELECT 1")
+
+            finally:
+                # Never hand a listening connection back to the pool
+                await connection.invalidate()
+
+    def _notified(
+        self,
+        connection: Connection,  # noqa: ARG002
+        pid: int,  # noqa: ARG002
+        channel: str,  # noqa: ARG002
+        payload: str,
+    ) -> None:
+        """Handle a notification of a committed status change."""
+        if payload != INSTANCE:
+            self._schedule_resync()
+
+    def _schedule_resync(self) -> None:
+        """Resync soon, unless already scheduled."""
+        if self._resync is None:
+            self._resync = asyncio.get_running_loop().call_later(
+                self._resync_delay,
+                self._resync_now,
+            )
+
+    def _resync_now(self) -> None:
+        """Resync the status of this instance."""
+        self._resync = None
+        self._broadcaster.resync()
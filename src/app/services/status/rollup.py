@@ -0,0 +1,134 @@
+"""Daily status rollups."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+
+from app.enums import IncidentType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+    from app.database.models.daily_status import MonitorDailyStatusModel
+    from app.database.models.incident import IncidentModel
+    from app.repositories.status import StatusIncidentRow
+
+_SEVERITY = {incident_type: i for i, incident_type in enumerate(IncidentType)}
+
+
+@dataclass(slots=True, frozen=True)
+class DailyStatus:
+    """Incident totals of a monitor for one UTC day."""
+
+    monitor_id: UUID
+    day: date
+    worst_type: IncidentType
+    downtime_seconds: int
+    incident_count: int
+
+    @classmethod
+    def from_orm(cls, model: MonitorDailyStatusModel) -> DailyStatus:
+        """Create a DailyStatus from a MonitorDailyStatusModel."""
+        return cls(
+            monitor_id=model.monitor_id,
+            day=model.day,
+            worst_type=model.worst_type,
+            downtime_seconds=model.downtime_seconds,
+            incident_count=model.incident_count,
+        )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Convert a datetime to UTC, assuming UTC for naive values."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+
+    return value.astimezone(UTC)
+
+
+def opened(incident: IncidentModel) -> list[DailyStatus]:
+    """Rollup of a newly opened incident."""
+    return [
+        DailyStatus(
+            monitor_id=incident.monitor_id,
+            day=_as_utc(incident.created_at).date(),
+            worst_type=incident.type,
+            downtime_seconds=0,
+            incident_count=1,
+        ),
+    ]
+
+
+def spanned(
+    incident: IncidentModel | StatusIncidentRow,
+    until: datetime,
+) -> list[DailyStatus]:
+    """Rollup of an incident from its start until ``until``.
+
+    The first day is already counted by :func:`opened`, so only the
+    following days count the incident again.
+    """
+    started_at = _as_utc(incident.created_at)
+    until = _as_utc(until)
+
+    first_day = started_at.date()
+    day = first_day
+    rollups = []
+
+    while day <= until.date():
+        day_start = datetime.combine(day, time.min, UTC)
+        day_end = day_start + timedelta(days=1)
+        downtime = min(until, day_end) - max(started_at, day_start)
+
+        rollups.append(
+            DailyStatus(
+                monitor_id=incident.monitor_id,
+                day=day,
+                worst_type=incident.type,
+                downtime_seconds=max(int(downtime.total_seconds()), 0),
+                incident_count=0 if day == first_day else 1,
+            ),
+        )
+        day += timedelta(days=1)
+
+    return rollups
+
+
+def resolved(incident: IncidentModel) -> list[DailyStatus]:
+    """Rollup of a resolved incident."""
+    if incident.ended_at is None:
+        return []
+
+    return spanned(incident, incident.ended_at)
+
+
+def combine(rollups: Iterable[DailyStatus]) -> list[DailyStatus]:
+    """Merge rollups of the same monitor and day."""
+    combined: dict[tuple[UUID, date], DailyStatus] = {}
+
+    for rollup in rollups:
+        key = (rollup.monitor_id, rollup.day)
+        current = combined.get(key)
+
+        if current is None:
+            combined[key] = rollup
+            continue
+
+        combined[key] = DailyStatus(
+            monitor_id=rollup.monitor_id,
+            day=rollup.day,
+            worst_type=max(
+                current.worst_type,
+                rollup.worst_type,
+                key=_SEVERITY.__getitem__,
+            ),
+            downtime_seconds=(
+                current.downtime_seconds + rollup.downtime_seconds
+            ),
+            incident_count=current.incident_count + rollup.incident_count,
+        )
+
+    return sorted(combined.values(), key=lambda rollup: rollup.day)
@@ -0,0 +1,220 @@
+"""Serialized status snapshot cache."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import UTC, datetime, time, timedelta
+from typing import TYPE_CHECKING
+
+from pydantic_core import to_json
+
+from app.api.models.status import (
+    StatusMonitorGroupResponse,
+    StatusMonitorResponse,
+    StatusResponse,
+)
+from app.repositories.status import StatusGroupRow
+from app.services.status import rollup
+from app.shared.compression import compress
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from app.repositories.status import (
+        StatusChanges,
+        StatusIncidentRow,
+        StatusMonitorRow,
+    )
+    from app.repositories.uow import SqlAlchemyUnitOfWork
+    from app.services.status.version import StatusVersion
+
+logger = logging.getLogger(__name__)
+INCIDENT_HISTORY_DAYS = 30
+# Seconds an open incident's growing downtime may be served stale
+OPEN_INCIDENT_MAX_AGE = 60
+
+
+def live_history(
+    history: list[rollup.DailyStatus],
+    incidents: Iterable[StatusIncidentRow],
+    now: datetime,
+) -> list[rollup.DailyStatus]:
+    """Daily history including the downtime of open incidents.
+
+    Open incidents keep accruing downtime, so their share is added when
+    the status is read rather than stored.
+    """
+    since = now.date() - timedelta(days=INCIDENT_HISTORY_DAYS - 1)
+    accrued = [
+        daily
+        for incident in incidents
+        for daily in rollup.spanned(incident, now)
+        if daily.day >= since
+    ]
+
+    if not accrued:
+        return history
+
+    return rollup.combine([*history, *accrued])
+
+
+def delta_history(
+    changes: StatusChanges,
+    now: datetime,
+) -> list[rollup.DailyStatus]:
+    """Build the changed daily history, keeping open incident days live.
+
+    Days of open incidents are sent even when unchanged, so a delta shows
+    the same downtime as a snapshot.
+    """
+    accrued = {
+        (daily.monitor_id, daily.day)
+        for incident in changes.open_incidents
+        for daily in rollup.spanned(incident, now)
+    }
+    history = {
+        (daily.monitor_id, daily.day): daily for daily in changes.history
+    }
+
+    for daily in changes.open_history:
+        if (daily.monitor_id, daily.day) in accrued:
+            history[daily.monitor_id, daily.day] = daily
+
+    return live_history(list(history.values()), changes.open_incidents, now)
+
+
+def _build_components(
+    rows: list[StatusGroupRow | StatusMonitorRow],
+) -> list[StatusMonitorGroupResponse | StatusMonitorResponse]:
+    """Build list of components from status rows."""
+    now = datetime.now(UTC)
+
+    return [
+        StatusMonitorGroupResponse.from_row(
+            row,
+            [
+                StatusMonitorResponse.from_row(
+                    monitor,
+                    live_history(monitor.history, monitor.incidents, now),
+                )
+                for monitor in row.monitors
+            ],
+        )
+        if isinstance(row, StatusGroupRow)
+        else StatusMonitorResponse.from_row(
+            row,
+            live_history(row.history, row.incidents, now),
+        )
+        for row in rows
+    ]
+
+
+def _expires_in(
+    rows: list[StatusGroupRow | StatusMonitorRow],
+    now: datetime,
+) -> float:
+    """Seconds a snapshot built now stays correct without any write.
+
+    The history window rolls over at the next UTC midnight, and open
+    incidents keep accruing downtime.
+    """
+    midnight = datetime.combine(now.date() + timedelta(days=1), time.min, UTC)
+    expires_in = (midnight - now).total_seconds()
+
+    monitors = (
+        monitor
+        for row in rows
+        for monitor in (
+            row.monitors if isinstance(row, StatusGroupRow) else [row]
+        )
+    )
+    if any(monitor.incidents for monitor in monitors):
+        return min(expires_in, OPEN_INCIDENT_MAX_AGE)
+
+    return expires_in
+
+
+class StatusSnapshotCache:
+    """Single-flight cache of the serialized status per version.
+
+    Concurrent readers of a stale snapshot share one rebuild instead of
+    each hitting the database. Compressed snapshots are kept next to it,
+    so each coding is compressed once per version too. A snapshot also
+    expires the version when it goes out of date by time alone.
+    """
+
+    def __init__(
+        self,
+        status_version: StatusVersion,
+        uow_factory: Callable[[], SqlAlchemyUnitOfWork],
+    ) -> None:
+        """Initialize the snapshot cache."""
+        self._status_version = status_version
+        self._uow_factory = uow_factory
+        self._lock = asyncio.Lock()
+        self._version = -1
+        self._payload: bytes | None = None
+        self._encoded: dict[str, bytes] = {}
+
+    async def get(self, encoding: str | None = None) -> bytes:
+        """Return the cached snapshot, rebuilding it if it is stale.
+
+        With an ``encoding`` of ``COMPRESSORS`` the snapshot is compressed.
+        """
+        payload = await self._current()
+
+        if encoding is None:
+            return payload
+
+        encoded = self._encoded.get(encoding)
+        if encoded is None:
+            encoded = self._encoded[encoding] = compress(payload, encoding)
+
+        return encoded
+
+    async def _current(self) -> bytes:
+        """Return the snapshot of the current version."""
+        if self._payload is not None and self._is_fresh():
+            return self._payload
+
+        async with self._lock:
+            payload = self._payload
+
+            if payload is None or not self._is_fresh():
+                version = self._status_version.value
+                payload = await self._load()
+                self._version, self._payload = version, payload
+                self._encoded = {}
+
+            return payload
+
+    def _is_fresh(self) -> bool:
+        """Check whether the cached payload matches the current version."""
+        return self._version == self._status_version.value
+
+    async def _load(self) -> bytes:
+        """Load current status from the database and encode it to JSON."""
+        last_update_at = self._status_version.updated_at
+
+        async with self._uow_factory() as uow:
+            status_components = await uow.status.find_components(
+                last_days=INCIDENT_HISTORY_DAYS,
+            )
+
+        logger.debug(
+            "Found status components=%d, revision=%d",
+            len(status_components.components),
+            status_components.revision,
+        )
+        self._status_version.expire_in(
+            _expires_in(status_components.components, datetime.now(UTC)),
+        )
+
+        return to_json(
+            StatusResponse.model_construct(
+                components=_build_components(status_components.components),
+                cursor=str(status_components.revision),
+                last_update_at=last_update_at,
+            ),
+        )
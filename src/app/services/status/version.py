@@ -0,0 +1,54 @@
+"""Status version tracking."""
+
+import math
+import secrets
+import time
+from datetime import UTC, datetime
+
+
+class StatusVersion:
+    """Monotonic counter of public status changes."""
+
+    def __init__(self) -> None:
+        """Initialize the status version."""
+        self._epoch = secrets.token_hex(4)
+        self._value = 0
+        self._updated_at = datetime.now(UTC)
+        self._expires_at = math.inf
+
+    @property
+    def value(self) -> int:
+        """Current version."""
+        if time.monotonic() >= self._expires_at:
+            self._expires_at = math.inf
+            self._value += 1
+
+        return self._value
+
+    @property
+    def updated_at(self) -> datetime:
+        """Time of the last change."""
+        return self._updated_at
+
+    def etag(self, scope: str) -> str:
+        """Strong ETag for a representation of the current version.
+
+        The process epoch keeps validators from colliding after a restart,
+        when the counter starts from zero again.
+        """
+        return f'"{scope}-{self._epoch}-{self.value}"'
+
+    def expire_in(self, seconds: float) -> None:
+        """Move to a new version after a delay, for time-dependent views.
+
+        An earlier deadline is kept, each view gets fresh in time. Nothing
+        was written, so the time of the last change is kept.
+        """
+        self._expires_at = min(self._expires_at, time.monotonic() + seconds)
+
+    def bump(self) -> int:
+        """Register a status change."""
+        self._value += 1
+        self._updated_at = datetime.now(UTC)
+        self._expires_at = math.inf
+        return self._value
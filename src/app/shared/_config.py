@@ -1,9 +1,10 @@
 """Config module."""
 
 import secrets
+from pathlib import Path
 from typing import ClassVar
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.enums import Environment, LogLevel, Theme
@@ -27,6 +28,7 @@ class APPConfig(BaseConfig):
     theme: Theme = Theme.DEFAULT
 
     https: bool = False
+    metrics: bool = False
 
     @property
     def is_production(self) -> bool:
@@ -46,6 +48,7 @@ class JWTConfig(BaseConfig):
     issuer: str = "StatusPage"
     expires_in: int = 3600
     algorithm: str = "HS256"
+    cache_size: int = Field(default=1024, gt=0)
 
     model_config = SettingsConfigDict(
         env_prefix="JWT_",
@@ -92,9 +95,20 @@ class DBConfig(BaseConfig):
 
     host: str = "localhost"
     port: int = Field(default=5432, ge=1, le=65535)
-    user: str
-    password: str
-    db: str
+    user: str = ""
+    password: str = ""
+    db: str = ""
+
+    # Embedded database file, replaces Postgres when set
+    sqlite_path: Path | None = Field(
+        default=None,
+        validation_alias="SQLITE_PATH",
+    )
+
+    replica_host: str | None = None
+    replica_port: int = Field(default=5432, ge=1, le=65535)
+    replica_max_lag: float = Field(default=10, gt=0)
+    replica_check_interval: float = Field(default=5, gt=0)
 
     model_config = SettingsConfigDict(
         env_prefix="POSTGRES_",
@@ -102,14 +116,199 @@ class DBConfig(BaseConfig):
         frozen=True,
     )
 
+    @model_validator(mode="after")
+    def validate_credentials(self) -> "DBConfig":
+        """Require Postgres credentials unless SQLite is used."""
+        if not self.is_sqlite and not (
+            self.user and self.password and self.db
+        ):
+            msg = (
+                "POSTGRES_USER, POSTGRES_PASSWORD and POSTGRES_DB are required"
+            )
+            raise ValueError(msg)
+
+        return self
+
+    @property
+    def is_sqlite(self) -> bool:
+        """Check if the embedded SQLite database is used."""
+        return self.sqlite_path is not None
+
     @property
     def url(self) -> str:
         """DB URL."""
+        if self.sqlite_path is not None:
+            return f"sqlite+aiosqlite:///{self.sqlite_path}"
+
         return (
             f"postgresql+asyncpg://{self.user}:{self.password}"
             f"@{self.host}:{self.port}/{self.db}"
         )
 
+    @property
+    def replica_url(self) -> str | None:
+        """Read replica URL, ``None`` without a replica."""
+        if self.is_sqlite or not self.replica_host:
+            return None
+
+        return (
+            f"postgresql+asyncpg://{self.user}:{self.password}"
+            f"@{self.replica_host}:{self.replica_port}/{self.db}"
+        )
+
+
+class PoolConfig(BaseConfig):
+    """Connection pool config class of a workload."""
+
+    size: int = Field(default=10, gt=0)
+    max_overflow: int = Field(default=10, ge=0)
+    timeout: float = Field(default=10, gt=0)
+    statement_timeout: int = Field(default=10000, ge=0)
+
+
+class APIPoolConfig(PoolConfig):
+    """API connection pool config class."""
+
+    max_overflow: int = Field(default=20, ge=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="POOL_API_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class WorkerPoolConfig(PoolConfig):
+    """Monitoring workers connection pool config class."""
+
+    timeout: float = Field(default=30, gt=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="POOL_WORKER_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class HealthPoolConfig(PoolConfig):
+    """Health check connection pool config class."""
+
+    size: int = Field(default=1, gt=0)
+    max_overflow: int = Field(default=1, ge=0)
+    timeout: float = Field(default=2, gt=0)
+    statement_timeout: int = Field(default=2000, ge=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="POOL_HEALTH_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class ReplicaPoolConfig(PoolConfig):
+    """Read replica connection pool config class."""
+
+    max_overflow: int = Field(default=20, ge=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="POOL_REPLICA_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class CacheConfig(BaseConfig):
+    """HTTP cache config class."""
+
+    max_age: int = Field(default=0, ge=0)
+    s_maxage: int = Field(default=10, ge=0)
+    stale_while_revalidate: int = Field(default=30, ge=0)
+    max_pages: int = Field(default=64, gt=0)
+    templates_dir: Path | None = None
+
+    model_config = SettingsConfigDict(
+        env_prefix="CACHE_",
+        extra="ignore",
+        frozen=True,
+    )
+
+    @property
+    def public_cache_control(self) -> str:
+        """Cache-Control value for public status representations."""
+        return (
+            f"public, max-age={self.max_age}, s-maxage={self.s_maxage}, "
+            f"stale-while-revalidate={self.stale_while_revalidate}"
+        )
+
+
+class CompressionConfig(BaseConfig):
+    """Response compression config class."""
+
+    minimum_size: int = Field(default=1024, ge=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="COMPRESSION_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class StreamConfig(BaseConfig):
+    """Status stream (SSE) config class."""
+
+    max_subscribers: int = Field(default=20000, ge=0)
+    queue_size: int = Field(default=32, gt=0)
+    heartbeat_interval: int = Field(default=15, gt=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="STREAM_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class RateLimitConfig(BaseConfig):
+    """Rate limit config class."""
+
+    # Share buckets between instances through Postgres
+    shared: bool = False
+    client_cache_size: int = Field(default=4096, gt=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="RATE_LIMIT_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class RetentionConfig(BaseConfig):
+    """Incident retention config class."""
+
+    months: int = Field(default=0, ge=0)
+    archive_dir: Path | None = None
+    drop: bool = True
+    interval: int = Field(default=6 * 3600, gt=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="RETENTION_",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+class ExportConfig(BaseConfig):
+    """Static status site export config class."""
+
+    dir: Path | None = None
+    interval: int = Field(default=30, gt=0)
+    retain: int = Field(default=3600, ge=0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="EXPORT_",
+        extra="ignore",
+        frozen=True,
+    )
+
 
 class Config:
     """Global application config."""
@@ -119,6 +318,16 @@ class Config:
     cookie: ClassVar[CookieConfig] = CookieConfig()  # type: ignore[call-arg]
     admin: ClassVar[AdminConfig] = AdminConfig()  # type: ignore[call-arg]
     db: ClassVar[DBConfig] = DBConfig()  # type: ignore[call-arg]
+    api_pool: ClassVar[APIPoolConfig] = APIPoolConfig()
+    worker_pool: ClassVar[WorkerPoolConfig] = WorkerPoolConfig()
+    health_pool: ClassVar[HealthPoolConfig] = HealthPoolConfig()
+    replica_pool: ClassVar[ReplicaPoolConfig] = ReplicaPoolConfig()
+    cache: ClassVar[CacheConfig] = CacheConfig()  # type: ignore[call-arg]
+    compression: ClassVar[CompressionConfig] = CompressionConfig()  # type: ignore[call-arg]
+    stream: ClassVar[StreamConfig] = StreamConfig()  # type: ignore[call-arg]
+    rate_limit: ClassVar[RateLimitConfig] = RateLimitConfig()  # type: ignore[call-arg]
+    retention: ClassVar[RetentionConfig] = RetentionConfig()  # type: ignore[call-arg]
+    export: ClassVar[ExportConfig] = ExportConfig()  # type: ignore[call-arg]
 
 
 config = Config()
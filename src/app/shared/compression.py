@@ -0,0 +1,54 @@
+"""Content coding negotiation and compression."""
+
+from __future__ import annotations
+
+import gzip
+from contextlib import suppress
+from functools import partial
+from typing import TYPE_CHECKING
+
+import brotli
+import zstandard
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Codings for dynamic responses, most preferred first. Levels favour
+# speed, responses are compressed as they are sent.
+COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "zstd": partial(zstandard.compress, level=3),
+    "br": partial(brotli.compress, quality=5),
+    "gzip": partial(gzip.compress, compresslevel=6, mtime=0),
+}
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Content codings a client accepts, by its Accept-Encoding header."""
+    accepted = set()
+
+    for item in accept_encoding.lower().split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        quality = 1.0
+
+        for param in params:
+            name, _, value = param.partition("=")
+
+            if name.strip() == "q":
+                with suppress(ValueError):
+                    quality = float(value)
+
+        if coding and quality > 0:
+            accepted.add(coding)
+
+    return accepted
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """Preferred coding a client accepts, ``None`` for no compression."""
+    accepted = accepted_encodings(accept_encoding)
+    return next((coding for coding in COMPRESSORS if coding in accepted), None)
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress data with a coding of ``COMPRESSORS``."""
+    return COMPRESSORS[encoding](data)
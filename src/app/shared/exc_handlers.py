@@ -8,27 +8,27 @@ from dependency_injector.wiring import Provide, inject
 from fastapi import Request, Response, status
 from fastapi.exceptions import HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse
-from slowapi.errors import RateLimitExceeded
 
 from app.container import Container
+from app.services.ratelimit.limiter import RateLimitExceeded
 
 if TYPE_CHECKING:
-    from fastapi.templating import Jinja2Templates
+    from app.shared.templating import PageCache
 
 
 @inject
 async def not_found_handler(
     request: Request,
     exc: Exception,
-    jinja: Jinja2Templates = Provide[Container.jinja],
+    pages: PageCache = Provide[Container.pages],
 ) -> HTMLResponse | JSONResponse:
     """Global 404 handler for API and web pages."""
     path = request.url.path
 
     if not path.startswith("/api"):
-        return jinja.TemplateResponse(
+        return pages.render(
+            request,
             "404.html",
-            {"request": request},
             status_code=status.HTTP_404_NOT_FOUND,
         )
 
@@ -52,6 +52,7 @@ async def rate_limit_exception_handler(
                 "error": "Too many requests",
                 "detail": f"Rate limit exceeded: {exc.detail}",
             },
+            headers=exc.headers,
         )
 
     return JSONResponse(
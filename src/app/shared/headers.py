@@ -1,15 +1,19 @@
 """Server headers."""
 
+import secrets
 from typing import Final
 
-from app.shared import config
-
 STATIC_SECURITY_HEADERS: Final[list[tuple[str, str]]] = [
     ("X-Content-Type-Options", "nosniff"),
     ("X-Frame-Options", "DENY"),
     ("Referrer-Policy", "strict-origin-when-cross-origin"),
     ("Permissions-Policy", "geolocation=(), microphone=(), camera=()"),
 ]
+HSTS_HEADER: Final[tuple[str, str]] = (
+    "Strict-Transport-Security",
+    "max-age=31536000; includeSubDomains; preload",
+)
+CSP_HEADER: Final = b"content-security-policy"
 
 
 def _build_csp_policy(nonce: str, *, https: bool = False) -> str:
@@ -35,21 +39,33 @@ def _build_csp_policy(nonce: str, *, https: bool = False) -> str:
     return "; ".join(directives) + ";"
 
 
-def get_secure_headers(nonce: str) -> list[tuple[str, str]]:
-    """Get secure headers with CSP nonce."""
-    https = config.app.https
-    headers = list(STATIC_SECURITY_HEADERS)
+class SecureHeaders:
+    """Security headers of HTML responses, encoded once.
 
-    headers.append(
-        ("Content-Security-Policy", _build_csp_policy(nonce, https=https)),
-    )
+    Only the CSP nonce differs between responses, so the policy is kept
+    split around it and each response joins its nonce in.
+    """
 
-    if https:
-        headers.append(
-            (
-                "Strict-Transport-Security",
-                "max-age=31536000; includeSubDomains; preload",
-            ),
-        )
-
-    return headers
+    def __init__(self, *, https: bool) -> None:
+        """Initialize the secure headers."""
+        headers = list(STATIC_SECURITY_HEADERS)
+
+        if https:
+            headers.append(HSTS_HEADER)
+
+        self._static = [
+            (key.lower().encode("latin-1"), value.encode("latin-1"))
+            for key, value in headers
+        ]
+        self.names = frozenset(key for key, _ in self._static) | {CSP_HEADER}
+
+        slot = secrets.token_hex(16)
+        policy = _build_csp_policy(slot, https=https).encode()
+        self._csp_head, _, self._csp_tail = policy.partition(slot.encode())
+
+    def raw(self, nonce: str) -> list[tuple[bytes, bytes]]:
+        """Raw header pairs with the CSP nonce in place."""
+        return [
+            *self._static,
+            (CSP_HEADER, self._csp_head + nonce.encode() + self._csp_tail),
+        ]
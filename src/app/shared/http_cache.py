@@ -0,0 +1,77 @@
+"""HTTP caching utilities."""
+
+from fastapi import HTTPException, Request, Response, status
+
+from app.shared import config
+
+# Pages carrying a per-response CSP nonce must not be shared between
+# clients, browsers revalidate them instead
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether If-None-Match matches the given ETag.
+
+    Uses the weak comparison required for If-None-Match.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cache_headers(etag: str, *, private: bool = False) -> dict[str, str]:
+    """Build validator and cache headers for public status responses.
+
+    Any of them may be sent compressed, 304 responses included, so caches
+    keep a copy per accepted encoding.
+    """
+    return {
+        "ETag": etag,
+        "Cache-Control": (
+            PRIVATE_CACHE_CONTROL
+            if private
+            else config.cache.public_cache_control
+        ),
+        "Vary": "Accept-Encoding",
+    }
+
+
+def not_modified(etag: str, *, private: bool = False) -> Response:
+    """Build a 304 Not Modified response."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=cache_headers(etag, private=private),
+    )
+
+
+def version_etag(version: int) -> str:
+    """Build the strong ETag of a versioned admin resource."""
+    return f'"{version}"'
+
+
+def if_match_version(request: Request) -> int | None:
+    """Read the version required by If-Match, ``None`` if any will do.
+
+    Only a single ETag built by ``version_etag`` can match a version,
+    other values fail the precondition.
+    """
+    if_match = request.headers.get("if-match", "").strip()
+    if not if_match or if_match == "*":
+        return None
+
+    version = if_match.removeprefix('"').removesuffix('"')
+    if f'"{version}"' != if_match or not version.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="If-Match must be the ETag of the resource",
+        )
+
+    return int(version)
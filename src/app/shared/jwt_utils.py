@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 
 from jwt import (
@@ -44,3 +47,49 @@ def verify_auth_token(token: str) -> dict:
         config.jwt.secret,
         algorithms=[config.jwt.algorithm],
     )
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified tokens, kept by digest until they expire.
+
+    A cookie is verified once, later requests carrying it cost a single
+    lookup.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize the verified token cache."""
+        self._max_entries = max_entries
+        self._expiries: OrderedDict[bytes, float] = OrderedDict()
+
+    def __contains__(self, token: str) -> bool:
+        """Check whether a token was verified and has not expired yet."""
+        digest = self._digest(token)
+        expires_at = self._expiries.get(digest)
+
+        if expires_at is None:
+            return False
+
+        if expires_at <= time.time():
+            del self._expiries[digest]
+            return False
+
+        self._expiries.move_to_end(digest)
+        return True
+
+    def add(self, token: str, expires_at: float) -> None:
+        """Remember a verified token until its expiry."""
+        digest = self._digest(token)
+        self._expiries[digest] = expires_at
+        self._expiries.move_to_end(digest)
+
+        if len(self._expiries) > self._max_entries:
+            self._expiries.popitem(last=False)
+
+    def discard(self, token: str) -> None:
+        """Forget a token, it is verified again when it comes back."""
+        self._expiries.pop(self._digest(token), None)
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        """Digest a token, so the cache keeps no usable credentials."""
+        return hashlib.sha256(token.encode()).digest()
@@ -1,5 +1,6 @@
 """Shared middlewares."""
 
 from .authentication import BaseAuthMiddleware
+from .compression import CompressionMiddleware
 
-__all__ = ["BaseAuthMiddleware"]
+__all__ = ["BaseAuthMiddleware", "CompressionMiddleware"]
@@ -4,38 +4,83 @@ from __future__ import annotations
 
 import logging
 from abc import abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
+from dependency_injector.wiring import Provide, inject
 from jwt.exceptions import (
     DecodeError,
     ExpiredSignatureError,
     InvalidTokenError,
 )
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import HTTPConnection
 
+from app.container import Container
 from app.shared.jwt_utils import verify_auth_token
 
 if TYPE_CHECKING:
-    from fastapi import Request
-    from starlette.types import ASGIApp
+    from starlette.responses import Response
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+    from app.shared.jwt_utils import VerifiedTokenCache
 
 logger = logging.getLogger(__name__)
 
 
-class BaseAuthMiddleware(BaseHTTPMiddleware):
-    """Base authentication middleware."""
+class BaseAuthMiddleware:
+    """Base ASGI authentication middleware."""
+
+    AUTH_INCLUDE_PATHS: ClassVar[tuple[str, ...]] = ()
+    AUTH_EXCLUDE_PATHS: ClassVar[tuple[str, ...]] = ()
 
-    def __init__(self, app: ASGIApp) -> None:
+    @inject
+    def __init__(
+        self,
+        app: ASGIApp,
+        verified_tokens: VerifiedTokenCache = Provide[
+            Container.verified_tokens
+        ],
+    ) -> None:
         """Initialize authentication middleware."""
-        super().__init__(app)
+        self.app = app
+        self._verified_tokens = verified_tokens
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Process ASGI request."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or not self._should_authenticate(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._verify_token(HTTPConnection(scope)):
+            await self._unauthorized()(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    def _should_authenticate(self, path: str) -> bool:
+        """Check if path requires authentication."""
+        return path.startswith(self.AUTH_INCLUDE_PATHS) and not (
+            path.startswith(self.AUTH_EXCLUDE_PATHS)
+        )
 
-    def _verify_token(self, request: Request) -> bool:
+    def _verify_token(self, connection: HTTPConnection) -> bool:
         """Verify and extract token data."""
-        token = request.cookies.get("token")
+        token = connection.cookies.get("token")
         if not token:
-            logger.debug("Missing token for %s", request.url.path)
+            logger.debug("Missing token for %s", connection.url.path)
             return False
 
+        if token in self._verified_tokens:
+            return True
+
         try:
             data = verify_auth_token(token)
         except (ExpiredSignatureError, DecodeError, InvalidTokenError) as e:
@@ -47,9 +92,13 @@ class BaseAuthMiddleware(BaseHTTPMiddleware):
             logger.debug("Invalid or missing user_id in token for path: %s")
             return False
 
+        expires_at = data.get("exp")
+        if isinstance(expires_at, int | float):
+            self._verified_tokens.add(token, expires_at)
+
         return True
 
     @abstractmethod
-    def _should_authenticate(self, path: str) -> bool:
-        """Check if path requires authentication."""
+    def _unauthorized(self) -> Response:
+        """Build the response for an unauthenticated request."""
         raise NotImplementedError
@@ -0,0 +1,107 @@
+"""Response compression middleware."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.shared.compression import compress, negotiate
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing response bodies a client accepts.
+
+    Only bodies sent in one message are compressed, so streamed responses
+    such as the status stream and files pass as they are. So do responses
+    already encoded by their endpoint.
+    """
+
+    COMPRESSIBLE_TYPES: ClassVar[tuple[str, ...]] = (
+        "application/javascript",
+        "application/json",
+        "image/svg+xml",
+        "text/",
+    )
+
+    def __init__(self, app: ASGIApp, minimum_size: int) -> None:
+        """Initialize compression middleware."""
+        self.app = app
+        self._minimum_size = minimum_size
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Process ASGI request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(
+            Headers(scope=scope).get("accept-encoding", ""),
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+
+        async def send_compressed(message: Message) -> None:
+            """Hold the response start until the body shows its size."""
+            nonlocal start
+
+            if message["type"] == "http.response.start":
+                start = message
+                return
+
+            if start is None:
+                await send(message)
+                return
+
+            response_start, start = start, None
+            body = message.get("body", b"")
+
+            if (
+                message["type"] != "http.response.body"
+                or message.get("more_body", False)
+                or not self._is_compressible(response_start, body)
+            ):
+                await send(response_start)
+                await send(message)
+                return
+
+            body = compress(body, encoding)
+            headers = MutableHeaders(scope=response_start)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+
+            if "accept-encoding" not in headers.get("vary", "").lower():
+                headers.add_vary_header("Accept-Encoding")
+
+            # The compressed bytes differ from what a strong ETag names,
+            # a weak one still matches If-None-Match
+            etag = headers.get("etag")
+            if etag is not None and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+
+            await send(response_start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _is_compressible(self, start: Message, body: bytes) -> bool:
+        """Check whether a complete response body is worth compressing."""
+        headers = Headers(raw=start["headers"])
+        content_type = headers.get("content-type", "").lower()
+
+        return (
+            len(body) >= self._minimum_size
+            and "content-encoding" not in headers
+            and content_type.startswith(self.COMPRESSIBLE_TYPES)
+        )
@@ -0,0 +1,123 @@
+"""Static files with fingerprinted, precompressed assets."""
+
+from __future__ import annotations
+
+import json
+import mimetypes
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse
+
+from app.shared.compression import accepted_encodings
+
+if TYPE_CHECKING:
+    import os
+
+    from starlette.responses import Response
+    from starlette.types import Scope
+
+# Content-named assets, written by scripts/fingerprint-assets.mjs
+DIST_DIR = "dist"
+MANIFEST = "manifest.json"
+
+# Precompressed variants of an asset, most preferred first
+VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def load_asset_manifest(directory: Path) -> dict[str, str]:
+    """Load the content-named path of each asset.
+
+    Without a fingerprinting build, assets are served by their own names.
+    """
+    path = directory / DIST_DIR / MANIFEST
+
+    if not path.is_file():
+        return {}
+
+    return json.loads(path.read_text())
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """Static files serving content-named assets as immutable.
+
+    Assets under the dist directory never change, so caches may keep them
+    forever, and are sent precompressed when the client accepts it.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the static files."""
+        super().__init__(directory=directory)
+        self._dist_dir = directory.resolve() / DIST_DIR
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Serve a file, content-named assets possibly precompressed."""
+        path = Path(full_path)
+
+        if not path.is_relative_to(self._dist_dir):
+            return super().file_response(
+                full_path,
+                stat_result,
+                scope,
+                status_code,
+            )
+
+        request_headers = Headers(scope=scope)
+        accepted = accepted_encodings(
+            request_headers.get("accept-encoding", ""),
+        )
+        response = self._variant_response(path, accepted, status_code)
+
+        if response is None:
+            response = FileResponse(
+                path,
+                status_code=status_code,
+                stat_result=stat_result,
+            )
+
+        response.headers["Cache-Control"] = IMMUTABLE
+        response.headers["Vary"] = "Accept-Encoding"
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+
+        return response
+
+    def _variant_response(
+        self,
+        path: Path,
+        accepted: set[str],
+        status_code: int,
+    ) -> FileResponse | None:
+        """Serve the preferred precompressed variant the client accepts."""
+        for encoding, suffix in VARIANTS:
+            if encoding not in accepted:
+                continue
+
+            variant = path.with_name(path.name + suffix)
+
+            try:
+                stat_result = variant.stat()
+
+            except FileNotFoundError:
+                continue
+
+            return FileResponse(
+                variant,
+                status_code=status_code,
+                stat_result=stat_result,
+                media_type=mimetypes.guess_type(path.name)[0],
+                headers={"Content-Encoding": encoding},
+            )
+
+        return None
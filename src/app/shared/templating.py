@@ -0,0 +1,232 @@
+"""Template loading and rendered page cache."""
+
+from __future__ import annotations
+
+import re
+import secrets
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from fastapi.responses import HTMLResponse
+from fastapi.templating import Jinja2Templates
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    pass_context,
+)
+from markupsafe import Markup
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping
+    from pathlib import Path
+
+    from fastapi import Request
+    from jinja2.runtime import Context
+
+_COMMENT = re.compile(r"<!--(?!\[).*?-->", re.DOTALL)
+_BETWEEN_TAGS = re.compile(r">\s*\n\s*<")
+_LINE_BREAK = re.compile(r"\s*\n\s*")
+
+# Request state read by the templates, see the frontend ContextMiddleware
+STATE_KEYS = ("theme", "organization_name", "admin_path")
+
+
+def minify(source: str) -> str:
+    """Drop HTML comments and the line breaks of a template source.
+
+    Whitespace between tags on different lines is removed, any other line
+    break with its indentation becomes a single space. The templates have
+    no inline code or preformatted text where that would matter.
+    """
+    source = _COMMENT.sub("", source)
+    source = _BETWEEN_TAGS.sub("><", source)
+    return _LINE_BREAK.sub(" ", source).strip()
+
+
+class MinifyingLoader(BaseLoader):
+    """Loader minifying template sources once, when they are loaded."""
+
+    def __init__(self, loader: BaseLoader) -> None:
+        """Initialize the minifying loader."""
+        self._loader = loader
+
+    def get_source(
+        self,
+        environment: Environment,
+        template: str,
+    ) -> tuple[str, str | None, Callable[[], bool] | None]:
+        """Get the minified source of a template."""
+        source, filename, uptodate = self._loader.get_source(
+            environment,
+            template,
+        )
+        return minify(source), filename, uptodate
+
+    def list_templates(self) -> list[str]:
+        """List the templates of the wrapped loader."""
+        return self._loader.list_templates()
+
+
+def json_script(data: bytes) -> bytes:
+    """Escape JSON for a script element, which only a closing tag ends."""
+    return data.replace(b"<", rb"\u003c")
+
+
+def create_templates(
+    directory: Path,
+    assets: Mapping[str, str],
+    bytecode_dir: Path | None = None,
+    *,
+    auto_reload: bool = True,
+) -> Jinja2Templates:
+    """Create templates loaded through the minifying loader.
+
+    Static URLs point at the content-named copy of an asset, if any.
+    Compiled templates are kept in ``bytecode_dir``, so a restart loads
+    them without parsing their sources again.
+    """
+    bytecode_cache = None
+
+    if bytecode_dir is not None:
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_dir))
+
+    env = Environment(
+        loader=MinifyingLoader(FileSystemLoader(directory)),
+        autoescape=True,
+        auto_reload=auto_reload,
+        bytecode_cache=bytecode_cache,
+    )
+
+    @pass_context
+    def url_for(context: Context, name: str, /, **path_params: str) -> str:
+        """Path of a route, with static assets through their manifest.
+
+        Paths are absolute but carry no origin, so rendered pages do not
+        depend on the Host header the request came with.
+        """
+        if name == "static":
+            path = path_params["path"]
+            path_params["path"] = assets.get(path, path)
+
+        return context["request"].url_for(name, **path_params).path
+
+    env.globals["url_for"] = url_for
+    return Jinja2Templates(env=env)
+
+
+def preload_templates(templates: Jinja2Templates) -> int:
+    """Compile every template ahead of the first request that renders it.
+
+    Returns the number of templates loaded.
+    """
+    names = templates.env.list_templates(extensions=["html"])
+
+    for name in names:
+        templates.get_template(name)
+
+    return len(names)
+
+
+class PageCache:
+    """Bounded cache of rendered pages.
+
+    Pages depend on the request only through its root path, the context
+    state and the CSP nonce, not on the Host header any client could vary
+    to fill the cache. They are rendered once with slots in place of the
+    nonce and any per-response values, each response splices its own
+    values in.
+    """
+
+    def __init__(self, templates: Jinja2Templates, max_entries: int) -> None:
+        """Initialize the page cache."""
+        self._templates = templates
+        self._max_entries = max_entries
+        self._slot = f"slot-{secrets.token_hex(16)}"
+        self._slot_pattern = re.compile(rf"{self._slot}:(\w+);".encode())
+        self._pages: OrderedDict[Hashable, list[bytes]] = OrderedDict()
+
+    def render(  # noqa: PLR0913
+        self,
+        request: Request,
+        name: str,
+        context: Mapping[str, Hashable] | None = None,
+        *,
+        slots: Mapping[str, bytes] | None = None,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> HTMLResponse:
+        """Render a template, reusing an earlier rendering of it.
+
+        Each of ``slots`` is passed to the template as a placeholder,
+        which is replaced with the raw value in the response.
+        """
+        context = context or {}
+        slots = slots or {}
+        key = (
+            name,
+            request.scope.get("root_path", ""),
+            *(getattr(request.state, key, None) for key in STATE_KEYS),
+            *sorted(context.items()),
+            tuple(sorted(slots)),
+        )
+
+        parts = self._pages.get(key)
+        if parts is None:
+            parts = self._render(request, name, context, slots)
+            self._pages[key] = parts
+
+            if len(self._pages) > self._max_entries:
+                self._pages.popitem(last=False)
+
+        else:
+            self._pages.move_to_end(key)
+
+        values = {
+            **slots,
+            "csp_nonce": (
+                getattr(request.state, "csp_nonce", None) or ""
+            ).encode(),
+        }
+
+        # Split parts alternate between markup and slot names
+        return HTMLResponse(
+            content=b"".join(
+                values[part.decode()] if index % 2 else part
+                for index, part in enumerate(parts)
+            ),
+            status_code=status_code,
+            headers=headers,
+        )
+
+    def _render(
+        self,
+        request: Request,
+        name: str,
+        context: Mapping[str, Hashable],
+        slots: Mapping[str, bytes],
+    ) -> list[bytes]:
+        """Render a template split around its slots."""
+        nonce = getattr(request.state, "csp_nonce", None)
+        request.state.csp_nonce = self._placeholder("csp_nonce")
+
+        try:
+            html = self._templates.get_template(name).render(
+                {
+                    **context,
+                    **{slot: self._placeholder(slot) for slot in slots},
+                    "request": request,
+                },
+            )
+
+        finally:
+            request.state.csp_nonce = nonce
+
+        return self._slot_pattern.split(html.encode())
+
+    def _placeholder(self, slot: str) -> Markup:
+        """Build the placeholder of a slot, left unescaped by templates."""
+        # Made of a random token and a slot name of the code, no user input
+        return Markup(f"{self._slot}:{slot};")  # noqa: S704 # nosec B704